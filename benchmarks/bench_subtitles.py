@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark subtitle translation against the local stand-in server
+
+Generates a seeded SRT file where many lines repeat (as in real subtitles),
+translates it cold and then warm (from a throwaway persistent cache), and
+checks that numbering and timing are unchanged:
+    python benchmarks/bench_subtitles.py --cues 10000 --unique-lines 3000 --latency 20 --seed 1
+"""
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.backends import LocalBackend, StandInServer
+from src.core.subtitles import translate_subtitles
+from src.core.translation_cache import PersistentTranslationCache
+from src.core.translator import TranslationEngine
+
+WORDS = (
+    "yes no what where why come here go now please wait stop I you we they know think "
+    "this that is was not okay right sorry thank the a it me him her let us see look"
+).split()
+
+def format_timestamp(ms: int) -> str:
+    """Format milliseconds as an SRT timestamp"""
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d},{ms % 1000:03d}"
+
+def generate_srt(cues: int, unique_lines: int, seed: int) -> str:
+    """Build an SRT file whose cue lines are drawn from a limited set of phrases"""
+    rng = random.Random(seed)
+    phrases = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8))).capitalize() + rng.choice(".?!")
+               for _ in range(unique_lines)]
+    blocks = []
+    for number in range(1, cues + 1):
+        start = number * 2500
+        lines = [rng.choice(phrases[:max(1, unique_lines // 10)] if rng.random() < 0.5 else phrases)]
+        if rng.random() < 0.3:
+            lines.append(rng.choice(phrases))
+        blocks.append(f"{number}\n{format_timestamp(start)} --> {format_timestamp(start + 2000)}\n" + "\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+def cue_headers(content: str):
+    """Get cue numbers and timing lines"""
+    return re.findall(r"^(\d+)\n(\S+ --> \S+)$", content, re.MULTILINE)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark subtitle translation against a local stand-in server")
+    parser.add_argument("--cues", type=int, default=10000)
+    parser.add_argument("--unique-lines", type=int, default=3000, help="distinct phrases the cues are drawn from")
+    parser.add_argument("--latency", type=float, default=20.0, help="server base latency in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="server max extra latency in ms")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    server = StandInServer(latency_ms=args.latency, jitter_ms=args.jitter, seed=args.seed).start()
+    engine = TranslationEngine(backend=LocalBackend(server.url))
+    cache_dir = tempfile.TemporaryDirectory()
+    engine.disk_cache = PersistentTranslationCache(Path(cache_dir.name) / "cache.db")
+    content = generate_srt(args.cues, args.unique_lines, args.seed)
+
+    try:
+        for label in ("cold", "warm"):
+            requests_before = server.requests_served
+            start = time.perf_counter()
+            translated, stats = translate_subtitles(content, "en", "tr", engine=engine)
+            elapsed = time.perf_counter() - start
+            assert cue_headers(translated) == cue_headers(content), "cue numbering or timing changed"
+            print(
+                f"{label}: {stats['cues']} cues, {stats['texts']} texts, {stats['unique']} unique, "
+                f"{server.requests_served - requests_before} backend calls, {stats['failed']} failed, "
+                f"{elapsed * 1000:.0f} ms ({stats['cues'] / elapsed:.0f} cues/s)"
+            )
+    finally:
+        engine.shutdown()
+        cache_dir.cleanup()
+        server.stop()
+
+if __name__ == "__main__":
+    main()
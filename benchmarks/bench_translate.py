@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark the TranslationEngine.translate path against the local stand-in server
+
+Runs fully offline and reproducibly (seeded latency and failures):
+    python benchmarks/bench_translate.py --requests 2000 --concurrency 8 --latency 20 --jitter 10 --error-rate 0.01 --seed 1
+
+--mode threads calls the blocking translate() from a thread pool, --mode async
+awaits translate_async() directly with the same concurrency limit.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.backends import LocalBackend, StandInServer
+from src.core.translator import TranslationEngine
+
+def percentile(sorted_values, fraction):
+    """Get percentile from sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the translate path against a local stand-in server")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--unique", type=int, default=None, help="distinct phrases (default: all unique, no cache hits)")
+    parser.add_argument("--latency", type=float, default=20.0, help="server base latency in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="server max extra latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mode", choices=["threads", "async"], default="threads")
+    args = parser.parse_args()
+
+    server = StandInServer(latency_ms=args.latency, jitter_ms=args.jitter, error_rate=args.error_rate, seed=args.seed).start()
+    backend = LocalBackend(server.url)
+    engine = TranslationEngine(backend=backend)
+    unique = args.unique or args.requests
+    texts = [f"benchmark phrase number {i % unique}" for i in range(args.requests)]
+
+    def timed_translate(text):
+        start = time.perf_counter()
+        _, _, success = engine.translate(text, "auto", "tr")
+        return time.perf_counter() - start, success
+
+    async def run_async():
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def timed_translate_async(text):
+            async with semaphore:
+                start = time.perf_counter()
+                _, _, success = await engine.translate_async(text, "auto", "tr")
+                return time.perf_counter() - start, success
+
+        return await asyncio.gather(*(timed_translate_async(text) for text in texts))
+
+    started = time.perf_counter()
+    if args.mode == "async":
+        results = asyncio.run(run_async())
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(timed_translate, texts))
+    elapsed = time.perf_counter() - started
+    server.stop()
+    engine.shutdown()
+
+    latencies = sorted(latency * 1000 for latency, _ in results)
+    failures = sum(1 for _, success in results if not success)
+    cache = engine.get_cache_stats()["memory"]
+    print(f"requests:    {args.requests} (concurrency {args.concurrency}, {args.mode})")
+    print(f"elapsed:     {elapsed:.2f} s")
+    print(f"throughput:  {args.requests / elapsed:.1f} translations/s")
+    print(f"latency ms:  p50 {percentile(latencies, 0.50):.2f}  p95 {percentile(latencies, 0.95):.2f}  p99 {percentile(latencies, 0.99):.2f}  max {latencies[-1]:.2f}")
+    print(f"failures:    {failures}")
+    print(f"cache:       {cache['hits']} hits / {cache['misses']} misses")
+    print(f"server:      {server.requests_served} backend requests")
+    if backend._pool is not None:
+        print(f"connections: {backend._pool.connections_opened} opened")
+
+if __name__ == "__main__":
+    main()
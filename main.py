@@ -12,12 +12,16 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from src.app import TranfasticApp
-
 def main():
     """Main entry point"""
+    # Headless command line mode, must not import PyQt5
+    if len(sys.argv) > 1 and sys.argv[1] == "translate":
+        from src.cli import main as cli_main
+        return cli_main(sys.argv[1:])
+    
     try:
         # Create and run application
+        from src.app import TranfasticApp
         app = TranfasticApp()
         return app.run()
         
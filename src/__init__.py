@@ -2,6 +2,6 @@
 # Version: 1.2
 # Author: Yusuf Emre Albayrak
 
-from core.startup_manager import startup_manager
+from .core.startup_manager import startup_manager
 
 __all__ = ['startup_manager'] 
\ No newline at end of file
@@ -6,15 +6,20 @@ Main application class and logic
 
 import sys
 import os
+import time
 from pathlib import Path
 
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QFontDatabase, QFont, QIcon
 
 from src.utils.config import Config, APP_ICON_PATH, APP_TEXT_FONT_PATH, APP_SYMBOL_FONT_PATH
-from src.utils.logger import setup_logging, cleanup_old_logs
+from src.utils.logger import setup_logging, flush_logging
 from src.core.translator import translator_engine
+from src.core.health_monitor import health_monitor
+from src.core.history_writer import history_writer
+from src.core.history_store import history_store
+from src.core.translation_memory import translation_memory
 from src.core.hotkey_manager import hotkey_manager
 from src.core.tray_manager import TrayManager
 from src.core.clipboard_manager import clipboard_manager
@@ -61,6 +66,10 @@ class TrayThread(QThread):
         if self.tray_manager:
             self.tray_manager.stop()
 
+class ConnectionStatusBridge(QObject):
+    """Forwards translation engine connection changes to the GUI thread"""
+    connection_changed = pyqtSignal(bool)
+
 class TranfasticApp:
     """Main application class"""
     
@@ -73,12 +82,9 @@ class TranfasticApp:
         icon_path = str((Path(__file__).parent.parent / APP_ICON_PATH).resolve())
         self.app.setWindowIcon(QIcon(icon_path))
         
-        # Setup logging
+        # Setup logging (old logs are compressed and cleaned up in the background)
         self.logger = setup_logging()
         
-        # Cleanup old logs
-        cleanup_old_logs()
-        
         # Initialize components
         self.config = Config()
         self.tray_thread = None
@@ -97,6 +103,21 @@ class TranfasticApp:
             self.logger.info(f"Executable path: {sys.executable}")
             self.logger.info(f"Script path: {sys.argv[0]}")
             
+            # Apply translation cache settings
+            translator_engine.configure(self.config)
+            
+            # Open caches and monitor connection in background, publish status to UI
+            self.connection_bridge = ConnectionStatusBridge()
+            self.connection_bridge.connection_changed.connect(self.on_connection_changed, Qt.QueuedConnection)
+            translator_engine.add_connection_listener(self.connection_bridge.connection_changed.emit)
+            translator_engine.start_background_init()
+            health_monitor.start()
+            
+            # Index translation history for instant fuzzy matches
+            if self.config.get("translation_memory", True):
+                translation_memory.min_similarity = self.config.get("memory_min_similarity", 0.7)
+                translation_memory.start_background_load()
+            
             # Setup hotkey manager
             self.logger.info("Setting up hotkey manager...")
             hotkey_manager.set_callback(self.show_translation_window)
@@ -120,6 +141,13 @@ class TranfasticApp:
             # Setup clipboard manager
             clipboard_manager.app = self.app
             
+            # Build translation window once, it is hidden and reused between hotkeys
+            self.translation_window = TranslationWindow(
+                config=self.config,
+                on_translation_complete=self.handle_translation_complete
+            )
+            self.translation_window.winId()  # Create native window ahead of first show
+            
             # Setup auto-updater (only for installed versions)
             if should_enable_auto_update():
                 self.logger.info("Setting up auto-updater...")
@@ -143,12 +171,16 @@ class TranfasticApp:
     
     def show_translation_window(self):
         """Show translation window"""
+        requested_at = time.perf_counter()
         try:
-            if self.translation_window is None or not self.translation_window.isVisible():
+            if self.translation_window is None:
                 self.translation_window = TranslationWindow(
                     config=self.config,
                     on_translation_complete=self.handle_translation_complete
                 )
+            
+            if not self.translation_window.isVisible():
+                self.translation_window.prepare_for_show(requested_at)
                 self.translation_window.show()
                 self.translation_window.raise_()
                 self.translation_window.activateWindow()
@@ -204,6 +236,12 @@ class TranfasticApp:
         except Exception as e:
             self.logger.error(f"Failed to handle translation completion: {e}")
     
+    def on_connection_changed(self, connected: bool):
+        """Handle translation service connection status changes"""
+        self.logger.info(f"Translation service {'connected' if connected else 'disconnected'}")
+        if self.translation_window:
+            self.translation_window.update_title()
+    
     def on_settings_changed(self):
         """Handle settings changes"""
         try:
@@ -245,6 +283,13 @@ class TranfasticApp:
             if hotkey_manager:
                 hotkey_manager.cleanup()
             
+            health_monitor.stop()
+            translator_engine.shutdown()
+            history_writer.close()
+            history_store.close()
+            self.config.flush()
+            flush_logging()
+            
             if self.tray_thread:
                 self.tray_thread.stop()
                 self.tray_thread.quit()
@@ -0,0 +1,204 @@
+"""
+Tranfastic Command Line Module
+Headless batch translation of files or stdin, line by line
+
+    python main.py translate notes.txt -t de > notes.de.txt
+    cat phrases.txt | python main.py translate -s en -t tr -j 8
+    python main.py translate huge.log -t en -o huge.en.log    (resumable)
+    python main.py translate movie.srt -t tr -o movie.tr.srt  (resumable, cue text only)
+
+Uses the same engine, caches, glossary and backends as the tray app, and
+never imports PyQt5.
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .core.event_loop import event_loop
+from .core.file_pipeline import FileTranslationError, FileTranslationJob, split_line
+from .core.subtitles import SubtitleTranslationJob, is_subtitle_file
+from .core.translator import translator_engine
+from .utils.config import Config
+from .utils.logger import setup_logging
+
+# Lines translated per engine call; smaller chunks stream output sooner
+DEFAULT_CHUNK_LINES = 16
+
+# Chunks (and so backend calls) in flight at once
+DEFAULT_CONCURRENCY = 4
+
+# Batch jobs wait for rate-limit tokens instead of failing fast like the popup
+RATE_LIMIT_MAX_WAIT = 10.0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(prog="tranfastic", description="Tranfastic - Instant Translator")
+    commands = parser.add_subparsers(dest="command", required=True)
+    translate = commands.add_parser("translate", help="translate files or stdin line by line")
+    translate.add_argument("inputs", nargs="*", help="input files (default: stdin, '-' also reads stdin)")
+    translate.add_argument("-s", "--source", help="source language code (default: source_language setting)")
+    translate.add_argument("-t", "--target", help="target language code (default: target_language setting)")
+    translate.add_argument("-o", "--output", help="output file (default: stdout)")
+    translate.add_argument("-j", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                           help=f"backend calls in flight (default: {DEFAULT_CONCURRENCY})")
+    translate.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES,
+                           help=f"lines per engine call (default: {DEFAULT_CHUNK_LINES})")
+    translate.add_argument("--backend", action="append", help="translation backend, repeat for failover (default: settings)")
+    translate.add_argument("--log-level", default="WARNING", help="log file level (default: WARNING)")
+    translate.add_argument("--restart", action="store_true", help="ignore the checkpoint of an interrupted file job")
+    translate.add_argument("-q", "--quiet", action="store_true", help="do not print the throughput summary")
+    return parser
+
+def read_lines(paths: List[str]) -> Iterator[str]:
+    """Yield lines (with line endings) of the input files, or stdin"""
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            yield from f
+
+def chunked(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group lines into lists of up to size lines"""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class TranslateCommand:
+    """Streams translated lines in input order while later chunks are in flight"""
+
+    def __init__(self, source_lang: str, target_lang: str, output: TextIO,
+                 concurrency: int = DEFAULT_CONCURRENCY, chunk_lines: int = DEFAULT_CHUNK_LINES):
+        """
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            output: Stream translated lines are written to
+            concurrency: Chunks in flight at once, each makes one backend call at a time
+            chunk_lines: Lines per engine call
+        """
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.output = output
+        self.concurrency = max(1, concurrency)
+        self.chunk_lines = max(1, chunk_lines)
+        self.lines = 0
+        self.chars = 0
+        self.failed = 0
+
+    def run(self, lines: Iterable[str]) -> float:
+        """
+        Translate lines and write them out in order
+
+        Returns:
+            Elapsed seconds
+        """
+        start = time.perf_counter()
+        in_flight: Deque[tuple] = deque()
+        try:
+            for chunk in chunked(lines, self.chunk_lines):
+                if len(in_flight) >= self.concurrency:
+                    self._write(*in_flight.popleft())
+                parts = [split_line(line) for line in chunk]
+                texts = [text for _, text, _ in parts]
+                future = event_loop.submit(translator_engine.translate_many_async(
+                    texts, self.source_lang, self.target_lang, max_concurrency=1
+                ))
+                in_flight.append((parts, future))
+            while in_flight:
+                self._write(*in_flight.popleft())
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+        return time.perf_counter() - start
+
+    def _write(self, parts: List[Tuple[str, str, str]], future):
+        """Wait for a chunk and write its lines (failed lines are written untranslated)"""
+        results = future.result()
+        for (leading, text, trailing), (translated_text, _, success) in zip(parts, results):
+            self.lines += 1
+            self.chars += len(text)
+            if text and not success:
+                self.failed += 1
+                translated_text = text
+            self.output.write(f"{leading}{translated_text}{trailing}")
+        self.output.flush()
+
+def run_translate(args: argparse.Namespace) -> int:
+    """Run the translate command"""
+    setup_logging(args.log_level, console=False)
+    config = Config()
+    settings = dict(config.config)
+    settings["rate_limit_max_wait"] = RATE_LIMIT_MAX_WAIT
+    if args.backend:
+        settings["translation_backends"] = args.backend
+    translator_engine.configure(settings)
+    translator_engine.start_background_init()
+    translator_engine.wait_until_initialized()
+
+    source_lang = args.source or config.get("source_language", "auto")
+    target_lang = args.target or config.get("target_language", "en")
+    # One input file to an output file runs as a resumable, checkpointed file job
+    # (subtitle files translating cue text only)
+    file_job = bool(args.output) and len(args.inputs) == 1 and args.inputs[0] != "-"
+    output: Optional[TextIO] = None
+    try:
+        if file_job:
+            job_class = SubtitleTranslationJob if is_subtitle_file(args.inputs[0]) else FileTranslationJob
+            job = job_class(args.inputs[0], args.output, source_lang, target_lang, args.concurrency)
+            show_progress = sys.stderr.isatty() and not args.quiet
+            stats = job.run(resume=not args.restart, on_progress=_print_progress if show_progress else None)
+            if show_progress:
+                print(file=sys.stderr)
+            lines, chars, failed, elapsed = stats["lines"], stats["chars"], stats["failed"], stats["elapsed"]
+            translated_bytes = stats["bytes"] - stats["resumed_at"]
+        else:
+            output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+            command = TranslateCommand(source_lang, target_lang, output, args.concurrency, args.chunk_lines)
+            elapsed = command.run(read_lines(args.inputs))
+            lines, chars, failed, translated_bytes = command.lines, command.chars, command.failed, None
+    except KeyboardInterrupt:
+        print("\nInterrupted" + (", run the same command again to resume" if file_job else ""), file=sys.stderr)
+        return 130
+    except FileTranslationError as e:
+        print(f"\ntranfastic: {e}, run the same command again to resume", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"tranfastic: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+        translator_engine.shutdown()
+
+    if not args.quiet:
+        stats = translator_engine.get_cache_stats()
+        seconds = elapsed or float("inf")
+        rate = f"{translated_bytes / seconds / 1024:.1f} KiB/s" if translated_bytes is not None else f"{lines / seconds:.1f} lines/s"
+        print(
+            f"Translated {lines} lines ({chars} chars) in {elapsed:.2f}s: "
+            f"{rate}, {chars / seconds:.0f} chars/s, "
+            f"{failed} failed, {stats['memory'].get('hits', 0)} cache hits, "
+            f"{stats['round_trips_saved']} already in {target_lang}",
+            file=sys.stderr
+        )
+    return 1 if failed else 0
+
+def _print_progress(done: int, total: int):
+    """Show file job progress on one stderr line"""
+    print(f"\r{done / total:6.1%} of {total / 1048576:.1f} MiB", end="", file=sys.stderr, flush=True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    args = build_parser().parse_args(argv)
+    if args.command == "translate":
+        return run_translate(args)
+    return 2
@@ -0,0 +1,67 @@
+# Translation backends for Tranfastic
+
+from typing import Dict, Optional, Sequence
+
+from .base import BackendError, BackendResult, TranslationBackend
+from .dispatcher import HedgedDispatcher, LatencyHistogram
+from .google import GoogleBackend
+from .local import LocalBackend, StandInServer
+from .resilience import BackendUnavailableError, CircuitBreaker, GuardedBackend, RateLimitedError, TokenBucket
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    LocalBackend.name: LocalBackend,
+}
+
+def create_backend(name: str, **options) -> TranslationBackend:
+    """
+    Create backend by name
+    
+    Args:
+        name: Backend name ("google", "local")
+        **options: Backend constructor arguments
+    """
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown translation backend: {name}")
+    return backend_class(**options)
+
+def create_backend_chain(names: Sequence[str], options: Optional[Dict[str, dict]] = None,
+                         rate_limit: Optional[float] = None, burst: float = 10,
+                         failure_threshold: int = 5, rate_limit_max_wait: float = 0.25) -> TranslationBackend:
+    """
+    Create a single backend, or a hedging dispatcher over several
+    
+    Every backend is guarded by its own circuit breaker and, if rate_limit
+    is set, its own token bucket.
+    
+    Args:
+        names: Backend names in preferred order
+        options: Constructor arguments per backend name
+        rate_limit: Requests per second allowed per backend (None for unlimited)
+        burst: Token bucket capacity
+        failure_threshold: Consecutive failures that open a backend's circuit
+        rate_limit_max_wait: Seconds a request waits for a rate-limit token before failing fast
+    """
+    options = options or {}
+    backends = [
+        GuardedBackend(
+            create_backend(name, **options.get(name, {})),
+            breaker=CircuitBreaker(failure_threshold=failure_threshold),
+            limiter=TokenBucket(rate_limit, burst) if rate_limit else None,
+            max_wait=rate_limit_max_wait
+        )
+        for name in names
+    ]
+    if len(backends) == 1:
+        return backends[0]
+    return HedgedDispatcher(backends)
+
+__all__ = [
+    'BackendError', 'BackendResult', 'TranslationBackend',
+    'GoogleBackend', 'LocalBackend', 'StandInServer',
+    'HedgedDispatcher', 'LatencyHistogram',
+    'BackendUnavailableError', 'CircuitBreaker', 'GuardedBackend', 'RateLimitedError', 'TokenBucket',
+    'BACKENDS', 'create_backend', 'create_backend_chain',
+]
@@ -0,0 +1,86 @@
+"""
+Tranfastic Translation Backend Base Module
+Interface implemented by all translation backends
+"""
+
+import asyncio
+from typing import List, Optional, Sequence, Tuple
+
+# (translated_text, detected_source_language)
+BackendResult = Tuple[str, Optional[str]]
+
+class BackendError(Exception):
+    """Raised when a backend cannot produce a translation"""
+
+class TranslationBackend:
+    """Base class for translation backends"""
+    
+    name = "backend"
+    
+    # Most texts and characters one translate_batch call may carry; backends
+    # without a native batch endpoint keep 1 so every text is its own call
+    max_batch_size = 1
+    max_batch_chars = 5000
+    
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """
+        Translate text
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code, "auto" to let the backend detect it
+            target_lang: Target language code
+            
+        Returns:
+            Tuple of (translated_text, detected_language)
+            
+        Raises:
+            BackendError: If the translation failed
+        """
+        raise NotImplementedError
+    
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """
+        Translate text without blocking the event loop
+        
+        Backends without a native async client run translate() on the
+        loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.translate, text, source_lang, target_lang)
+    
+    def translate_batch(self, texts: Sequence[str], source_lang: str = "auto",
+                        target_lang: str = "en") -> List[BackendResult]:
+        """
+        Translate several texts, results in input order
+        
+        Raises:
+            BackendError: If any translation failed
+        """
+        return [self.translate(text, source_lang, target_lang) for text in texts]
+    
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str = "auto",
+                                    target_lang: str = "en") -> List[BackendResult]:
+        """Translate several texts without blocking the event loop (one request per text by default)"""
+        return list(await asyncio.gather(*(self.translate_async(text, source_lang, target_lang) for text in texts)))
+    
+    @property
+    def available(self) -> bool:
+        """Check if the backend currently accepts requests"""
+        return True
+    
+    def detect(self, text: str) -> Optional[str]:
+        """Detect language of text, None if the backend cannot tell"""
+        return None
+    
+    async def detect_async(self, text: str) -> Optional[str]:
+        """Detect language of text without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.detect, text)
+    
+    def close(self):
+        """Release network resources"""
+        pass
+    
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
@@ -0,0 +1,277 @@
+"""
+Tranfastic Backend Dispatcher Module
+Hedged requests and failover across several translation backends
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from ..event_loop import event_loop
+from .base import BackendError, BackendResult, TranslationBackend
+from .resilience import BackendUnavailableError, RateLimitedError
+
+def _all_failed_error(errors: List[Tuple[str, Exception]]) -> BackendError:
+    """
+    Build the error raised when every backend failed
+
+    A BackendUnavailableError is raised only if no backend was even contacted
+    (all circuits open or rate limited), so callers can still fail fast and
+    fall back to stale cache entries. It is a RateLimitedError if any backend
+    was merely held back by its rate limiter, i.e. could still be reached.
+    """
+    message = "All translation backends failed: " + "; ".join(f"{name}: {error}" for name, error in errors)
+    if errors and all(isinstance(error, BackendUnavailableError) for _, error in errors):
+        if any(isinstance(error, RateLimitedError) for _, error in errors):
+            return RateLimitedError(message)
+        return BackendUnavailableError(message)
+    return BackendError(message)
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with exponential decay
+
+    Counts are halved every decay_every samples so percentiles follow the
+    backend's recent behaviour rather than its whole history.
+    """
+
+    # Bucket upper bounds in seconds: 1 ms .. ~60 s, 25% apart
+    BOUNDS = [0.001 * (1.25 ** i) for i in range(50)]
+
+    def __init__(self, decay_every: int = 200):
+        self.decay_every = decay_every
+        self._counts = [0.0] * (len(self.BOUNDS) + 1)
+        self._total = 0.0
+        self._samples = 0
+        self.failures = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, success: bool = True):
+        """Add a latency sample"""
+        index = bisect.bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+            if not success:
+                self.failures += 1
+            self._samples += 1
+            if self._samples % self.decay_every == 0:
+                self._counts = [count / 2 for count in self._counts]
+                self._total /= 2
+                self.failures /= 2
+
+    @property
+    def count(self) -> float:
+        """Decayed number of samples"""
+        return self._total
+
+    @property
+    def failure_rate(self) -> float:
+        """Decayed share of failed requests"""
+        return self.failures / self._total if self._total else 0.0
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Get latency (seconds) below which the given fraction of samples falls, None without samples"""
+        with self._lock:
+            if not self._total:
+                return None
+            threshold = fraction * self._total
+            running = 0.0
+            for index, count in enumerate(self._counts):
+                running += count
+                if running >= threshold:
+                    return self.BOUNDS[index] if index < len(self.BOUNDS) else self.BOUNDS[-1]
+            return self.BOUNDS[-1]
+
+class HedgedDispatcher(TranslationBackend):
+    """
+    Dispatches each request to the best-ranked backend and hedges to the next one
+
+    If the primary has not answered within its p95 latency, the same request is
+    sent to the secondary, the first successful answer wins and the other is
+    cancelled. Requests run as tasks on the shared event loop, so a cancelled
+    loser really stops instead of occupying a thread. A primary that fails fast fails over immediately. Backends are
+    ranked by recent p95 latency, penalised by their failure rate.
+    """
+
+    name = "dispatcher"
+
+    def __init__(self, backends: Sequence[TranslationBackend], min_hedge_delay: float = 0.05,
+                 default_hedge_delay: float = 1.0, min_samples: int = 10):
+        """
+        Args:
+            backends: Backends in preferred order (used until latency data exists)
+            min_hedge_delay: Never hedge earlier than this many seconds
+            default_hedge_delay: Hedge delay while the primary has too few samples
+            min_samples: Samples needed before a backend's p95 is trusted
+        """
+        if not backends:
+            raise ValueError("HedgedDispatcher needs at least one backend")
+        self.logger = logging.getLogger(__name__)
+        self.backends: List[TranslationBackend] = list(backends)
+        self.histograms = {id(backend): LatencyHistogram() for backend in self.backends}
+        self.min_hedge_delay = min_hedge_delay
+        self.default_hedge_delay = default_hedge_delay
+        self.min_samples = min_samples
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.failovers = 0
+        # A batch must fit every backend it may fail over to
+        self.max_batch_size = min(backend.max_batch_size for backend in self.backends)
+        self.max_batch_chars = min(backend.max_batch_chars for backend in self.backends)
+
+    def _histogram(self, backend: TranslationBackend) -> LatencyHistogram:
+        return self.histograms[id(backend)]
+
+    def _score(self, position: int, backend: TranslationBackend) -> tuple:
+        """Sort key: available first, then trusted p95 inflated by failure rate, configured order as tie breaker"""
+        unavailable = not backend.available
+        histogram = self._histogram(backend)
+        p95 = histogram.percentile(0.95)
+        if p95 is None or histogram.count < self.min_samples:
+            return (unavailable, 0, position)  # Not enough data, keep configured order ahead of measured ones
+        return (unavailable, 1, p95 * (1 + 10 * histogram.failure_rate), position)
+
+    def ranked_backends(self) -> List[TranslationBackend]:
+        """Backends ordered from best to worst"""
+        return [backend for _, backend in sorted(
+            enumerate(self.backends), key=lambda item: self._score(item[0], item[1])
+        )]
+
+    def _hedge_delay(self, backend: TranslationBackend) -> float:
+        histogram = self._histogram(backend)
+        p95 = histogram.percentile(0.95)
+        if p95 is None or histogram.count < self.min_samples:
+            return self.default_hedge_delay
+        return max(self.min_hedge_delay, p95)
+
+    async def _call(self, backend: TranslationBackend, text: str, source_lang: str, target_lang: str) -> BackendResult:
+        """Run backend, recording its latency when it finishes"""
+        start = time.perf_counter()
+        try:
+            result = await backend.translate_async(text, source_lang, target_lang)
+        except (BackendUnavailableError, asyncio.CancelledError):
+            raise  # Rejected without a request or cancelled, says nothing about latency
+        except Exception:
+            self._histogram(backend).record(time.perf_counter() - start, success=False)
+            raise
+        self._histogram(backend).record(time.perf_counter() - start)
+        return result
+
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate with hedging between the two best backends and failover to the rest"""
+        ranked = self.ranked_backends()
+        errors = []
+        tasks = {}
+
+        def start(backend: TranslationBackend) -> asyncio.Task:
+            task = asyncio.ensure_future(self._call(backend, text, source_lang, target_lang))
+            tasks[task] = backend
+            return task
+
+        primary = start(ranked[0])
+        hedge = None
+        pending = {primary}
+        remaining = ranked[1:]
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._hedge_delay(ranked[0]))
+            if not done and remaining:
+                # Primary is slower than its p95: hedge to the secondary
+                hedge = start(remaining.pop(0))
+                pending.add(hedge)
+                self.hedges_sent += 1
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append((tasks[task].name, error))
+                        continue
+                    if task is hedge and not primary.done():
+                        self.hedges_won += 1
+                    return task.result()
+
+                if not pending and remaining:
+                    # Everything in flight failed, fail over to the next backend
+                    self.failovers += 1
+                    pending.add(start(remaining.pop(0)))
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Mark failures of losing tasks as retrieved
+
+        raise _all_failed_error(errors)
+
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate on the shared event loop, blocking until done"""
+        return event_loop.run(self.translate_async(text, source_lang, target_lang))
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str = "auto",
+                                    target_lang: str = "en") -> List[BackendResult]:
+        """
+        Translate a batch on the best backend, failing over to the next ones
+
+        Batches are not hedged (that would double the heavy requests) and their
+        latency is not recorded, as it would distort the single-request p95.
+        """
+        errors = []
+        for position, backend in enumerate(self.ranked_backends()):
+            if position:
+                self.failovers += 1
+            try:
+                return await backend.translate_batch_async(texts, source_lang, target_lang)
+            except Exception as e:
+                errors.append((backend.name, e))
+        raise _all_failed_error(errors)
+
+    def translate_batch(self, texts: Sequence[str], source_lang: str = "auto",
+                        target_lang: str = "en") -> List[BackendResult]:
+        """Batch translate on the shared event loop, blocking until done"""
+        return event_loop.run(self.translate_batch_async(texts, source_lang, target_lang))
+
+    async def detect_async(self, text: str) -> Optional[str]:
+        """Detect language with the first backend that can"""
+        for backend in self.ranked_backends():
+            try:
+                lang = await backend.detect_async(text)
+            except Exception as e:
+                self.logger.error(f"Language detection failed on {backend.name}: {e}")
+                continue
+            if lang:
+                return lang
+        return None
+
+    def detect(self, text: str) -> Optional[str]:
+        """Detect language with the first backend that can"""
+        return event_loop.run(self.detect_async(text))
+
+    def get_stats(self) -> dict:
+        """Get per-backend latency and dispatch counters"""
+        backends = {}
+        for position, backend in enumerate(self.backends):
+            histogram = self._histogram(backend)
+            key = backend.name if backend.name not in backends else f"{backend.name}#{position}"
+            backends[key] = {
+                "samples": histogram.count,
+                "p50_ms": (histogram.percentile(0.5) or 0) * 1000,
+                "p95_ms": (histogram.percentile(0.95) or 0) * 1000,
+                "failure_rate": histogram.failure_rate,
+                "available": backend.available,
+            }
+        return {
+            "backends": backends,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "failovers": self.failovers,
+        }
+
+    def close(self):
+        """Close all backends"""
+        for backend in self.backends:
+            backend.close()
@@ -0,0 +1,101 @@
+"""
+Tranfastic Google Translate Backend Module
+Translation backend using the googletrans library
+"""
+
+import importlib.util
+import logging
+from typing import Optional
+
+from ..event_loop import event_loop
+from .base import BackendError, BackendResult, TranslationBackend
+
+# HTTP timeouts in seconds
+CONNECT_TIMEOUT = 5.0
+REQUEST_TIMEOUT = 10.0
+
+# Connection pool: a few keep-alive sockets shared by all requests
+MAX_CONNECTIONS = 10
+MAX_KEEPALIVE_CONNECTIONS = 4
+KEEPALIVE_EXPIRY = 60.0
+
+class GoogleBackend(TranslationBackend):
+    """
+    Google Translate backend (googletrans)
+
+    googletrans 4.x is asyncio based; its client lives on the shared event
+    loop thread and sync calls are bridged to it.
+    """
+
+    name = "google"
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._translator = None
+
+    async def _get_translator(self):
+        """googletrans client with a pooled keep-alive HTTP client, created on the loop thread"""
+        if self._translator is None:
+            import httpx
+            from googletrans import Translator
+            from googletrans.constants import DEFAULT_USER_AGENT
+
+            # HTTP/2 needs the optional h2 package, fall back to HTTP/1.1 keep-alive without it
+            http2 = importlib.util.find_spec("h2") is not None
+            client = httpx.AsyncClient(
+                http2=http2,
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+                timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY
+                )
+            )
+            # Translator builds its own unpooled client, swap ours in and close that one
+            translator = Translator(http2=http2)
+            replaced = translator.client
+            translator.client = client
+            translator.token_acquirer.client = client
+            self._translator = translator
+            self.logger.info(f"Google Translate client created (HTTP/{'2' if http2 else '1.1'})")
+            await replaced.aclose()
+        return self._translator
+
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate text with Google Translate"""
+        translator = await self._get_translator()
+        if source_lang == "auto":
+            # For auto-detect, don't pass src parameter at all
+            result = await translator.translate(text, dest=target_lang)
+            detected_lang = result.src
+        else:
+            # For specific source language, pass it explicitly
+            result = await translator.translate(text, src=source_lang, dest=target_lang)
+            detected_lang = source_lang
+
+        if result is None or result.text is None:
+            raise BackendError("Empty response from Google Translate")
+        return result.text, detected_lang
+
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate text with Google Translate (blocks until the event loop has the result)"""
+        return event_loop.run(self.translate_async(text, source_lang, target_lang))
+
+    async def detect_async(self, text: str) -> Optional[str]:
+        """Detect language with Google Translate"""
+        translator = await self._get_translator()
+        return (await translator.detect(text)).lang
+
+    def detect(self, text: str) -> Optional[str]:
+        """Detect language with Google Translate"""
+        return event_loop.run(self.detect_async(text))
+
+    def close(self):
+        """Close the pooled HTTP client"""
+        translator, self._translator = self._translator, None
+        if translator is not None:
+            try:
+                event_loop.submit(translator.client.aclose())
+            except Exception as e:
+                self.logger.error(f"Failed to close Google Translate client: {e}")
@@ -0,0 +1,398 @@
+"""
+Tranfastic Local Stand-in Backend Module
+HTTP translation server with configurable latency and error injection,
+and the backend that talks to it. Used for benchmarks and offline testing.
+
+Run a server:
+    python -m src.core.backends.local --port 8765 --latency 80 --jitter 40 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from .base import BackendError, BackendResult, TranslationBackend
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Request handler for the stand-in translation server"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    disable_nagle_algorithm = True  # Headers and body are written separately
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid json"})
+            return
+
+        if self.path not in ("/translate", "/translate_batch"):
+            self._send_json(404, {"error": "not found"})
+            return
+
+        status = self.server.simulate()
+        if status != 200:
+            self._send_json(status, {"error": "injected failure"})
+            return
+
+        source = payload.get("source", "auto")
+        target = payload.get("target", "en")
+        detected = source if source != "auto" else self.server.detected_lang
+        if self.path == "/translate_batch":
+            texts = [f"[{target}] {text}" for text in payload.get("texts", [])]
+            self._send_json(200, {"texts": texts, "source": detected})
+        else:
+            self._send_json(200, {"text": f"[{target}] {payload.get('text', '')}", "source": detected})
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Local stand-in for a translation service
+
+    Translates "text" into "[target] text" after a simulated delay, and fails
+    a configurable share of requests with an HTTP error. POST /translate_batch
+    takes a "texts" list and costs one simulated delay for the whole batch.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128  # Listen backlog, the default of 5 drops connects from concurrent clients
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0, error_status: int = 503,
+                 detected_lang: str = "en", seed: Optional[int] = None):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            latency_ms: Base response delay
+            jitter_ms: Maximum extra random delay
+            error_rate: Share of requests answered with error_status (0..1)
+            error_status: HTTP status used for injected failures
+            detected_lang: Language reported for auto-detect requests
+            seed: Random seed for reproducible latency and failures
+        """
+        super().__init__((host, port), _StandInHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.detected_lang = detected_lang
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def simulate(self) -> int:
+        """Sleep for the simulated latency and pick the response status"""
+        with self._random_lock:
+            self.requests_served += 1
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            failed = self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return self.error_status if failed else 200
+
+    def handle_error(self, request, client_address):
+        """Ignore clients hanging up (cancelled or hedged-away requests)"""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def start(self) -> "StandInServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="StandInServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+class AsyncConnectionPool:
+    """
+    Keep-alive HTTP/1.1 connection pool for asyncio
+
+    Bounds the number of open sockets; idle connections are reused until
+    they have been idle for keepalive_expiry seconds.
+    """
+
+    def __init__(self, host: str, port: int, max_connections: int = 8,
+                 connect_timeout: float = 5.0, keepalive_expiry: float = 60.0):
+        """
+        Must be created on the event loop that will use it
+
+        Args:
+            host: Server host
+            port: Server port
+            max_connections: Maximum open sockets
+            connect_timeout: Seconds allowed for establishing a connection
+            keepalive_expiry: Seconds an idle connection is kept for reuse
+        """
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.connections_opened = 0
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self._loop = asyncio.get_running_loop()
+
+    async def _acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Get (reader, writer, reused) for an idle or a new connection"""
+        now = time.monotonic()
+        while self._idle:
+            reader, writer, idle_since = self._idle.pop()
+            if now - idle_since < self.keepalive_expiry and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.connect_timeout
+        )
+        self.connections_opened += 1
+        return reader, writer, False
+
+    async def request(self, method: str, path: str, body: bytes, headers: dict,
+                      timeout: float) -> Tuple[int, bytes]:
+        """
+        Send a request and read the response
+
+        Returns:
+            Tuple of (status, body)
+        """
+        async with self._slots:
+            for attempt in range(2):
+                reader, writer, reused = await self._acquire()
+                try:
+                    status, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, path, body, headers), timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    # Server closed an idle keep-alive connection, retry once on a fresh one
+                    writer.close()
+                    if not reused or attempt:
+                        raise BackendError(f"Stand-in server unreachable: {e}")
+                    self._close_idle()  # The other idle connections are likely stale too
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer, time.monotonic()))
+                else:
+                    writer.close()
+                return status, data
+
+    async def _exchange(self, reader, writer, method, path, body, headers) -> Tuple[int, bytes, bool]:
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        length = 0
+        keep_alive = True
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "connection" and value.strip().lower() == "close":
+                keep_alive = False
+        data = await reader.readexactly(length)
+        return status, data, keep_alive
+
+    def _close_idle(self):
+        for _, writer, _ in self._idle:
+            writer.close()
+        self._idle.clear()
+
+    def close(self):
+        """Close idle connections (callable from any thread)"""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._close_idle)
+
+class LocalBackend(TranslationBackend):
+    """
+    Backend for the local stand-in server
+
+    Sync calls use one keep-alive connection per thread, async calls share a
+    small connection pool on the event loop.
+    """
+
+    name = "local"
+    max_batch_size = 64
+    max_batch_chars = 20000
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", timeout: float = 10.0, max_connections: int = 8):
+        """
+        Args:
+            url: Base URL of the stand-in server
+            timeout: Request timeout in seconds
+            max_connections: Sockets in the async connection pool
+        """
+        self.logger = logging.getLogger(__name__)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._local = threading.local()
+        self._pool: Optional[AsyncConnectionPool] = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _post(self, path: str, payload: dict) -> dict:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError) as e:
+                # Server closed an idle keep-alive connection, retry once on a fresh one
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise BackendError(f"Stand-in server unreachable: {e}")
+            except OSError as e:
+                conn.close()
+                self._local.conn = None
+                raise BackendError(f"Stand-in server unreachable: {e}")
+
+        if response.status != 200:
+            raise BackendError(f"Stand-in server returned HTTP {response.status}")
+        return json.loads(data)
+
+    async def _post_async(self, path: str, payload: dict) -> dict:
+        if self._pool is None:
+            self._pool = AsyncConnectionPool(
+                self.host, self.port, max_connections=self.max_connections,
+                connect_timeout=min(self.timeout, 5.0)
+            )
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        try:
+            status, data = await self._pool.request("POST", path, body, headers, self.timeout)
+        except asyncio.TimeoutError:
+            raise BackendError(f"Stand-in server timed out after {self.timeout}s")
+        except OSError as e:
+            raise BackendError(f"Stand-in server unreachable: {e}")
+        if status != 200:
+            raise BackendError(f"Stand-in server returned HTTP {status}")
+        return json.loads(data)
+
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate text with the stand-in server"""
+        result = self._post("/translate", {"text": text, "source": source_lang, "target": target_lang})
+        return result["text"], result.get("source")
+
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate text with the stand-in server over the pooled connections"""
+        result = await self._post_async("/translate", {"text": text, "source": source_lang, "target": target_lang})
+        return result["text"], result.get("source")
+
+    def translate_batch(self, texts: Sequence[str], source_lang: str = "auto",
+                        target_lang: str = "en") -> List[BackendResult]:
+        """Translate several texts in one request"""
+        result = self._post("/translate_batch", {"texts": list(texts), "source": source_lang, "target": target_lang})
+        return self._batch_results(texts, result)
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str = "auto",
+                                    target_lang: str = "en") -> List[BackendResult]:
+        """Translate several texts in one pooled request"""
+        result = await self._post_async(
+            "/translate_batch", {"texts": list(texts), "source": source_lang, "target": target_lang}
+        )
+        return self._batch_results(texts, result)
+
+    @staticmethod
+    def _batch_results(texts: Sequence[str], result: dict) -> List[BackendResult]:
+        translated = result.get("texts", [])
+        if len(translated) != len(texts):
+            raise BackendError(f"Stand-in server returned {len(translated)} translations for {len(texts)} texts")
+        return [(text, result.get("source")) for text in translated]
+
+    def close(self):
+        """Close this thread's connection and the idle pooled ones"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+def main():
+    """Run a stand-in server in the foreground"""
+    parser = argparse.ArgumentParser(description="Tranfastic stand-in translation server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="max random extra latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of failed requests (0..1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        host=args.host, port=args.port, latency_ms=args.latency, jitter_ms=args.jitter,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    )
+    print(f"Stand-in translation server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
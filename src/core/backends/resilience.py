@@ -0,0 +1,262 @@
+"""
+Tranfastic Backend Resilience Module
+Circuit breaker and token-bucket rate limiting around translation backends
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from .base import BackendError, BackendResult, TranslationBackend
+
+class BackendUnavailableError(BackendError):
+    """Raised without contacting the backend (circuit open or rate limited)"""
+
+class RateLimitedError(BackendUnavailableError):
+    """Raised when our own rate limiter holds a request back (says nothing about the backend's health)"""
+
+class TokenBucket:
+    """Token-bucket rate limiter"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_acquire(self) -> float:
+        """Take one token if available, returns 0.0 on success or the seconds until one is"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate if self.rate > 0 else float("inf")
+
+    def acquire(self, max_wait: float = 0.0) -> bool:
+        """
+        Take one token, waiting up to max_wait seconds for it
+
+        Returns:
+            True if a token was taken
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait_time = self._try_acquire()
+            if not wait_time:
+                return True
+            if time.monotonic() + wait_time > deadline:
+                return False
+            time.sleep(wait_time)
+
+    async def acquire_async(self, max_wait: float = 0.0) -> bool:
+        """Like acquire(), but waits without blocking the event loop"""
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait_time = self._try_acquire()
+            if not wait_time:
+                return True
+            if time.monotonic() + wait_time > deadline:
+                return False
+            await asyncio.sleep(wait_time)
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker with exponential backoff
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast. Once the open period expires one trial call is let through
+    (half-open): success closes the circuit, failure reopens it for twice as long.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 5.0, max_reset_timeout: float = 120.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Initial seconds the circuit stays open
+            max_reset_timeout: Upper bound for the backed-off open period
+        """
+        self.logger = logging.getLogger(__name__)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._open_timeout = reset_timeout
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def would_allow(self) -> bool:
+        """Check if a call would currently be let through, without claiming a trial"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.monotonic() - self._opened_at >= self._open_timeout
+            return not self._trial_in_flight
+
+    def allow_request(self) -> bool:
+        """Check if a call may proceed (claims the half-open trial slot)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self._open_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self):
+        """Give back a claimed half-open trial slot without a result"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        """Report a successful call"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                self.logger.info("Circuit closed")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._open_timeout = self.reset_timeout
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Report a failed call"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN:
+                self._open_timeout = min(self._open_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == self.CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+        self.logger.warning(f"Circuit opened for {self._open_timeout:.0f}s after {self._failures} failures")
+
+class GuardedBackend(TranslationBackend):
+    """Backend wrapper applying a circuit breaker and a rate limiter"""
+
+    def __init__(self, backend: TranslationBackend, breaker: Optional[CircuitBreaker] = None,
+                 limiter: Optional[TokenBucket] = None, max_wait: float = 0.25):
+        """
+        Args:
+            backend: Wrapped backend
+            breaker: Circuit breaker, a default one is created if omitted
+            limiter: Rate limiter, requests are not limited if omitted
+            max_wait: Seconds to wait for a rate-limit token before failing fast
+        """
+        self.backend = backend
+        self.name = backend.name
+        self.max_batch_size = backend.max_batch_size
+        self.max_batch_chars = backend.max_batch_chars
+        self.breaker = breaker or CircuitBreaker()
+        self.limiter = limiter
+        self.max_wait = max_wait
+        self.rejected = 0
+
+    @property
+    def available(self) -> bool:
+        """Check if the circuit currently lets requests through"""
+        return self.breaker.would_allow()
+
+    def _admit(self):
+        """Claim the circuit, raises BackendUnavailableError if the circuit is open"""
+        if not self.breaker.allow_request():
+            self.rejected += 1
+            raise BackendUnavailableError(f"{self.name}: circuit open")
+
+    def _reject_rate_limited(self):
+        self.rejected += 1
+        # Not the backend's fault: give back a half-open trial without judging it
+        self.breaker.release_trial()
+        raise RateLimitedError(f"{self.name}: rate limited")
+
+    def _call(self, method, *args):
+        """Run a backend method unless the circuit is open or the rate limit is exhausted"""
+        self._admit()
+        if self.limiter and not self.limiter.acquire(self.max_wait):
+            self._reject_rate_limited()
+        try:
+            result = method(*args)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def _call_async(self, method, *args):
+        """Await a backend coroutine method unless the circuit is open or the rate limit is exhausted"""
+        self._admit()
+        if self.limiter and not await self.limiter.acquire_async(self.max_wait):
+            self._reject_rate_limited()
+        try:
+            result = await method(*args)
+        except asyncio.CancelledError:
+            # Lost a hedge race or the caller gave up: no verdict on the backend
+            self.breaker.release_trial()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Translate unless the circuit is open or the rate limit is exhausted"""
+        return self._call(self.backend.translate, text, source_lang, target_lang)
+
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> BackendResult:
+        """Async translate unless the circuit is open or the rate limit is exhausted"""
+        return await self._call_async(self.backend.translate_async, text, source_lang, target_lang)
+
+    def translate_batch(self, texts: Sequence[str], source_lang: str = "auto",
+                        target_lang: str = "en") -> List[BackendResult]:
+        """Batch translate, one rate-limit token per backend call"""
+        if self.max_batch_size == 1:
+            return super().translate_batch(texts, source_lang, target_lang)
+        return self._call(self.backend.translate_batch, texts, source_lang, target_lang)
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str = "auto",
+                                    target_lang: str = "en") -> List[BackendResult]:
+        """Async batch translate, one rate-limit token per backend call"""
+        if self.max_batch_size == 1:
+            return await super().translate_batch_async(texts, source_lang, target_lang)
+        return await self._call_async(self.backend.translate_batch_async, texts, source_lang, target_lang)
+
+    def detect(self, text: str) -> Optional[str]:
+        return self.backend.detect(text)
+
+    async def detect_async(self, text: str) -> Optional[str]:
+        return await self.backend.detect_async(text)
+
+    def get_stats(self) -> dict:
+        """Get circuit state and rejection count"""
+        return {"backend": self.name, "circuit": self.breaker.state, "rejected": self.rejected}
+
+    def close(self):
+        self.backend.close()
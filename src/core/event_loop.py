@@ -0,0 +1,114 @@
+"""
+Tranfastic Event Loop Module
+Runs the asyncio event loop used for network I/O on a dedicated thread
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+class EventLoopThread:
+    """
+    Asyncio event loop on a background thread
+
+    Coroutines are submitted from any thread and bridged back through
+    concurrent.futures.Future, so blocking callers can wait on them while
+    all network I/O is multiplexed on one loop.
+    """
+
+    def __init__(self, name: str = "TranslationEventLoop"):
+        """
+        Args:
+            name: Name of the loop thread
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Running event loop, started on first use"""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+                    self._thread = threading.Thread(target=self._run, args=(loop, ready), name=self.name, daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        """Loop thread entry point"""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception as e:
+                self.logger.error(f"Event loop shutdown failed: {e}")
+            loop.close()
+
+    def in_loop_thread(self) -> bool:
+        """Check if the caller runs on the loop thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the loop
+
+        Returns:
+            Future for the coroutine result; cancelling it cancels the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Raises:
+            RuntimeError: If called from the loop thread itself (it would deadlock)
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("EventLoopThread.run() called from the event loop thread")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Cancel pending tasks and stop the loop"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+
+        async def cancel_tasks():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_tasks(), loop).result(timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to cancel event loop tasks: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+
+# Global event loop instance
+event_loop = EventLoopThread()
@@ -0,0 +1,326 @@
+"""
+Tranfastic File Pipeline Module
+Streaming translation of large UTF-8 text files with bounded memory and resumable checkpoints
+
+The input is read in chunks cut at line breaks (or at blank lines, so subtitle
+cues stay whole), a bounded window of chunks is translated concurrently on the
+engine's event loop, and results are appended to the output in input order.
+After each written chunk a checkpoint records how far input and output got, so
+an interrupted job continues from there.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+from .event_loop import event_loop
+from .segmenter import join_segments, segment_text
+from .translator import TranslationEngine, TranslationResult, translator_engine
+
+# Bytes read from the input at a time; chunks end at the last line break read
+CHUNK_BYTES = 64 * 1024
+
+# A line longer than this is cut at whitespace instead of waiting for its line break
+MAX_CHUNK_BYTES = 1024 * 1024
+
+# Chunks in flight at once (each makes one backend call at a time)
+DEFAULT_CONCURRENCY = 4
+
+# Minimum seconds between checkpoint writes
+CHECKPOINT_INTERVAL = 2.0
+
+# Pause before failed lines of a chunk are retried once
+RETRY_DELAY = 2.0
+
+# Blank lines, where chunks of block-structured files are cut
+_BLANK_LINES = re.compile(rb"\n(?:[ \t]*\r?\n)+")
+
+class FileTranslationError(Exception):
+    """A chunk could not be translated because the backend is down (the job can be resumed later)"""
+
+def split_line(line: str) -> Tuple[str, str, str]:
+    """Split a line into (leading whitespace, text, trailing whitespace and line ending)"""
+    text = line.strip()
+    if not text:
+        return line, "", ""
+    start = line.index(text)
+    return line[:start], text, line[start + len(text):]
+
+def _safe_cut(buffer: bytes) -> int:
+    """Find where to cut a buffer without a line break: after whitespace, else at a UTF-8 character boundary"""
+    cut = buffer.rfind(b" ") + 1
+    if cut:
+        return cut
+    cut = len(buffer)
+    while cut > 0 and (buffer[cut - 1] & 0xC0) == 0x80:
+        cut -= 1  # Continuation bytes
+    if cut > 0 and buffer[cut - 1] >= 0xC0:
+        cut -= 1  # Lead byte of the incomplete character
+    return cut or len(buffer)
+
+def _block_cut(buffer: bytes) -> int:
+    """Find where to cut a buffer after its last blank line, 0 if it has none"""
+    cut = 0
+    for match in _BLANK_LINES.finditer(buffer):
+        cut = match.end()
+    return cut
+
+def iter_chunks(source, chunk_bytes: int = CHUNK_BYTES, offset: int = 0,
+                blocks: bool = False) -> Iterator[Tuple[int, bytes]]:
+    """
+    Read a binary file in chunks that end at line breaks
+
+    Args:
+        source: Binary file positioned at offset
+        chunk_bytes: Bytes read at a time
+        offset: Current position of source
+        blocks: End chunks after blank lines instead, keeping blank-line separated blocks whole
+
+    Yields:
+        Tuples of (input offset after the chunk, chunk)
+    """
+    buffer = b""
+    while True:
+        data = source.read(chunk_bytes)
+        if not data:
+            if buffer:
+                yield offset + len(buffer), buffer
+            return
+        buffer += data
+        cut = _block_cut(buffer) if blocks else buffer.rfind(b"\n") + 1
+        if not cut:
+            if len(buffer) < MAX_CHUNK_BYTES:
+                continue
+            cut = buffer.rfind(b"\n") + 1 or _safe_cut(buffer)
+        chunk, buffer = buffer[:cut], buffer[cut:]
+        offset += len(chunk)
+        yield offset, chunk
+
+class FileTranslationJob:
+    """Translates one file into another, resumable through a checkpoint file"""
+
+    # Chunks end after blank lines instead of at any line break
+    blocks = False
+
+    def __init__(self, input_path, output_path, source_lang: str = "auto", target_lang: str = "en",
+                 concurrency: int = DEFAULT_CONCURRENCY, chunk_bytes: int = CHUNK_BYTES,
+                 engine: Optional[TranslationEngine] = None):
+        """
+        Args:
+            input_path: UTF-8 text file to translate
+            output_path: File the translation is written to
+            source_lang: Source language code
+            target_lang: Target language code
+            concurrency: Chunks in flight at once, bounds memory to about concurrency * chunk_bytes
+            chunk_bytes: Bytes read from the input at a time
+            engine: Translation engine, defaults to the global one
+        """
+        self.logger = logging.getLogger(__name__)
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.checkpoint_path = self.output_path.with_name(self.output_path.name + ".checkpoint.json")
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.concurrency = max(1, concurrency)
+        self.chunk_bytes = max(1, chunk_bytes)
+        self.engine = engine or translator_engine
+        self.stats = {"bytes": 0, "lines": 0, "chars": 0, "failed": 0, "resumed_at": 0}
+        self._input_offset = 0
+        self._output_offset = 0
+        self._last_checkpoint = 0.0
+
+    def _identity(self) -> dict:
+        """Settings a checkpoint must match to be resumed"""
+        stat = self.input_path.stat()
+        return {
+            "input": str(self.input_path.resolve()),
+            "input_size": stat.st_size,
+            "input_mtime_ns": stat.st_mtime_ns,
+            "source_lang": self.source_lang,
+            "target_lang": self.target_lang,
+        }
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        """Get a checkpoint matching this job, None to start from the beginning"""
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+            return None
+        if checkpoint.get("job") != self._identity():
+            self.logger.warning(f"Checkpoint {self.checkpoint_path} belongs to another input or settings, starting over")
+            return None
+        if not self.output_path.exists() or self.output_path.stat().st_size < checkpoint["output_offset"]:
+            self.logger.warning(f"Output {self.output_path} is shorter than its checkpoint, starting over")
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, output, force: bool = False):
+        """Record progress of written chunks (at most every CHECKPOINT_INTERVAL seconds unless forced)"""
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < CHECKPOINT_INTERVAL:
+            return
+        self._last_checkpoint = now
+        output.flush()
+        os.fsync(output.fileno())
+        checkpoint = {
+            "job": self._identity(),
+            "input_offset": self._input_offset,
+            "output_offset": self._output_offset,
+            "stats": self.stats,
+        }
+        temp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def run(self, resume: bool = True, on_progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        """
+        Translate the file, blocking until done
+
+        Args:
+            resume: Continue from a matching checkpoint instead of starting over
+            on_progress: Called with (input bytes done, input size) after each written chunk
+
+        Returns:
+            Statistics: bytes, lines, chars, failed (lines the reachable backend
+            would not translate, written untranslated), resumed_at (input offset
+            the job continued from) and elapsed seconds
+
+        Raises:
+            FileTranslationError: Lines failed while the backend was unreachable or
+                rate limited; the chunk is not written and progress up to it is checkpointed
+        """
+        start = time.perf_counter()
+        checkpoint = self._load_checkpoint() if resume else None
+        if checkpoint:
+            self._input_offset = checkpoint["input_offset"]
+            self._output_offset = checkpoint["output_offset"]
+            self.stats.update(checkpoint["stats"])
+            self.stats["resumed_at"] = self._input_offset
+            self.logger.info(f"Resuming {self.input_path} at byte {self._input_offset}")
+        total = self.input_path.stat().st_size
+
+        in_flight: Deque[tuple] = deque()
+        completed = False
+        with open(self.input_path, "rb") as source, open(self.output_path, "r+b" if checkpoint else "wb") as output:
+            source.seek(self._input_offset)
+            output.seek(self._output_offset)
+            output.truncate()
+            try:
+                for end_offset, chunk in iter_chunks(source, self.chunk_bytes, self._input_offset, self.blocks):
+                    # Back-pressure: reading waits until the oldest chunk is written
+                    if len(in_flight) >= self.concurrency:
+                        self._write(output, *in_flight.popleft())
+                        if on_progress:
+                            on_progress(self._input_offset, total)
+                    in_flight.append((end_offset, event_loop.submit(self._translate_chunk(chunk))))
+                while in_flight:
+                    self._write(output, *in_flight.popleft())
+                    if on_progress:
+                        on_progress(self._input_offset, total)
+                completed = True
+            finally:
+                for _, future in in_flight:
+                    future.cancel()
+                if not completed:
+                    self._save_checkpoint(output, force=True)
+
+        self.checkpoint_path.unlink(missing_ok=True)
+        self.stats["elapsed"] = time.perf_counter() - start
+        self.logger.info(f"Translated {self.input_path} -> {self.output_path}: {self.stats}")
+        return self.stats
+
+    def _write(self, output, end_offset: int, future):
+        """Wait for the oldest chunk, append it to the output and checkpoint"""
+        data, lines, chars, failed = future.result()
+        output.write(data)
+        self._input_offset = end_offset
+        self._output_offset += len(data)
+        self.stats["bytes"] = end_offset
+        self.stats["lines"] += lines
+        self.stats["chars"] += chars
+        self.stats["failed"] += failed
+        self._save_checkpoint(output)
+
+    async def _translate_chunk(self, chunk: bytes) -> Tuple[bytes, int, int, int]:
+        """
+        Translate one chunk line by line, runs on the event loop
+
+        Returns:
+            Tuple of (translated UTF-8 bytes, lines, characters translated, lines left untranslated)
+        """
+        lines = chunk.decode("utf-8", errors="replace").splitlines(keepends=True)
+        texts: List[str] = []
+        layout = []  # Per line: (leading, trailing, pieces or None, index of its first text)
+        for line in lines:
+            leading, text, trailing = split_line(line)
+            if not text:
+                layout.append((leading, trailing, None, -1))
+                continue
+            pieces = segment_text(text) if len(text) >= self.engine.segment_min_chars else [(text, True)]
+            layout.append((leading, trailing, pieces, len(texts)))
+            texts.extend(piece for piece, translatable in pieces if translatable)
+
+        results, failed = await self._translate_texts(texts, len(chunk))
+        translated = [translated_text if success else text for text, (translated_text, _, success) in zip(texts, results)]
+        parts = []
+        failed_lines = 0
+        failed_set = set(failed)
+        for leading, trailing, pieces, first in layout:
+            parts.append(leading)
+            if pieces is not None:
+                count = sum(1 for _, translatable in pieces if translatable)
+                parts.append(join_segments(pieces, translated[first:first + count]))
+                failed_lines += any(index in failed_set for index in range(first, first + count))
+            parts.append(trailing)
+        return "".join(parts).encode("utf-8"), len(lines), sum(len(text) for text in texts), failed_lines
+
+    async def _translate_texts(self, texts: List[str], chunk_size: int) -> Tuple[List[TranslationResult], List[int]]:
+        """
+        Translate the texts of one chunk, retrying failed ones once
+
+        Returns:
+            Tuple of (results in input order, indexes of the texts that failed)
+
+        Raises:
+            FileTranslationError: Texts failed while the backend was unreachable or rate limited
+        """
+        results = await self.engine.translate_many_async(texts, self.source_lang, self.target_lang, max_concurrency=1)
+        failed = [index for index, (_, _, success) in enumerate(results) if not success]
+        if failed:
+            await asyncio.sleep(RETRY_DELAY)
+            retried = await self.engine.translate_many_async(
+                [texts[index] for index in failed], self.source_lang, self.target_lang, max_concurrency=1
+            )
+            for index, result in zip(failed, retried):
+                results[index] = result
+            failed = [index for index, (_, _, success) in enumerate(results) if not success]
+            # Texts are only given up on (written untranslated) if the backend answers
+            # other requests; otherwise the chunk is left for a resumed job to retry
+            if failed and (len(failed) == len(texts) or not await self.engine.probe_backend_async()):
+                raise FileTranslationError(
+                    f"{len(failed)} of {len(texts)} texts of a {chunk_size} byte chunk could not be translated"
+                )
+        return results, failed
+
+def translate_file(input_path, output_path, source_lang: str = "auto", target_lang: str = "en",
+                   concurrency: int = DEFAULT_CONCURRENCY, resume: bool = True,
+                   on_progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """
+    Translate a text file line by line (see FileTranslationJob.run)
+
+    Returns:
+        Job statistics
+    """
+    job = FileTranslationJob(input_path, output_path, source_lang, target_lang, concurrency)
+    return job.run(resume=resume, on_progress=on_progress)
@@ -0,0 +1,279 @@
+"""
+Tranfastic Glossary Module
+User terminology enforced around backend translation (Aho-Corasick term matching)
+
+The glossary file (~/.tranfastic/glossary.json) maps language pairs to terms:
+    {
+        "*": ["Tranfastic", "GitHub"],
+        "en-tr": {"pull request": "çekme isteği"},
+        "*-de": {"invoice": "Rechnung", "Acme Cloud": null}
+    }
+Sections are "source-target" pairs where either side may be "*" ("*" alone
+applies to every pair). A list, or a null value, keeps terms untranslated; a
+string value is the required translation. More specific sections win.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Placeholder sent to the backend in place of a glossary term
+PLACEHOLDER = "⟦{}⟧"
+
+# Placeholders as they come back from backends (which may add spaces)
+_PLACEHOLDER_PATTERN = re.compile(r"⟦\s*(\d+)\s*⟧")
+
+# Minimum seconds between glossary file modification checks
+RELOAD_CHECK_INTERVAL = 1.0
+
+# (start, end) of a term occurrence, and its index in the matcher's term list
+Match = Tuple[int, int, int]
+
+def _fold(text: str) -> str:
+    """Lowercase text without changing its length (so match offsets stay valid)"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(lower if len(lower) == 1 else char for char, lower in ((char, char.lower()) for char in text))
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+class TermMatcher:
+    """Case-insensitive multi-term matcher (Aho-Corasick automaton)"""
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Args:
+            terms: Terms to find, matched case-insensitively on word boundaries
+        """
+        self.terms: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._term_at: List[int] = [-1]  # Term ending at node, -1 for none
+        self._fail: List[int] = [0]
+        self._output_link: List[int] = [0]  # Nearest proper suffix node ending a term, 0 for none
+        for term in terms:
+            self._insert(term)
+        self._link()
+
+    def _insert(self, term: str):
+        folded = _fold(term)
+        if not folded:
+            return
+        node = 0
+        for char in folded:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._term_at.append(-1)
+                self._fail.append(0)
+                self._output_link.append(0)
+                self._goto[node][char] = next_node
+            node = next_node
+        if self._term_at[node] < 0:
+            self._term_at[node] = len(self.terms)
+            self.terms.append(term)
+
+    def _link(self):
+        """Compute failure and output links breadth first"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                failed = self._fail[child]
+                self._output_link[child] = failed if self._term_at[failed] >= 0 else self._output_link[failed]
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find(self, text: str) -> List[Match]:
+        """
+        Find term occurrences in text
+
+        Overlaps are resolved leftmost-longest, and terms must start and end on
+        word boundaries. Runs in time linear in the text plus the matches found.
+
+        Returns:
+            List of (start, end, term_index) in text order
+        """
+        if not self.terms:
+            return []
+        goto, fail, term_at, output_link = self._goto, self._fail, self._term_at, self._output_link
+        candidates: List[Match] = []
+        node = 0
+        for position, char in enumerate(_fold(text)):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            hit = node if term_at[node] >= 0 else output_link[node]
+            while hit:
+                term_index = term_at[hit]
+                start = position + 1 - len(self.terms[term_index])
+                candidates.append((start, position + 1, term_index))
+                hit = output_link[hit]
+
+        matches: List[Match] = []
+        last_end = 0
+        for start, end, term_index in sorted(candidates, key=lambda match: (match[0], -match[1])):
+            if start < last_end:
+                continue
+            if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+                continue
+            matches.append((start, end, term_index))
+            last_end = end
+        return matches
+
+class Glossary:
+    """Per language pair terminology, reloaded when the glossary file changes"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: Glossary JSON file, defaults to ~/.tranfastic/glossary.json
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path) if path else Path.home() / ".tranfastic" / "glossary.json"
+        self._sections: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
+        self._matchers: Dict[Tuple[str, str], Tuple[TermMatcher, List[Optional[str]]]] = {}
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _check_reload(self):
+        """Reload the glossary if its file changed (checked at most once per RELOAD_CHECK_INTERVAL)"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + RELOAD_CHECK_INTERVAL
+            try:
+                stat = self.path.stat()
+                file_state = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                file_state = None
+            except OSError as e:
+                self.logger.error(f"Failed to check glossary file: {e}")
+                return
+            if file_state == self._file_state:
+                return
+            self._file_state = file_state
+            if file_state is None:
+                self._sections, self._matchers = {}, {}
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    sections = self._parse(json.load(f))
+            except Exception as e:
+                self.logger.error(f"Failed to load glossary, keeping previous terms: {e}")
+                return
+            self._sections, self._matchers = sections, {}
+            self.logger.info(f"Glossary loaded: {sum(len(terms) for terms in sections.values())} terms in {len(sections)} sections")
+
+    @staticmethod
+    def _parse(data: dict) -> Dict[Tuple[str, str], Dict[str, Optional[str]]]:
+        """Convert glossary JSON into {(source, target): {term: translation or None}}"""
+        if not isinstance(data, dict):
+            raise ValueError("glossary must be a JSON object")
+        sections = {}
+        for pair, terms in data.items():
+            source, _, target = pair.partition("-")
+            if isinstance(terms, list):
+                terms = {term: None for term in terms}
+            if not isinstance(terms, dict):
+                raise ValueError(f"section '{pair}' must be a list or an object")
+            sections[(source or "*", target or "*")] = {
+                str(term): None if translation is None else str(translation)
+                for term, translation in terms.items() if str(term).strip()
+            }
+        return sections
+
+    def set_terms(self, sections: dict):
+        """Replace the glossary with in-memory terms (same layout as the file), disabling file reloads"""
+        with self._lock:
+            self._sections, self._matchers = self._parse(sections), {}
+            self._next_check = float("inf")
+
+    def _matcher(self, source_lang: str, target_lang: str) -> Optional[Tuple[TermMatcher, List[Optional[str]]]]:
+        """Get the compiled matcher and translations for a language pair, None if it has no terms"""
+        self._check_reload()
+        key = (source_lang, target_lang)
+        compiled = self._matchers.get(key)
+        if compiled is None:
+            sections = self._sections
+            merged: Dict[str, Tuple[str, Optional[str]]] = {}
+            for section in (("*", "*"), (source_lang, "*"), ("*", target_lang), (source_lang, target_lang)):
+                for term, translation in sections.get(section, {}).items():
+                    merged[_fold(term)] = (term, translation)
+            compiled = (
+                TermMatcher(term for term, _ in merged.values()),
+                [translation for _, translation in merged.values()],
+            )
+            self._matchers[key] = compiled
+        return compiled if len(compiled[0]) else None
+
+    def protect(self, text: str, source_lang: str, target_lang: str) -> Tuple[str, List[str]]:
+        """
+        Replace glossary terms in text with placeholders before translation
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code ("auto" only matches "*" source sections)
+            target_lang: Target language code
+
+        Returns:
+            Tuple of (text with placeholders, replacement for each placeholder)
+        """
+        compiled = self._matcher(source_lang, target_lang)
+        if compiled is None:
+            return text, []
+        matcher, translations = compiled
+        matches = matcher.find(text)
+        if not matches:
+            return text, []
+        parts, replacements = [], []
+        position = 0
+        for start, end, term_index in matches:
+            translation = translations[term_index]
+            parts.append(text[position:start])
+            parts.append(PLACEHOLDER.format(len(replacements)))
+            replacements.append(text[start:end] if translation is None else translation)
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), replacements
+
+    def restore(self, translated_text: str, replacements: List[str]) -> str:
+        """Put glossary terms back in place of the placeholders of a translation"""
+        if not replacements:
+            return translated_text
+        restored = set()
+
+        def substitute(match):
+            index = int(match.group(1))
+            if index >= len(replacements):
+                return match.group()
+            restored.add(index)
+            return replacements[index]
+
+        result = _PLACEHOLDER_PATTERN.sub(substitute, translated_text)
+        if len(restored) < len(replacements):
+            self.logger.warning(f"Backend dropped {len(replacements) - len(restored)} glossary placeholder(s)")
+        return result
+
+# Global glossary instance
+glossary = Glossary()
@@ -0,0 +1,94 @@
+"""
+Tranfastic Connection Health Monitor Module
+Keeps translation service connection status up to date in the background
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from .translator import TranslationEngine, translator_engine
+
+class ConnectionHealthMonitor:
+    """Periodically probes the translation service with adaptive intervals"""
+
+    def __init__(self, engine: TranslationEngine, healthy_interval: float = 120.0,
+                 retry_interval: float = 5.0, max_retry_interval: float = 300.0):
+        """
+        Args:
+            engine: Translation engine to probe
+            healthy_interval: Seconds between probes while connected
+            retry_interval: Initial seconds between probes after a failure
+            max_retry_interval: Upper bound for backed-off retry interval
+        """
+        self.logger = logging.getLogger(__name__)
+        self.engine = engine
+        self.healthy_interval = healthy_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self._consecutive_failures = 0
+        self._last_probe: Optional[float] = None
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start monitoring (first probe runs immediately)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ConnectionHealthMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop monitoring"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def request_probe(self, min_age: float = 3.0):
+        """
+        Ask for a probe soon without waiting for it
+
+        Ignored while connected or if the last probe is younger than min_age seconds.
+        """
+        if self.engine.is_connected:
+            return
+        if self._last_probe is not None and time.monotonic() - self._last_probe < min_age:
+            return
+        self._wake_event.set()
+
+    def _next_interval(self) -> float:
+        """Get delay before the next probe based on recent failures"""
+        if self._consecutive_failures == 0:
+            return self.healthy_interval
+        backoff = self.retry_interval * (2 ** (self._consecutive_failures - 1))
+        return min(backoff, self.max_retry_interval)
+
+    def _run(self):
+        """Monitor loop"""
+        while not self._stop_event.is_set():
+            success_age = self.engine.last_success_age
+            if success_age is not None and success_age < self.healthy_interval:
+                # A real translation succeeded recently, no need to probe
+                self._consecutive_failures = 0
+            else:
+                self._probe()
+
+            self._wake_event.wait(self._next_interval())
+            self._wake_event.clear()
+
+    def _probe(self):
+        """Run one connection probe"""
+        self._last_probe = time.monotonic()
+        if self.engine._test_connection():
+            self._consecutive_failures = 0
+        else:
+            self._consecutive_failures += 1
+            self.logger.info(f"Next connection probe in {self._next_interval():.0f}s")
+
+# Global health monitor instance
+health_monitor = ConnectionHealthMonitor(translator_engine)
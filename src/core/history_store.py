@@ -0,0 +1,233 @@
+"""
+Tranfastic History Store Module
+Indexed, searchable translation history backed by SQLite (FTS5 when available)
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Legacy daily history line: "[HH:MM:SS] src -> tgt | source => translated"
+LEGACY_LINE_PATTERN = re.compile(r"^\[(\d{2}:\d{2}:\d{2})\] (\S+) -> (\S+) \| (.*?) => (.*)$")
+
+HistoryRow = Tuple[float, str, str, str, str]
+
+class HistoryStore:
+    """SQLite translation history with timestamp, language pair and full-text indexes"""
+
+    def __init__(self, db_path: Optional[Path] = None, legacy_dir: Optional[Path] = None):
+        """
+        Args:
+            db_path: Database file location
+            legacy_dir: Directory of daily .txt history files imported once on first open
+        """
+        self.logger = logging.getLogger(__name__)
+        base_dir = Path.home() / ".tranfastic"
+        self.db_path = db_path or (base_dir / "history.db")
+        self.legacy_dir = legacy_dir or (base_dir / "history")
+        self.fts_enabled = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database on first use, creating schema and importing legacy files"""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_history_pair ON history(source_lang, target_lang, timestamp);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                    source_text, translated_text,
+                    content='history', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+                    INSERT INTO history_fts(rowid, source_text, translated_text)
+                    VALUES (new.id, new.source_text, new.translated_text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, source_text, translated_text)
+                    VALUES ('delete', old.id, old.source_text, old.translated_text);
+                END;
+            """)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"FTS5 unavailable, history search falls back to LIKE: {e}")
+        conn.commit()
+        self._conn = conn
+
+        if self._get_meta("legacy_imported") is None:
+            imported = self._import_legacy_files(conn)
+            self._set_meta("legacy_imported", datetime.now().isoformat())
+            self.logger.info(f"Imported {imported} legacy history entries")
+        return conn
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self._conn.commit()
+
+    def add(self, source_text: str, translated_text: str, source_lang: str, target_lang: str,
+            timestamp: Optional[datetime] = None):
+        """Add a single history entry"""
+        timestamp = timestamp or datetime.now()
+        self.add_many([(timestamp.timestamp(), source_lang, target_lang, source_text, translated_text)])
+
+    def add_many(self, rows: Iterable[HistoryRow]):
+        """Add entries as (timestamp, source_lang, target_lang, source_text, translated_text) in one transaction"""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO history (timestamp, source_lang, target_lang, source_text, translated_text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+    def _import_legacy_files(self, conn: sqlite3.Connection) -> int:
+        """
+        Import daily .txt history files written by older versions
+
+        Returns:
+            Number of imported entries
+        """
+        if not self.legacy_dir.exists():
+            return 0
+        count = 0
+        for history_file in sorted(self.legacy_dir.glob("*.txt")):
+            try:
+                day = datetime.strptime(history_file.stem, "%Y-%m-%d")
+            except ValueError:
+                continue
+            rows = []
+            with open(history_file, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    match = LEGACY_LINE_PATTERN.match(line.rstrip("\n"))
+                    if not match:
+                        continue
+                    clock, source_lang, target_lang, source_text, translated_text = match.groups()
+                    hours, minutes, seconds = (int(part) for part in clock.split(":"))
+                    timestamp = day.replace(hour=hours, minute=minutes, second=seconds).timestamp()
+                    rows.append((timestamp, source_lang, target_lang, source_text, translated_text))
+            conn.executemany(
+                "INSERT INTO history (timestamp, source_lang, target_lang, source_text, translated_text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            count += len(rows)
+        conn.commit()
+        return count
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """Build a safe FTS5 query: all terms must match, last term as prefix"""
+        terms = ['"' + term.replace('"', '""') + '"' for term in text.split()]
+        if terms:
+            terms[-1] += "*"
+        return " ".join(terms)
+
+    def search(self, text: Optional[str] = None, source_lang: Optional[str] = None,
+               target_lang: Optional[str] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, page: int = 0, page_size: int = 50) -> List[dict]:
+        """
+        Search history, newest first
+
+        Args:
+            text: Words to find in source or translated text
+            source_lang: Filter by source language code
+            target_lang: Filter by target language code
+            since: Only entries at or after this time
+            until: Only entries before this time
+            page: Zero-based page number
+            page_size: Entries per page
+
+        Returns:
+            List of entry dicts (id, timestamp, source_lang, target_lang, source_text, translated_text)
+        """
+        conditions = []
+        params: list = []
+        if source_lang:
+            conditions.append("h.source_lang = ?")
+            params.append(source_lang)
+        if target_lang:
+            conditions.append("h.target_lang = ?")
+            params.append(target_lang)
+        if since:
+            conditions.append("h.timestamp >= ?")
+            params.append(since.timestamp())
+        if until:
+            conditions.append("h.timestamp < ?")
+            params.append(until.timestamp())
+
+        with self._lock:
+            conn = self._connect()
+            if text and text.strip():
+                if self.fts_enabled:
+                    source = "history_fts JOIN history h ON h.id = history_fts.rowid"
+                    conditions.insert(0, "history_fts MATCH ?")
+                    params.insert(0, self._fts_query(text))
+                else:
+                    source = "history h"
+                    conditions.insert(0, "(h.source_text LIKE ? OR h.translated_text LIKE ?)")
+                    pattern = f"%{text.strip()}%"
+                    params[0:0] = [pattern, pattern]
+            else:
+                source = "history h"
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            rows = conn.execute(
+                f"SELECT h.id, h.timestamp, h.source_lang, h.target_lang, h.source_text, h.translated_text "
+                f"FROM {source} {where} ORDER BY h.timestamp DESC, h.id DESC LIMIT ? OFFSET ?",
+                (*params, page_size, page * page_size)
+            ).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "timestamp": datetime.fromtimestamp(row[1]),
+                "source_lang": row[2],
+                "target_lang": row[3],
+                "source_text": row[4],
+                "translated_text": row[5],
+            }
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """Get total number of history entries"""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Global history store instance
+history_store = HistoryStore()
@@ -0,0 +1,167 @@
+"""
+Tranfastic History Writer Module
+Appends translation history on a background thread in batches
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TextIO
+
+from .history_store import HistoryStore, history_store
+
+# Sentinel telling the writer thread to exit
+_STOP = object()
+
+class HistoryWriter:
+    """Buffered, asynchronous writer for daily translation history files"""
+
+    def __init__(self, history_dir: Optional[Path] = None, store: Optional[HistoryStore] = None,
+                 fsync_interval: float = 5.0, max_batch: int = 256):
+        """
+        Args:
+            history_dir: Directory for daily history files
+            store: Indexed history store receiving the same entries
+            fsync_interval: Minimum seconds between fsync calls
+            max_batch: Maximum number of entries written per batch
+        """
+        self.logger = logging.getLogger(__name__)
+        self.history_dir = history_dir or (Path.home() / ".tranfastic" / "history")
+        self.store = store or history_store
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._file_day: Optional[str] = None
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+
+    def write(self, source_text: str, translated_text: str, source_lang: str, target_lang: str):
+        """Queue a history entry, returns immediately"""
+        self._ensure_started()
+        self._queue.put((datetime.now(), source_text, translated_text, source_lang, target_lang))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until all queued entries are written and synced to disk
+
+        Returns:
+            True if flushed within timeout
+        """
+        if not self._thread or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Write remaining entries and stop the writer thread"""
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        if thread and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _ensure_started(self):
+        """Start writer thread on first use"""
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="HistoryWriter", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        """Writer loop"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                self._sync()
+                continue
+
+            batch = []
+            markers = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._write_batch(batch)
+            if markers or stop or time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self._sync()
+            for marker in markers:
+                marker.set()
+            if stop:
+                self._close_file()
+                return
+
+    def _write_batch(self, batch):
+        """Append a batch of entries to the history store and their daily files"""
+        if not batch:
+            return
+        try:
+            # Store first: its one-time legacy import must not see this batch's lines
+            self.store.add_many(
+                (timestamp.timestamp(), source_lang, target_lang, source_text, translated_text)
+                for timestamp, source_text, translated_text, source_lang, target_lang in batch
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to store translation history: {e}")
+
+        for timestamp, source_text, translated_text, source_lang, target_lang in batch:
+            try:
+                history_file = self._get_file(timestamp.strftime("%Y-%m-%d"))
+                line = f"[{timestamp.strftime('%H:%M:%S')}] {source_lang} -> {target_lang} | {source_text} => {translated_text}\n"
+                history_file.write(line)
+                self._dirty = True
+            except Exception as e:
+                self.logger.error(f"Failed to write translation history: {e}")
+
+    def _get_file(self, day: str) -> TextIO:
+        """Get open handle for the given day's history file"""
+        if self._file is None or self._file_day != day:
+            self._close_file()
+            self.history_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.history_dir / f"{day}.txt", "a", encoding="utf-8")
+            self._file_day = day
+        return self._file
+
+    def _sync(self):
+        """Flush and fsync the open history file"""
+        self._last_fsync = time.monotonic()
+        if self._file is None or not self._dirty:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        except Exception as e:
+            self.logger.error(f"Failed to sync translation history: {e}")
+
+    def _close_file(self):
+        """Sync and close the open history file"""
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+            self._file_day = None
+
+# Global history writer instance
+history_writer = HistoryWriter()
@@ -0,0 +1,245 @@
+"""
+Tranfastic Language Identification Module
+Offline language detection from character n-gram profiles and script heuristics
+
+Profiles live in langid_profiles.py and are loaded on first use. Regenerate
+them from one sample text file per language (named <code>.txt):
+    python -m src.core.langid build path/to/corpus > src/core/langid_profiles.py
+"""
+
+import logging
+import math
+import re
+import sys
+import threading
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (language_code, confidence 0..1)
+Detection = Tuple[Optional[str], float]
+
+# Ranked n-grams kept per language
+PROFILE_SIZE = 1000
+
+# Zipf-style weight of an n-gram at rank r is -log(r + RANK_OFFSET);
+# n-grams missing from a profile score as if ranked UNSEEN_RANK
+RANK_OFFSET = 10
+UNSEEN_RANK = 2 * PROFILE_SIZE
+_UNSEEN_WEIGHT = -math.log(UNSEEN_RANK + RANK_OFFSET)
+
+# Softens the naive Bayes scores into calibrated confidences: wrong guesses
+# on short phrases stay below ~0.9, clear sentences reach 0.99
+SCORE_TEMPERATURE = 2.5
+
+# Only the start of long texts is scored
+MAX_SCORED_CHARS = 300
+
+# Texts with fewer letters than this are not classified
+MIN_LETTERS = 3
+
+# Text the best profile explains this badly is in a language without a profile
+# and is not classified: share of its letters, and of its 2- and 3-grams,
+# missing from that profile (letters catch e.g. Vietnamese or Azerbaijani,
+# n-grams languages using the same letters as a profiled one)
+MAX_UNSEEN_LETTERS = 0.05
+MAX_UNSEEN_GRAMS = 0.5
+
+# Confidence of a guess made from the script alone, or among only some of the
+# languages written in it; stays below every threshold that acts on a detection
+SCRIPT_ONLY_CONFIDENCE = 0.5
+
+# Detections of this many recent distinct texts are memoized by detect_cached
+DETECT_CACHE_SIZE = 4096
+
+# Non-Latin scripts and the common languages written in them, most likely first.
+# Languages without an n-gram profile can only be guessed with SCRIPT_ONLY_CONFIDENCE:
+# Chinese, Arabic and Hindi are never detected offline (the backend is asked),
+# Cyrillic languages all have profiles so Russian and Ukrainian can be.
+SCRIPT_LANGUAGES = [
+    (re.compile(r"[぀-ヿｦ-ﾟ一-鿿]"), ("zh-cn", "ja")),  # Han and Kana
+    (re.compile(r"[؀-ۿݐ-ݿﭐ-﷿ﹰ-﻿]"), ("ar", "fa", "ur")),
+    (re.compile(r"[ऀ-ॿ]"), ("hi", "mr", "ne")),
+    (re.compile(r"[Ѐ-ӿ]"), ("ru", "uk", "bg", "sr", "mk", "be")),
+]
+
+# Kana are only used in Japanese
+_KANA = re.compile(r"[぀-ヿｦ-ﾟ]")
+
+_NON_LATIN_LANGUAGES = {lang for _, languages in SCRIPT_LANGUAGES for lang in languages}
+
+_WORD = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+
+def extract_ngrams(text: str) -> List[str]:
+    """Get character 1-, 2- and 3-grams of the words in text (words padded with spaces)"""
+    grams = []
+    for word in _WORD.findall(text.lower()):
+        padded = f" {word} "
+        grams.extend(word)
+        grams.extend(padded[i:i + 2] for i in range(len(padded) - 1))
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def build_profile(text: str, size: int = PROFILE_SIZE) -> List[str]:
+    """Get the size most frequent n-grams of text, most frequent first"""
+    counts = Counter(extract_ngrams(text))
+    return [gram for gram, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:size]]
+
+class LanguageIdentifier:
+    """Character n-gram language identifier (naive Bayes over Zipf-weighted profiles)"""
+
+    def __init__(self, profiles: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            profiles: "|"-joined ranked n-grams per language code, defaults to langid_profiles
+        """
+        self.logger = logging.getLogger(__name__)
+        self._profiles = profiles
+        self._languages: Tuple[str, ...] = ()
+        self._weights: Optional[Dict[str, Tuple[float, ...]]] = None
+        self._lock = threading.Lock()
+        self._detect_sample_cached = lru_cache(maxsize=DETECT_CACHE_SIZE)(self.detect)
+
+    def _load(self) -> Dict[str, Tuple[float, ...]]:
+        """Build the n-gram weight table on first use"""
+        if self._weights is None:
+            with self._lock:
+                if self._weights is None:
+                    profiles = self._profiles
+                    if profiles is None:
+                        from .langid_profiles import PROFILES as profiles
+                    languages = tuple(sorted(profiles))
+                    weights: Dict[str, List[float]] = {}
+                    for index, lang in enumerate(languages):
+                        for rank, gram in enumerate(profiles[lang].split("|")):
+                            weights.setdefault(gram, [_UNSEEN_WEIGHT] * len(languages))[index] = -math.log(rank + RANK_OFFSET)
+                    self._languages = languages
+                    self._weights = {gram: tuple(row) for gram, row in weights.items()}
+        return self._weights
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        """Language codes with an n-gram profile"""
+        self._load()
+        return self._languages
+
+    @staticmethod
+    def _script_candidates(text: str) -> Optional[Tuple[str, ...]]:
+        """Get languages allowed by the dominant non-Latin script, None for Latin text"""
+        best, best_count = None, 0
+        for pattern, languages in SCRIPT_LANGUAGES:
+            count = len(pattern.findall(text))
+            if count > best_count:
+                best, best_count = languages, count
+        if best is None:
+            return None
+        latin = sum(1 for char in text if char.isalpha() and char < "ɐ")
+        if best_count < latin:
+            return None
+        if "ja" in best and _KANA.search(text):
+            return ("ja",)
+        return best
+
+    def detect(self, text: str) -> Detection:
+        """
+        Detect the language of text
+
+        Returns:
+            Tuple of (language_code, confidence), (None, 0.0) if undecidable
+            or in none of the profiled languages
+        """
+        return self.detect_batch([text])[0]
+
+    def detect_cached(self, text: str) -> Detection:
+        """Like detect(), memoized on the scored start of text so long texts do not bloat the cache"""
+        return self._detect_sample_cached(text[:MAX_SCORED_CHARS])
+
+    def detect_batch(self, texts: Iterable[str]) -> List[Detection]:
+        """Detect the language of several texts, results in input order"""
+        weights = self._load()
+        results: Dict[str, Detection] = {}
+        ordered = []
+        for text in texts:
+            sample = text[:MAX_SCORED_CHARS]
+            if sample not in results:
+                results[sample] = self._detect_one(sample, weights)
+            ordered.append(results[sample])
+        return ordered
+
+    def _detect_one(self, text: str, weights: Dict[str, Tuple[float, ...]]) -> Detection:
+        candidates = self._script_candidates(text)
+        if candidates is not None and len(candidates) == 1:
+            return candidates[0], 1.0  # Script used by one language only
+        # Only a choice between profiled languages can be confident: a script
+        # shared with languages we have no profile for is just a guess
+        script_only = candidates is not None and any(lang not in self._languages for lang in candidates)
+        if script_only and not any(lang in self._languages for lang in candidates):
+            return candidates[0], SCRIPT_ONLY_CONFIDENCE
+
+        grams = Counter(extract_ngrams(text))
+        if sum(count for gram, count in grams.items() if len(gram) == 1) < MIN_LETTERS:
+            return None, 0.0
+
+        languages = self._languages
+        rows = []
+        for gram, count in grams.items():
+            row = weights.get(gram)
+            if row is not None:
+                rows.extend([row] * count)
+        if not rows:
+            return None, 0.0
+        # Column sums of the matched rows: one score per language
+        scores = [sum(column) for column in zip(*rows)]
+
+        if candidates is None:
+            # Latin script: exclude languages written in other scripts
+            candidates = tuple(lang for lang in languages if lang not in _NON_LATIN_LANGUAGES)
+        allowed = [index for index, lang in enumerate(languages) if lang in candidates]
+        if not allowed:
+            return None, 0.0
+
+        best = max(allowed, key=lambda index: scores[index])
+        if self._unexplained(grams, weights, best):
+            return None, 0.0
+        total = sum(math.exp((scores[index] - scores[best]) / SCORE_TEMPERATURE) for index in allowed)
+        confidence = 1.0 / total
+        return languages[best], min(confidence, SCRIPT_ONLY_CONFIDENCE) if script_only else confidence
+
+    @staticmethod
+    def _unexplained(grams: Counter, weights: Dict[str, Tuple[float, ...]], index: int) -> bool:
+        """Check if too many letters or n-grams of the text are missing from the profile at index"""
+        totals = [0, 0]  # letters, 2- and 3-grams
+        unseen = [0, 0]
+        for gram, count in grams.items():
+            kind = len(gram) > 1
+            totals[kind] += count
+            row = weights.get(gram)
+            if row is None or row[index] == _UNSEEN_WEIGHT:
+                unseen[kind] += count
+        return unseen[0] > MAX_UNSEEN_LETTERS * totals[0] or unseen[1] > MAX_UNSEEN_GRAMS * totals[1]
+
+def generate_profiles_module(corpus_dir: Path, size: int = PROFILE_SIZE) -> str:
+    """Build langid_profiles.py source from <code>.txt sample files"""
+    lines = [
+        '"""',
+        "Tranfastic Language Profiles Module",
+        "Ranked character n-gram profiles for langid (generated, do not edit)",
+        '"""',
+        "",
+        "PROFILES = {",
+    ]
+    for path in sorted(Path(corpus_dir).glob("*.txt")):
+        profile = "|".join(build_profile(path.read_text(encoding="utf-8"), size))
+        lines.append(f"    {path.stem!r}: {profile!r},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+# Global language identifier instance
+language_identifier = LanguageIdentifier()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "build":
+        print("usage: python -m src.core.langid build <corpus_dir>", file=sys.stderr)
+        sys.exit(2)
+    sys.stdout.write(generate_profiles_module(Path(sys.argv[2])))
@@ -0,0 +1,34 @@
+"""
+Tranfastic Language Profiles Module
+Ranked character n-gram profiles for langid (generated, do not edit)
+"""
+
+PROFILES = {
+    'af': 'e|i|n|a|r|t|s|d|e |o|ie|l|g|k|er| d|ie |u|n |t |di| di|m|s |r |die|v|w| v|in|an|h|aa|te| h| n|et|y| s|b|ee| o| m| t| e| w|en|et |k | k|st|ge|p|y |el|er |g |nd| b|on| g|de|at|we| a| ge|d |ek|ng|he|l |oe|ve| i|an |es|het|ing|le|ns|ri| he|at |be|da|en |ers|f|oo|re|rs|ste|as|ek |j|nde|ni|ver| en| j| ve| wa|is|it|m |te |wa| n | on|der|ei|is |ke|se| be| l| ni|eer|eu|it |ma|me|ng |or|ou|to|u |ur|va|wee| te| va| we|aar|ag|al|and|ar|hu|in |la|maa|nie|ns |nt|oor|ter|ui| ek| hu| is| jy| st|aan|ak|as |dat|dit|el |jy|jy |ka|li|ll|om|om |ons|op|rd|rin|rs |si|ta|tel|ul|van| da| in| kl| ko| ma| me| r| to|ak |ar |ges|ier|kan|kl|ko|mo|na|nd |ond|ou |p |rg|ro|ur |vi| as| ka| mo| om| sa| vi| vo|aak|ag |al |am|ed|ef|eg|erg|eri|eur|ga|gr|gs|hul|ik|le |lle|oe |or |ra|sa|sie|so|vo| aa| by| my| na| p| re| se| so| sy| u|aat|by|by |dag|de |eel|ein|em|ens|est|ete|f |ig|ir|ir |ku|laa|ld|met|my|my |nk|no|og|op |pr|sy|ti|toe|tr|ts|tu|ull|uu|vir|voo|wat|we |wi| al| br| hi| ho| jo| la| nu| oo| op| ou| pr| tr| vr| wi|aam|ad|am |bet|bl|br|eb|ees|eld|ele|end|erd|es |ev|ew|ewe|fe|hi|hie|ho|hoe|hui|i |ief|ig |ike|ind|ink|jo|jou|ke |ker|ki|lan|ld |lee|men|moe|ne|ngs|nin|nog|nst|nt |nu|oet|on |oon|ord|pa|pro|rda|re |rga|rst|saa|se |sk|sp|sta|stu|sy |tig|too|tre|tw|ty|tyd|uis|uur|vr|was|wer|yd|yd |ê| an| ba| de| do| ee| ei| ki| le| mô| no| ta| tw| ty| u |a |ade|af|ai|aie|ang|ant|asi|ass|ate|ba|bai|beg|bel|bes|bev|bri|deu|do|dr|ebl|edr|ee |eek|een|eet|ef |egi|ei |eie|eke|ela|ell|ema|eni|erb|erk|ern|esp|eun|eve|fi|gaa|gad|geb|ged|gee|gen|gew|gi|gin|gra|gri|gs |gst|gt|gti|id|ien|ies|il|il |ins|int|kin|kle|kli|kom|kui|leu|lie|lik|lin|lli|lo|ls|lt|ly|mi|mô|môr|na |ngr|nk |nse|nuw|oei|og |ont|ot|oue|pe|pp|ran|rb|rbe|rdi|ree|reg|rei|rek|rge|rie|rik|rk|rn|roe|rsk|sal|sek|son|ss|sê|sê |teu|tuu|twe|ud|ue|um|un|uw|uwe|vee|vie|waa|wil|win|wo|woo|yf|ê |ë|ô|ôr|ôre| af| am| bo| el| f| fi| ga| gr| ha| hy| ie| ja| ke| kn| ku| li| lu| ly| lê| mu| oe| pa| ri| ru| sn| sê| tu| ui| uu| vl| wo|aag|aal|aas|ad |ae|ae |af |afe|aga|agm|agw|aka|ale|all|alt|amo|amp|anb|ank|anm|ano|ans|ap|app|ard|arm|ast|ats|att|aw|awe|bed|beu|ble|bli|bly|bo|boe|bro|daa|dan|dd|dda|dee|det|dh|dhe|din|dok|don|dri|dry|ds|ds |du|dul|ebe|eda|eds|edu|eed|eeu|efe|efh|efo|egr|egs|egt|eid|eit|ekk|eku|eli|elk|els|eme|emi|ent|ep|epa|era|ere|erl|erp|err|erw|ese|esi|eso|esu|esê|ets|eu |eum|eva|eë|eël|fel|fen|fer|ff|ffi|fh|fhe|fie|fis|fo|foo|fs|fst|gaw|ge |geg|gel|gem|ger|gg|gge|gm|gmi|gro|gsp|gv|gve|gw|gwo|ha|haa|hei|hy|hy |id |idd|ied|iem|iet|if|if |igt|ik |iks|inn|io|ion|isi|ite|its|iv|ivi|ië|iën|ja|jaa|je|jek|kap|kee|kei|kel|ken|kie|kk|kke|kla|klo|kn|kno|kof|kon|kos|kou|ks|ks |kum|kur|kv|kve|lag|lde|lef|lei|lek|lem|lg|lge|lië|lk|lke|loe|lop|lp|lp |ls |lse|lta|lty|lu|lui|ly |lyk|lê|lêe|man|me |mel|mid|min|mon|mop|mot|mp|mpe|mu|mus|naa|nag|nal|nas|nb|nbe|nda|ndh|nee|nem|ner|nge|ngv|nik|nke|nki|nm|nme|nn|nne|nop|nsi|nta|nte|nti|nto|ntw|nuu|o |ob|obl|oef|oek|oep|oer|oev|of|off|ogg|ogr|oi|oit|oj|oje|ok|oku|ol|olg|ona|ooi|oop|opd|opp|ops|orh|os|os |ot |oto|oud|ow|owe|paa|pan|pas|pd|pda|pee|per|pi|pie|ppi|ppy|pre|ps|psi|py|py |raa|rae|ram|rd |rde|res|reë|rg |rh|rhu|rig|rit|riv|rk |rkv|rl|rla|rm|rma|rna|rne|rob|rog|roj|rou|rp|rp |rr|rri|rsl|ru|rug|rw|rwy|ry|ryf|seb|see|sel|seu|sew|sin|sio|ska|ske|sku|sl|sla|sn|sne|so |sou|sow|spa|spe|spr|sr|sre|sse|ssi|sti|sto|str|su|sul|syf|taa|tad|taf|tak|tal|tas|tat|tee|tei|tin|tor|tot|tra|ts |tsk|tsr|tst|tt|tte|tud|tui|twi|ud |udi|ue |uer|ug|ugs|ui |uie|uif|uin|uit|uld|ulp|ult|um |ume|un |uni|ure|urg|uri|us|use|ut|uts|uut|vak|vat|ven|vl|vlo|vol|vra|vri|vro|wag|wan|wel|wy|wyl|yfe|yfs|yk|yk |yl|yl |êe|êer|ël|ëls|ën|ënt',
+    'be': 'а|н|і|е|р|ы|с|к|з|я|л|д|в|п|ц|о|т|м|а |і |ра|у|ў|на| п|ь|ч| н| з|е |б|г|я |ь |ы | с|ш|ва|ка|ць| к|й|ць |э|ў | в| д|не| я|за|лі|та| ў|ад|дз|пр| і|ал|ас|да|па|ю| за| на|пра|у | г|ав|ам|ан|ж|х| пр|ац|ер|ні| б| м| па| і |ай|вы|й |лі |м |ст| ка|ар|аў|зе|ма|ны| а| не|ак|з |кі|ла|ле|на |не |о |пе|чы|ю | да| т| ч|ава|ае|дзе|ко|ль|нн|ца|ча|іц| вы| з | ў |аб|аз|ай |ен|кі |ня|пер|ры|ся|тр| л| р|ае |ач|ве|вы |га|гу|ера|зі|к |кал|мо|мі|ов|рэ|то|ты|ці|шт|як| пе| у| я | як|алі|бы|ван|ля|мі |рав|сл|сц|ся |т |та |то |х |чн|ым|ыя|ё|іць|ўс| ва| га| гэ| ра| ц| ча| ш| шт|аг|ап|ат|аць|ая|аў |ба|гэ|гэт|дзі|ед|ек|ем|зе |ку|ны |ол|рад|рам|с |ста|трэ|ф|ца |це|ці |чна|што|ыл|ым |ыц|ыя |ьк|ькі|эт|ін|іс|іх|іч| бы| ве| дз| ко| мо| ст| у | чы|адз|аж|анн|ары|ас |асл|аш|ая |б |во|ву|да |ем |ес|жн|зд|зн|ль |лю|ма |ме|н |ння|но|нт|ныя|овы|од|он|ор|ора|оў|ро|ск|сці|ул|ус|хо|цц|цца|чэ|ш |ша|ын|ыць|ьм|ьмі|ян|ік| ад| го| зн| ма| св| та| ф| х| ця| ян| ё|ад |ака|але|аль|ама|амо|ані|ара|аро|ачн|бр|бра|был|вер|вя|ві|гад|го|гу |д |дн|до|ду|ел|енн|еся|ец|жо|жы|за |заў|зв|зда|зіц|йн|ка |кн|ла |лас|лен|льк|мов|му|мы|мы |нае|най|нас|нне|ню|ні |ог|одз|пад|пш|пі|ра |раз|рак|рац|рэб|са|св|ска|сн|сп|сё|сі|таў|ту|ум|уст|уц|уць|ую|ую |фі|цы|ця|чэ |ых|э |эб|эты|іх |ічн|іў|ўся| аб| ап| б | дв| до| ж| зд| кн| кр| ла| лю| лі| но| ня| ні| рэ| са| ск| сп| су| тр| ты| фі| хо| яш| ёс| ін| іх| ўж| ўп| ўс|аб |аве|аві|агр|адп|ажн|аз |аза|азв|ак |аку|ала|аля|ам |аму|амі|ана|анц|аск|аст|ах|аце|ацц|ача|ачы|аша|аю|аі|аўл|аўс|аўт|ба |бл|бн|бу|буд|бы |бі|ва |важ|вай|вар|вац|вел|віц|га |гл|гор|гр|гра|гул|дае|дар|дас|дв|дзь|дна|дом|дп|дпр|ды|еда|едз|ека|ель|ент|ены|еп|епш|ерш|жа|жац|жна|жо |зам|зап|зас|зва|зец|зна|зь|зін|зіч|йна|йш|йша|каб|кав|каз|кан|кл|кол|кон|кр|кра|кт|леп|льм|лік|маг|мал|мен|мог|мор|му |нак|нам|нач|наш|ная|нек|нні|нов|нт |нта|нц|ню |ня |няў|нік|ніц|ніў|огу|ой|ой |оль|ом|оп|оў |пак|пал|пар|пры|раб|раг|ран|рас|раі|рш|ры |рые|рэч|се|сла|стр|су|сус|сць|так|тан|тар|тра|тым|тэ|уд|удз|уля|ума|фіз|ха|ход|це |цес|цый|час|чат|чу|чым|чын|чыц|шн|шч|шчэ|шы|ыв|ыву|ыг|ые|ый|ыйн|ыла|ылі|ыр|ыт|ыта|ых |эба|эта|эч|яд|яе|як |яку|які|яны|яр|яч|ячэ|яш|яшч|яў|яў |ён|ёс|ёсц|іж|із|ізі|ік |іл|іст|ію|ію |іў |ўж|ўжо|ўл|ўле|ўп|ўсё|ўт|ўтр| а | ал| ам| ба| бл| бо| бр| бу| бя| во| вя| гу| ду| ды| жо| жы| зв| зм| кл| ле| ме| мн| му| мы| мі| о| оф| пс| пы| пі| се| сл| см| сн| сы| ся| сё| сі| ту| тэ| ул| ус| фа| ха| ца| ці| яе| ён| ўб| ўв| ўк|абе|абл|абн|абр|абы|абі|аво|ага|агл|агу|ада|адк|адн|адо|адс|адт|аду|адч|аед|аек|ажа|ажы|азд|азн|айл|айн|айс|айц|ако|акт|акш|амп|амы|ане|аны|аню|апа|апе|апо|апу|апі|арт|асн|асц|асч|ася|ат |ата|атк|атр|аты|аха|ахо|аца|ацв|ацы|аці|ашн|ашт|аю |аюц|аяз|аіл|аін|бай|бац|бач|бе|бед|бле|блі|бна|бны|бо|бо |быў|бя|бяс|біц|біш|вае|ваз|вал|вас|ваю|ваў|вед|век|вов|вод|вой|вок|вум|вуц|вуч|вую|выв|выг|вын|вып|выр|вяж|вят|вяч|віл|г |гар|гат|гля|глі|гн|гні|гос|гун|гуц|даб|дав|дак|дап|дач|даў|два|дву|дж|джа|дзя|дк|дка|дні|доў|дс|дсю|дт|дтр|ду |дук|дум|дч|дчы|ды |дыз|еб|ебу|ег|ег |еду|ей|ейш|ек |ект|екі|елю|емс|ень|ер |ерв|ерс|еры|есл|еф|ефо|ецц|ець|еці|еш|ешт|ея|ея |еў|еў |жб|жба|жне|жны|жон|жы |жыв|жыц|жэ|жэй|заб|заз|зай|зал|зах|зач|звя|здж|зел|зем|зер|зея|зм|зме|зно|зні|зь |зьм|зя|зяк|йл|йла|йн |йс|йсц|йц|йце|каж|кай|кам|каш|клю|клі|кно|кны|кні|ков|кож|кой|коп|коў|кт |кты|ку |куй|кул|кум|кую|кц|кцы|кш|кш |кім|кіх|лав|лад|лац|лаў|ле |лед|лем|лер|леф|ло|ло |лу|луж|лы|лы |лю |люб|люд|люч|ля |ляв|ляд|лял|ляп|ляр|ліе|ліж|ліс|ліч|мач|маю|мая|ме |мес|мк|мкі|мн|мне|мп|мпа|мс|мст|муз|між|нав|над|нар|нах|нац|наў|неб|нег|ней|нем|нен|нес|неш|нк|нка|ноп|ноў|ну|ну |нца|нцы|нч|нчы|нш|ншу|ным|ных|нь|ньк|нюю|няд|няе|няй|ням|ніг|ніх|ніч|нія|ова|ову|ові',
+    'bg': 'а|е|и|о|т|а |р|н|с|в|д|е |к|и |п|з|м| с|л| п|я|о |на| д| н|ат|та|те|ъ| в| и|г|ра|пр|б|ре|ч|ва|то| к| пр|да|т |та |те |у|я |да |ет|ко| о|ж|за|но| да| з| м| т|от| на|ка| за|на |ни|ст|ш|ата|ов|се|си|ти|то |щ|ар|ед|по|ро|че| б| и | от| по|ве|до|ен|ва |га|ма| в | ко| се| си| ч|аз|в |де|ете|из|ит|ия|ли|не|х| р|ди|за |ин|ис|ите|ле|мо|ос|про|се |си |ц| до|еш|зи|им|ла|ме|ня|об|ог|од|ри| г| че|ак|ви|ез|ем|ени|ес|ия |й|м |ова|ор|пре|ря|сл|сн|тр|ф|че |ър|ят| е| из| ка| мо| не|ав|ад|аж|ан|во|въ|ек|ел|ер|ето|еше|же|ил|ма |ми|но |нов|от |пра|рат|ше|ше |ът| им| ре| ст| то|бе|бр|го|гр|гра|жн|иг|ина|ир|их|к |кат|къ|ни |ога|ол|ред|с |са|са |ста|тв|ти |тов|ча|ш |ът |ят | бе| е | ня| с | съ| те| у|ази|ай|ал|ас|ат |ати|ато|аш|беш|би|ван|вет|га |гат|д |дв|ди |доб|ещ|зи |ие|им |има|ич|й |ко |лед|ли |ля|нат|не |нос|ож|ои|ок|ост|ото|па|рав|рад|ск|сле|съ|тел|тн|ут|фи|х |ца|чи|ща|ще|ще | би| ве| вл| вс| гр| л| ли| ма| ме| ми| ни| но| ра| сл| та| тр| ф| щ| ще|ави|аг|ае|ажн|ара|аро|аса|ате|бв|бва|бл|вер|вл|во |вс|вър|два|де |до |док|др|еди|еме|ест|ец|еца|еч|ече|жа|жет|жно|зв|зе|зо|ик|ира|их |ият|ка |как|ки|ког|кол|л |лк|лко|ло|ля |мес|ми |мож|н |нет|ния|ня |няк|обр|ове|оди|оже|ой|олк|ом|он|оп|оре|отн|пи|по |под|при|пъ|раз|рв|рез|рек|рем|рж|рия|ру|ръ|ряб|сно|сти|тар|тно|тря|тт|тъ|утр|ха|ха |ца |ци|чет|ши|що|ъд|ърж|яб|ябв|як|яко| бл| ва| ви| вк| вр| въ| га| дв| де| ж| ин| ис| къ| мн| об| ос| пи| пъ| св| ср| ут| фи| ц| ча|аб|ад |ади|ай |акъ|али|ам|ана|ане|ап|апа|ари|аря|ач|аш |ащ|бих|бра|бре|важ|веч|вия|вк|вн|вр|вре|все|вя|гар|ги|ги |го |год|дем|дец|дин|дит|дн|дна|ду|дъ|дър|ед |едв|еде|едо|еж|ежд|езе|ези|ека|еки|еле|ели|ем |ент|есе|еск|ети|еща|ея|жа |жд|зап|зат|зн|зп|зпр|ив|ид|ие |изп|ил |ила|ило|иск|исл|ист|иче|иш|иш |каз|ки |кл|кои|кот|кт|ку|къщ|ла |лат|лез|лит|мат|ме |мен|мн|мно|мог|нае|най|нар|нач|наш|ние|ник|нит|ног|нт|нъ|нът|ово|ого|одо|ое|оз|ои |ой |ока|оръ|осн|отв|оти|оф|офи|оч|ощ|паз|пе|пор|пос|път|ра |раж|ре |рен|рет|рещ|ржа|рим|ров|род|рт|руг|ръч|ря |рят|св|сед|сет|ска|ско|сня|ср|сре|сте|стт|таз|тир|тре|тта|ту|тя|ув|уг|уга|уч|учи|час|чес|чк|ща |щат|що |ъде|ък|ък |ъп|ъпр|ъс|ъч|ъщ|ях|яха| а| ак| бр| бу| бъ| ги| го| ди| др| ду| дъ| ез| ек| же| жи| зд| зн| иг| кл| кн| кр| му| ну| оп| оф| ощ| па| пл| пс| ро| са| сн| со| су| ти| тъ| тя| ув| уп| фа| х| хо| цв| це| чи| я| я | ѝ| ѝ |або|абр|ава|аве|авъ|ага|аги|аго|ада|аде|аех|аеш|аещ|аж |ажа|аже|аза|азв|азн|азо|азр|азя|аи|аис|айл|айн|ак |ака|акв|ако|акт|ал |алъ|ама|ами|ан |ани|арв|аре|арт|асн|атв|ау|ауч|аф|афе|ах|ах |ац|аци|аче|ачи|аша|аши|аща|ащо|ая|ая |бед|бил|бич|бла|бле|бли|бн|бно|бо|бот|бря|бс|бст|бу|бут|бъ|бъд|вад|вар|ват|ваш|ващ|ве |вен|вея|вид|вил|вин|вит|вих|вку|вкъ|вла|вли|вля|вни|вно|вод|вои|вор|вси|въз|вън|въп|вяв|вях|г |газ|гл|гле|гн|гна|гот|гу|гур|дар|две|дд|ддр|дел|ден|дес|диз|дм|дми|дов|дой|дра|дру|дръ|дун|душ|дя|дях|едм|едн|ез |езо|езу|ект|екц|елн|еля|ема|еми|ена|ено|еня|еп|епо|ера|ерв|ере|ери|ерс|еря|ет |етв|еф|ефо|ех|еха|еш |ешн|ещ |ещо|ея |еят|ж |жав|жда|жду|жел|жен|жеш|жи|жив|жк|жка|жне|жни|з |заб|зав|зай|зак|зар|защ|зва|зво|звъ|зг|згл|зд|здр|зер|зет|зея|зз|ззв|зик|зин|зит|зич|зк|зка|зл|зле|зм|змо|зна|зни|зоп|зор|зоч|зр|зра|зс|зсл|зу|зул|зя|зя |ива|иве|ига|игн|иго|игр|игу|иде|идя|иен|иет|иза|изв|изг|изз|изи|изк|изл|изс|ии|ии |ик |ика|ико|ин |ини|инс|инъ|ио|ион|ип|ип |ири|ирм|иса|исм|исн|ито|ихи|ихт|иц|ица|ича|ичк|ищ|ищо|йд|йде|йл|йло|йн|йн |каж|кал|кар|каф|кв|кво|кип|кла|кли|кн|кни|кое|кой|ком|коп|кор|коя|кр|кра|кта|кто|кум|кус|кц|кци|къд|къс|кът|лаг|лад|лаж|лак|леж|лем|леф|лив|лие|лиз|лир|лн|лно|ло |лов|лож|лт|лта|лу|луч|лъ|лък|ляз|маг|мал|мас|меж|мир|мис|миц|мо |мол|мор|мощ|мп|мпа|му|муз|наг|наи|нам|нау|нах|нед|нен|нещ|ниг|нищ|нн|нна|нот',
+    'ca': "a|e|s|r|i|n|l|t|a |u|o|s |d|c|m|es|p|e | a|re| d| e| l|v|ar|r |en|es | p|de|q|qu| c|b|t | de|g|la|ar |el|l | s|n | q| qu|an|er|la |ta| la| v|se|st| t|ue| m|f|i |na|nt|que|ra| el|ci|in|u | i|al| n|'|de |em|tr|un| a |ca|co|eu|h|ia| co| f|el |en |pr|te| h| no| r| se|at|da|no|or|os|ue |ve| i | re|est|me|on|sa|va|al |eu |le|ll|na |ns|nt |pe|res|tre| pr| u| un|eg|gu|ia |ic|ls|ls |mp|ns |o |per|ra |re | al| ca| en| l'| pe|ac|am|as|di|els|l'|m |ma|pa|ri|si|ti|vi|í|ó|ó | am|'a|ba|com|ha|iu|ió|ió |mb|ni|om|ss|va |é| di| es| ha| ve|ab|amb|ant|at |av|b |egu|em |ent|et|fi|ie|ir|j|les|li|mb |nc|no |ost|po|sa |sta|str|ua|è| d'| fi| g| le| o| pa| te| tr| va| vo|aba|aci|ad|ai|aq|aqu|d'|da |dar|dr|ec|er |era|ga|im|is|lo|men|nd|ol|pre|pro|ren|ro|rs|rt|seu|so|tan|tra|un |una|ur|us|ut|vo|x|à|és|és | ab| b| em| fe| me| po| so| ta| vi|ans|ass|au|ban|bo|c |cia|d'a|del|des|eb|ei|emp|ers|fe|ge|ha |iar|ici|ies|il|ill|ina|ir |it|iu |lor|lt|mi|nar|ne|nos|nv|ny|ob|op|os |ot|ou|qua|tat|ues|ut |y|à |í |ò| an| aq| bo| do| he| in| ll| ma| mi| mo| mé| si| to|'e|ada|ana|ara|ard|ave|br|bre|cio|ció|cl|con|ct|do|dri|ed|eta|ev|fin|gr|gun|gur|he|ig|ime|int|io|ion|l'a|l'e|lar|lla|llo|man|mes|mil|mo|mpr|mà|mà |mé|més|nci|ng|nvi|omp|ona|ort|ou |par|pi|qui|rd|rec|reg|ret|reu|rn|rna|rr|rta|seg|ssa|ta |tar|te |tem|tes|to|ud|ui|ul|ure|us |ver|via|vos|è | cl| cr| ga| ge| hi| im| j| mu| ne| ob| op| sa| é| és|'ac|'aq|'es|'h|'i|'in|act|aig|alg|an |any|ap|arr|asa|aur|ava|bar|bl|bot|ca |cad|car|cas|cli|cos|cr|cre|cte|cu|d |dat|dem|dir|eda|emà|end|eng|env|eny|esa|ese|ess|eun|eus|eva|fo|fr|fre|g |ge |gra|hau|he |hi|hi |ho|ib|ic |ica|ien|ig |imp|inc|ini|ins|ip|ire|ist|ix|ja|ju|len|lg|lgu|lic|lle|lt |ma |mol|mpo|mps|mu|nal|nca|nda|ndr|nes|nic|nió|nou|nta|nte|ntr|obl|obr|oc|od|olt|om |oma|on |ons|ont|ope|ora|orn|pas|pia|pl|pod|por|pri|ps|ps |què|ras|rat|rav|reb|ria|rie|rm|rre|rs |rti|rà|rí|ríe|rò|sar|sem|sen|ses|set|sev|si |sis|sió|son|sse|ssi|st |ste|sti|tac|tal|tir|tiu|tor|ts|ts |tu|uan|uda|ued|uin|ula|um|ume|uni|urí|uè|uè |vai|var|ven|ves|vin|vis|vol|xe|xer|èn|ènc|é |íe|ís|ò |òp|òpi| ag| ai| aj| ap| ar| as| be| ci| cò| da| eq| er| fa| fr| fu| fí| gr| ho| ja| ju| ni| on| pl| pu| ri| s'| t'| té| x| xi|'an|'ap|'as|'ex|'ha|'ho|'o|'of|abi|aca|ade|adr|ae|aei|af|afè|ag|agr|ai |air|aix|aj|aju|ali|all|alt|alu|ama|ami|anc|and|ani|anv|apl|apr|are|ari|art|arà|ase|asl|atg|ati|atj|atr|ats|atí|aul|aus|avi|aí|aís|bal|be|beg|bi|bia|ble|bli|bo |boc|bu|but|bé|bé |bò|bò |cab|cac|caf|cal|can|cau|cc|cci|ce|ceb|ci |cic|cie|cin|cip|ciu|ciè|clo|col|cor|cs|cs |ctu|cum|cut|cò|còp|d'i|deb|dec|deu|di |dij|dim|dis|diu|div|doc|don|dos|dra|dre|dí|dí |eba|ebu|ebé|ebò|ec |ecc|ece|eco|ect|ed |ega|egi|egl|eia|eie|ein|eix|ell|elè|ema|emb|eme|enc|eni|ens|ep|epa|eq|equ|erc|erm|ern|erq|ert|erv|erò|esc|esu|et |eti|etm|eve|ex|exe|fa|fa |fei|fer|fes|feu|fic|fil|fit|fon|for|fu|fun|fè|fè |fí|fís|ga |gad|gai|gar|gav|gen|ger|gi|gin|gl|gle|grà|gua|gul|gut|gú|gú |hav|hem|ho |hor|ian|iba|ibr|ics|id|ida|if|ifr|iga|ij|ijo|ind|ine|inf|ing|ip |ipi|is |isi|iss|it |ita|itx|itz|iue|ium|iut|iv|ive|ixo|ixí|iè|ièn|ja |jar|je|jec|jo|jou|jud|jug|l'i|l'o|lad|lat|ld|ldr|leg|lem|lib|lid|lie|lit|lli|lls|lou|lta|ltr|lu|lut|lè|lèf|mai|mar|mat|mbo|me |mer|meu|mic|mos|mpa|mpt|mud|mus|nac|nav|ncl|ndi|nen|neu|nf|nfo|nge|ngu|ngú|nin|nir|niu|nst|nti|nts|nve|ny |nya|nyi|nys|oca|ocu|ode|odr|of|ofi|og|ogr|oj|oje|old|ole|olo|one|onv|opa|opc|or |ore|orm|orr|ors|osa|ose|ot |ote|oti|otó|ous|ov|ova|p |pac|pan|paí|pc|pci|pet|pie|pla|pli|pos|pot|prò|pt|pte|pu|puc|quí|rae|ram|rar|rc|rci|rd |rda|rdí|red|rei|rem|rep|rer|rib|rim|rin|riu|rme|rmà|rob|rog|roj|rop|rov|rq|rqu|rri|rse|rsi|rso|rv|rva|rà |ràc|rò |ròp|s'|s'h|sab|sal|sat|sc|scu|se |ser|sic",
+    'cs': 'e|o|a|t|n|s|i|l|d|v|k|m|e |p|r|u|í|z|a |j| s|h|c|y|ě|á| n|i |ž| p| z|st|b|o | d| v|í | m|u |li|te|č|ř| k|t | j| a| t|po| b|ch|la|ne|pr|se|ta|do|ko|le|na|ní|ro|é|š| do| ne| o|by|je| a |l |m |ov|ra|ý|že| by| pr|ed|ho|k |li |no|os|te |va|y |za|ů| na| po| se| za|al|de|ej|en|na |od|ou|s |se |to|ěl|ře| st|ak|at|dě|em|mě|ní |ou |sta|á | př|av|ce|h |it|ji|ka|la |lo|on|pro|př|rá|že | je| č| ž| že|at |ch |d |el|es|ic|ik|in|ma|ni|oh|ol|om|op|ost|ova|si|sl|tě|uj|v |vi|ys|é |ž | js| mě| r| v |ac|ar|az|ce |co|di|do |em |er|et|ež|il|it |js|kon|kt|lik|mi|mi |mo|mu|n |ná|ně|ob|ož|pra|rav|tr|tu|yl|át|ím|ý |čn|ěli|ři|ší| h| ko| si| sv| to| u| vy|an|as|byl|bys|co |dn|ek|ez|eč|ho |id|ja|je |jej|jí|jí |kd|ku|lé|ma |me|nov|nu|ok|or|ot|si |so|ste|sv|tí|ud|vat|vo|vy|vá|vě|yst|zi|zk|áte|áv|če|ě |ěj|ěl |ět|še|ší |ůl|ži| c| dě| ja| kd| l| mo| má| ně| ob| od| op| s | ta| ve| vl| ř|ad|ak |am|ač|cht|de |du|dy|děl|eji|ení|ep|epš|ev|ečn|ež |f|g|hl|hod|ht|ich|ik |ili|jak|jed|jic|jse|jš|jší|kl|kn|kol|ká|lep|lo |lá|mu |má|měl|mů|můž|nej|než|nos|nt|nu |odi|oj|oli|opr|pe|pře|pš|rv|sem|sla|sou|sí|ta |tal|tar|tl|to |tý|ve|vid|vl|vé|vý|yla|ze|zn|zp|áž|ém|íc|íh|ím |ít|ční|čt|ůž|žd| co| dv| dů| f| ho| i| ji| ka| kt| mi| mu| mů| ni| no| ná| re| rá| sc| te| tr| tý| vý| z | zk| zp| zá| zí| ča| čt| ře|ace|ah|akt|al |ali|alo|ap|arý|as |avi|azy|bl|byc|c |cho|chů|din|dl|dm|dne|dok|dom|dop|dp|dpo|dv|dy |dět|dů|důl|ec|ech|ed |ede|edn|ele|en |et |ete|eži|he|hov|hr|htě|hu|hů|hůz|ih|il |is|ič|jin|jso|ka |kaz|kdy|kla|kou|kte|ktu|ká |ké|ké |lat|le |led|lež|lož|lí|me |mn|my|mát|mě |měs|nc|nce|nes|nic|níh|ník|ný|ný |odp|ohl|oho|oje|oku|ole|ont|ory|osl|oř|ože|pi|pl|pol|pom|por|pos|při|re|ro |rod|ros|rot|rt|ry|ry |ráv|rý|sc|sch|sed|st |stn|stě|su|svá|sím|tak|tan|tel|ter|tk|tla|tn|tní|toh|tu |té|tí |těj|ud |uje|uji|uč|val|vit|vla|vá |ví|vš|yc|ych|yž|z |zko|zy|zá|zí|zít|ád|ál|ás|ému|ího|ík|ým|ým |ča|čas|či|čno|čí|ěc|ějš|ěk|ěn|ěs|ěte|ře |řed|řek|ři |řá|ří|št|ští|ůle|ůz|ůzk|ůže|žen|žit| ab| ak| al| ap| ba| be| br| bu| ch| de| dn| du| fi| fy| g| ga| he| hr| i | in| k | ke| kl| kn| kv| ká| le| li| lé| ma| me| mn| my| ok| os| ot| pi| pl| ro| sk| sn| so| sp| sy| tl| tě| uj| uk| ul| už| va| vi| vá| vš| vž| zd| ze| zi| zl| zm| zn| zů| ú| úč| če| čí| ří|ab|aby|aci|aco|ací|adu|adá|adě|ahr|ahu|ako|aké|akž|ala|ale|alé|ama|ami|amu|anc|ani|anu|aný|apl|apo|art|arv|ará|ase|ast|atr|atí|au|auč|av |avd|aví|avř|avš|azn|azu|azv|ačn|ačá|ačí|ař|aři|aš|aše|až|ažd|b |ba|bar|bc|bch|be|bez|bj|bje|bli|blé|bo|bor|br|bra|bs|bsa|bu|bud|by |byd|cel|cet|chn|ci|ci |ck|cké|cov|ct|ct |cí|cí |dej|del|dem|den|des|det|di |die|dič|dk|dky|dla|dlí|dmi|dmo|dná|dní|dos|dot|dr|dra|ds|dsu|du |duj|duš|dva|dvě|dyž|dá|dá |dí|dí |dý|dý |dě |děk|děn|ea|ea |edk|edm|edí|edě|ef|efo|ejb|ejd|ejl|ejn|ejí|ejš|ek |eka|ekl|ekt|eli|elk|eln|elá|eme|emě|emů|ena|eno|ent|ená|era|ero|erv|erz|eré|es |ese|esi|esl|est|esu|etl|evn|eví|evě|eze|ezi|ezn|ezp|eče|eř|eři|fi|fir|fo|fon|fy|fyz|ga|gar|gn|gn |gr|gra|hem|hes|hl |hle|hlá|hn|hna|hom|hra|hrá|hto|hu |huj|hy|hyb|ic |ice|ick|ide|idl|idm|idě|ie|ie |ig|ign|ihl|ihu|ij|ije|ika|ikd|ikn|im|ima|in |ina|ins|inu|iná|iné|ir|irm|is |ist|itý|itě|iv|ivo|iz|iza|iče|ičn|iž|ižš|jaz|jb|jbl|jd|jde|jek|ji |jis|jl|jle|jn|jno|jt|jte|kac|kan|kaž|kde|kdo|ke|ke |kli|kna|kni|kně|ko |kor|kov|kt |ku |kud|kuj|kum|kv|kvů|ky|ky |káv|kž|kže|lac|lak|lam|las|lač|lef|let|lez|leč|lid|liv|liz|liž|lk|lká|ln|lný|loh|lov|ly|ly |lás|lář|láž|lé |lém|lép|lév|lí |lím|mal|man|mc|mco|men|mez|mno|mně|moc|moh|mou|moř|mož|mt|mto|mus|muz|my |mys|má |měn|nak|nau|nav|naš|ne |nec|ned|nem|nen|nev|nih|nik|nil|nič|no |noh|nou|ns|nst|nta|ntr|ntu|nut|ny|ny |ná |nár|nás|náv',
+    'da': 'e|r|n|t|d|g|i|s|a|l|o|e |k|r |er|de|m|n |t |en|v| d|f|er |et|et |ge|en |g |b|h|u| s|te| de| h|or| f| v|og|p| a| b| m| t|d |in|le|re| e| i|ne|ed|nd|ke|me|st|ti| k|es|ig|il|de |vi|å|ø| o|l |og |y| vi|an|det|eg|i |s | og| p|ar|at|æ| g|j|be|fo|gen|il |kk|kke|nde|ne |ste|ve| fo| l| n| ti|der|el|for|he|je|ko|ll|on|se|si|ta|te |til|ør| at| i | me|af|ag|ar |at |den|di|le |ng|sk|å | af| ha| hv| ko|du|em|es |ha|hv|ik|li|lle|re | du| en| j| je|af |al|an |da|du |ed |ede|eg |f |ge |ikk|jeg|ke |mm|mme|res|rn|rs|u |vo| be| er| in| på| u|ad|am|dr|ga|ger|ing|is|ka|mo|nge|pr|på|på |ra|ro|ter|to|tt|tte|va|vor| di| he| ka| pr| r|bl|end|ere|ev|get|har|hed|id|ig |in |ind|ler|m |men|mi|nd |ns|nt|or |pro|rd|rg|ri|rt|ske|un|ver|vil| bl| et| fl| fø| ga| ge| ik| mi| mo| no| se| si| st| ta| to| ud| va| vo|age|bed|ble|br|dag|din|ds|ege|ens|ern|ers|est|fl|fø|før|gr|gt|ige|ill|io|ion|ir|kan|ker|kon|la|lig|me |med|no|nog|oge|om|ore|rin|rne|ru|ser|sin|sta|sy|sø|ud|und|v |var|æs|ør | bo| br| bø| fi| ny| næ| re| sk| så|a |ad |ag |all|and|ang|av|ave|bes|bo|bø|bør|dig|dre|edr|eds|ef|els|em |emm|enn|ev |fi|gan|gl|gle|gs|hvo|id |igt|ine|ken|ket|ku|ld|lev|lo|ls|ma|mor|na|nen|ner|nn|nne|ny|næ|od|ok|on |one|ont|ord|org|ort|pp|rb|rbe|rge|rm|rog|sen|så|så |ten|tet|tid|tio|ud |vi |yt|æl|ær|æst| al| an| bu| el| gr| hj| hu| ig| kl| la| li| læ| mu| mø| sa| sp| sy| sø| ve| å|ak|al |aml|amm|ap|app|ate|ati|bre|bu|des|dg|dga|dri|dst|ee|ek|ell|ene|erh|ett|fa|fe|ff|ffe|fir|fly|ft|fte|gam|gd|ged|gel|gg|gge|gh|ghe|gn|gra|gru|gt |gti|hav|hel|her|hj|hu|hva|hvi|igh|irk|is |isk|jek|k |kl|kom|ks|kt|lem|lli|lm|lse|lt|ly|lyt|læ|meg|mer|mig|min|ml|mle|mu|må|mø|mød|nes|ng |nst|nte|nto|nye|næs|o |ode|ogr|ol|old|omm|op|orb|ors|os|pe|po|por|ppo|ram|rdi|reg|ret|rh|rhe|rk|rsi|rte|run|ræ|sa|sig|sik|sko|sm|so|sp|ss|sti|su|søg|tag|tak|tal|tat|tel|tem|tig|to |tog|tor|ty|ug|uge|uk|ukk|ul|us|vad|ven|vet|vig|vir|vis|yd|yde|ye|yn|ys|ytt|yv|ål|år|år |ød|øde|øg|øge|ørg|ørn| ad| ar| by| bå| da| do| dr| ef| eg| fa| fy| fæ| gl| gø| kn| kr| ku| le| lo| lu| lø| ma| må| om| os| pe| ps| ra| ri| sn| su| sæ| te| tj| ty| tå| ug| un| y| yd| åb| år| æ| æn|ade|adg|adi|aff|aft|agd|agt|ak |akt|ale|alt|am |amo|anb|ara|arb|art|arv|bef|beg|bej|ber|bli|bn|bne|boe|bog|bor|bro|bru|bur|but|by|byd|bå|båd|da |dan|dat|dd|dda|ded|dee|deh|del|dem|di |dis|dl|dla|do|dok|dru|dsk|dsr|dt|dt |due|ea|eam|eet|eev|efa|efo|eft|egl|egn|egy|eh|eho|ej|ejd|ekk|ekt|el |elb|ele|eli|elm|eme|emt|ent|erf|eri|erm|ert|esi|esk|esu|esy|esø|eve|evn|fal|far|fe |fet|fil|fle|flo|fon|fr|fra|fy|fys|fæ|fær|gar|gda|gde|gem|ges|gn |gne|gsk|gsm|gst|gy|gyn|gø|gør|han|hen|hje|hjæ|ho|hol|hun|hus|hve|idd|ids|igd|igg|ign|ik |ile|ilk|ink|ins|int|ire|irm|ise|iss|iv|ive|jd|jde|jem|jæ|jæl|kaf|kal|ked|kel|ki|kis|kli|klo|kn|kna|kod|kol|kop|kos|kr|kræ|kse|kso|kt |kte|kuf|kum|kun|lad|lag|lan|lav|lb|lbr|lde|ldr|ldt|lef|leg|len|lik|lil|lin|liv|lk|lke|lmo|lmæ|lod|log|lok|lp|lp |lsk|lta|lti|lu|luk|lær|læs|lø|løb|ma |mad|man|mes|met|mh|mhe|mid|mod|mop|mot|mt|mt |mul|mus|mål|mån|mæ|mæs|nal|nap|nat|nb|nbe|nda|ndl|ndr|ndu|ned|nem|ngs|nk|nke|ns |nsi|nsm|nta|nyt|nå|når|nær|ob|obl|odi|oe|oet|ogg|ogl|ogs|oj|oje|okk|oks|oku|om |omh|ona|opd|opi|orl|orn|oræ|os |ost|ot|oti|p |pd|pda|pen|per|pi|pi |ppe|pri|ps|psy|pø|pør|ra |rag|ran|rap|rd |rda|rde|red|rer|rev|rf|rfr|rg |rgs|ris|rke|rks|rl|rla|rma|rme|rmi|rn |rna|rnå|rob|roj|ror|rs |rsd|rso|rst|rsø|rt |rtt|rtæ|rug|ruk|rv|rve|ræl|ræv|sag|sam|sd|sda|se |see|set|sio|sis|ska|sku|sma|små|sn|sne|som|son|spr|spø|sr|sre|sse|ssi|str|sty|sul|sup|syk|syn|sys|syv|sæ|sæt|søn|sør|tad|tar|tea|tik|tj|tje|tr|tra|tyr|tyv|tå|tål|tæ|tæl|udg|ue|uer|uf|uff|uli|ult|um|ume|un |up|upp|ur|urd|us |use|ut|uti|ve |ved|vid|vin|vn|vne|vok|ye |yes|yk|yki',
+    'de': 'e|n|s|i|r|t|a|n |d|h|e |en|u|en |l|er|c|g|ch|ie| d|m|b| s|r |s |o|w|de|t |te|ei|ge|in|es| w|k| e|er |ie |nd|un|be|f|ic| i|st| b|ich|se| m| u|as|ne|si|z| a|re|ss| z|ein| de| si|da|p|v| da| k|d |he|te |ch |h | g| un|das|nd |sie| v|al|an|der|di|die|it|m | di| n| zu|as |el|und|zu| be| ei| h|che|es |hr|ht|in |le|ng|sc|sch|u | f| ge|cht|gen|ha|me|ste|ä| wi|ar|g |li|lt|nde|on|wi|zu | ha|au|ine|nt|sse|ung|we|ü|ag|ass|bes|de |em|ern|et|hre|ig|is|nen|ns|or|rn|ten|um|us|ve|ver|wa| al| ic| in| ve|ab|at|eb|eh|eit|ht |it |l |ll|mi|nn|rt|ser|so|ta|tt| es| ih| l| mi| p| sc| so| we|abe|ben|den|des|ers|eu|fe|ier|ige|ih|ihr|ir|len|lte|ma|ng |ni|pr|ra|rs|sen|sp|ss |ti|um |vi|vie|wo|ö| an| au| bi| me| ni| se| vi|an |bi|eg|em |end|ess|he |hl|ieb|iel|ist|ke|ko|lie|nge|rb|rd|re |ren|ri|rn |st |ts|tte|ür| ka| ko| ma| ne| st| um| wa| wo|als|alt|ar |aus|br|ere|ese|et |f |ge |ges|hab|hen|her|hi|hr |ind|ir |itt|j|ka|ken|kl|la|lic|ls|ls |man|men|mit|na|neu|nic|oc|och|rbe|rde|rg|rge|rt |ru|sei|sic|sta|tag|ter|tu|uc|uch|ur|vo|war|wie|wir|ze|ß| ab| br| en| er| is| j| kl| kö| la| mo| pa| r| re| sp| t| wu| ze|ac|ach|ad|age|ah|and|be |ber|bit|bt|bt |chs|ck|cke|du|ed|ee|ege|el |elt|ent|erb|ert|est|etr|eue|fl|gel|ger|hat|hei|hn|hs|ick|im|je|kli|kö|lle|mm|mme|mo|ner|nn |nst|nte|o |ol|oll|on |or |pa|pe|res|rie|ro|run|son|spr|su|tel|tig|tr|ts |ue|uns|uss|vor|wei|wen|wu|zei|äc|äch| do| fa| fe| fl| fr| fü| ga| gi| hi| im| je| ki| le| mö| no| nä| pr| sa| te| uh| vo| wü| zw|ade|ag |al |all|am|am |ann|arb|art|ate|att|auc|auf|b |bet|bev|bl|bri|bs|chi|chl|chu|dat|do|ea|ebe|ec|ech|ede|ee |ef|ehe|ehr|eie|eig|eis|ek|ekt|ele|ell|ens|erg|erl|eru|esp|esu|ev|evo|ew|eß|fa|fen|ff|fr|fra|fü|für|ga|gar|geb|gi|gib|gn|gs|hal|hau|hic|hle|hm|hne|ho|hst|hte|hti|hu|hun|hä|ib|ibt|ieh|ies|ieß|il|imm|ing|ins|int|io|ion|ite|kan|ki|kin|kt|ku|kön|las|lei|llt|lo|lt |lu|mal|me |mei|mir|mor|mö|nat|ne |nem|nk|nne|nnt|no|noc|ns |nse|nä|näc|ob|of|oh|ona|onn|org|ort|os|pas|per|pre|pro|rag|rau|rec|reg|rer|rl|rne|rp|rst|rte|rü|sa|sag|se |seh|sol|ssi|sti|stu|tet|tri|tun|tw|twa|ud|ues|uf|uf |uh|uhr|up|urd|us |use|was|weg|wic|woh|wur|wü|wür|zi|zum|zw|än|ät|ön|önn|ür |ürd| am| ba| bu| bü| du| el| em| et| fi| he| ja| ku| li| mu| mü| pe| su| ti| up| wä| za| ä| än| ö| öf| ü| üb|aa|aar|abs|adt|af|aff|agn|ags|agt|ahl|ahn|ahr|alb|ale|anf|ank|anw|anz|ara|are|ast|at |ati|ats|au |ba|bah|bei|bew|bin|bis|ble|bli|bn|bni|bra|bru|bsc|bss|bu|buc|bü|bür|cha|chk|chm|chn|cho|chä|dan|dei|dem|det|dh|dhe|dok|don|dt|dt |dul|dun|dur|eam|ear|eb |ebl|ebn|ebs|ebt|edu|eer|ef |efo|egr|egu|ehl|ehm|eht|ei |eic|eil|eiß|elc|elm|eln|ema|eme|emp|ene|enn|era|erh|eri|erp|erv|esc|esh|esi|etw|eu |eum|eut|ewa|ewe|eße|eßt|far|fas|fe |fee|feh|fei|ffe|ffn|fi|fin|fli|flu|flä|fn|fne|fo|fon|ft|ftw|fä|fän|gea|ged|geg|gei|get|gew|gg|gge|gl|gli|gn |gna|gr|grü|gs |gsv|gt|gte|gu|gun|heu|hie|hil|hk|hke|hl |hli|hlo|hme|hmi|hnh|hob|hof|hse|hts|häl|hät|i |ied|ief|iem|ien|ig |ign|il |ilf|im |inl|inm|ird|irk|is |isc|iss|its|iß|iß |ja|jah|je |jed|jek|k |kaf|kal|kei|kle|koc|kom|kon|kor|kos|kt |ktu|kum|kun|kör|lad|lan|lb|lb |lc|lch|ld|ld |le |lef|lem|ler|lf|lfe|lin|lli|llu|lm|lmä|ln|ln |log|los|ltf|lts|lun|lus|lä|läc|mee|meh|mer|mic|mon|mp|mpf|mu|mus|mz|mzi|mä|mäß|möc|mög|mü|müs|nac|nal|ndh|ndu|nee|neh|net|nf|nfä|ngs|nh|nho|nie|nis|nk |nke|nl|nlo|nm|nma|nsc|nt |nta|nth|nto|nts|ntt|nw|nwe|nz|nzi|obe|obl|of |oft|og|ogg|ohl|ohn|oj|oje|ok|oku|om|omm|one|ons|ont|orr|oss|ost|ow|owo|paa|pd|pda|pei|pf|pfe|pi|pie|po|por|pp|ppo|pra|prü|pä|pät|rac|rad|rbr|rc|rch|rd |rek|rh|rhe|ric|rin|rk|rkl|rla|rli|rna|ro |rob|roj|rpe|rpr|rr|rre|rsc|rsi|rso|rsp|rta|rud|rv|rvi|rüf|rün|sem|seu|sh|sha|sig|sin|sio|sk|sko|sof|sow|spe|spi|spä|sst|ssw|ssy|suc|sun|sup|sv',
+    'en': "e|t|o|a|n|h|s|i|e |r|l| t|th|u|d|he| th|w|c|the|m|y|p|t |s |he |d | a|f|g|n | i| w|in|ou|re| s|an|r |b|er|en|or|to| c| f| o|y |k|on| b| y|at|ha|nd|o | h| m| yo|se|st|yo|you|ng|es| to| p|g |le|me|v| an| l|as|l |ng |to | r|nd |te|ea|ing|is|ll|nt|re |ti|ve|ar|ou |u |and|fo|h |it|ne|ul|ur|ee|il|ta| in| re|co|er |ho|k | d|al|be|ch|ed|ed |en |for|ld|ll |on |ro|se | be| co| ha|at |hi|in |lo|me |ow|w |wi| fo| n| wi|is |ld |om|pe|pl|st |wa|we| i | we|a |ca|et|her|i |our|ur | a | se|as |es |oo|op|us|ve | me| wa|ai|de|la|li|m |no|ot|av|est|f |fi|ge|ic|io|ion|mo|of|oul|ow |sh|th |tha|uld|wo| fi| g| ho| is| it|ave|ay|ck|ck |ec|hat|im|it |ke|le |lea|or |pen|ra|rs|ter|thi| ch| e| la| of| on| sh| so| wh|are|da|do|end|ere|ns|nt |ple|pr|si|so|ss|tio|was|wh| ca| do| lo| ne| op|ad|all|an |ate|ch |cl|di|eas|em|ent|han|ill|ith|ma|mp|nc|of |ol|po|pp|sta|un|ut|wit| bu| he| le| mo| mu| pl| st| u| wo|ab|ac|ain|ap|ase|ati|ay |bo|bu|day|ef|el|ep|ev|hav|his|mu|not|ok|ome|ook|ope|ore|os|oth|pa|res|rn|rt|ry|ry |su|tt|ue|we |x| al| at| de| no| pa| ta| te| ti|ag|ang|app|bl|cou|een|eve|ew|ew |fe|ft|ga|ge |how|ime|int|ir|ke |ly|ly |ne |one|ons|ot |ov|ove|pro|q|qu|rd|ri|te |tim|tin|tr|ts|ts |ull|up|use|ver|wil| bo| di| fr| im| pe| pr| pu| su| up|abl|ad |ail|ak|ake|al |ant|any|ba|bef|ble|can|ce|ce |com|ct|cu|ear|efo|eo|et |ey|fr|gh|has|hin|hou|id|if|ig|ile|imp|lat|lic|lu|men|mor|ns |ny|og|ort|oun|p |ph|por|pu|que|rea|rs |rt |sa|sho|tw|uc|ues|um|ut |wor|wou|ye|ys| af| ap| ar| ba| cl| fe| ga| gr| if| k| li| ma| my| ou| ph| q| qu| ri| sa| tr| tw| v|'|af|aft|age|am|ar |ass|au|aus|bec|bee|boo|but|cau|cha|che|clo|dep|des|din|doe|eat|eca|ee |eek|eet|eg|ei|ek|em |eop|ern|ers|eti|ett|ex|ey |fil|fir|fro|fte|fu|ful|get|ght|gi|gr|gu|had|hey|hil|hon|ht|ht |ica|ick|if |igh|ild|ins|ki|kin|log|mee|mpr|muc|my|my |ner|new|ni|nk|nn|nst|nta|nto|ny |ob|oc|oe|oes|ok |old|om |ont|opl|ord|orr|ost|own|pas|peo|pho|rd |ren|rep|rg|rm|rom|row|rr|see|sen|sev|she|sin|so |ss |sti|tal|tom|tte|ty|ty |uch|ud|und|unt|ure|ust|vi|wee|wha|whe|wn|wn |xe| ag| br| by| em| ev| fu| ge| kn| mi| nu| o'| ol| ot| ye|'c|'cl|ack|act|adi|aga|alm|am |anc|ank|ara|ard|art|ast|bac|be |br|by|by |cal|car|cat|chi|ci|cli|clu|col|con|cr|ct |cus|dat|den|dis|do |dr|dre|ds|ds |dy|dy |eal|eam|eck|eed|egi|eir|ek |ell|enc|ene|epe|epl|epo|eq|equ|era|ery|ess|eth|ext|fee|ff|fix|fou|gai|gar|ges|gin|go|gs|gs |gua|har|hea|hec|hed|hei|hen|hol|hom|hu|hur|ice|id |ida|ie|ik|ike|il |inc|inn|ir |irs|ise|iss|iv|ix|j|kn|ks|ks |lan|lar|ldr|led|les|let|lid|lik|lin|lli|lly|lm|lmo|loc|loo|low|ls|lt|lud|mai|mak|mer|mi|mon|mos|mov|mpo|mus|na|nce|nch|ncl|nda|nde|nds|ned|nee|nex|nge|ngu|nin|nk |nne|noo|now|nte|nts|nu|o'|o'c|oa|oad|ock|od|off|oki|oli|omo|omp|ong|oon|ork|orm|orn|ose|out|ows|pd|pda|per|pli|plo|ppl|ppo|pre|pt|pul|rai|ran|rde|rec|ree|reg|req|rge|rig|rk|rni|rno|rob|rov|rro|rsd|rst|rta|ru|rw|sav|sc|sd|sda|sit|som|sp|ssi|ssw|sto|sur|sw|swo|tab|tai|tak|tan|tar|tea|ted|tel|tes|thu|til|ton|tor|tra|try|tto|tu|two|ua|uag|ude|ue |ug|ui|um |upd|urs|utt|va|ven|wan|war|wen|wer|whi|wo |ws|ws |xes|xt|xt |yed|ys | ab| ac| as| av| cu| ei| el| en| ex| fa| fl| go| hi| j| ju| ke| lu| or| ow| ra| ro| ru| sc| sm| sn| sp| sy| un| us| va| ve| vi| wr|'t|'t |ab |abo|acc|ach|adm|aid|alt|alu|alw|ame|an'|ann|ano|ap |arg|arn|ars|ask|atc|ath|att|atu|ava|ax|axe|aye|ayi|ays|b |bab|bat|beg|ber|bes|bet|bly|bod|bot|bou|bra|bro|bug|bui|bus|cc|cco|cho|cia|cis|cof|coo|cor|cos|cre|cro|cte|cti|cum|cur|cy|cy |ded|der|det|did|diu|dl|dle|dm|dma|doc|doo|dow|ea |eac|ead|eav|eci|eco|ect|ecu|eel|eem|eft|efu|egu|eig|eke|el |ele|elp|els|ema|eme|emp|ems|eon|erc|erf|erg|erw|ese|esi|esp|esu|eta|eu|eum|evi|exe|eys|fa|fai|fe |fea|few|ffe|ffi|fic|fin|fl|flo|fol",
+    'es': 'e|a|o|r|n|s|i|d|a |t|l|u|c|e |o |s |m|p| e|n |es|ar|en| c| d|de| p|v| l| a|re|as| de| s|la|ue|er| m|l |nt|r |ra|an|g|de |q|qu|ta|os| t|el|na|os |í| la|ie|st|te|ci|el |y| q| qu|as |b|la |on|or|se| el| n|co|est|me|tr|ad|da|do|h|que|un|ó| v|ar |en | co|ca|es |po|ve|y |ía| en| es| h| r|al|in|j|ma|sa|ue | re| y| y |do |f|io|na |nte|pr|ía | me| ve|ac|ant|ia|nd|pa|ro|ti|tra|ón| pa|con|eg|em|gu|ien|ra |rí|si|sta|to| ca| ha| i| pr| se| u| un|ha|lo|no|su|te |vi|é|ñ|ón | lo| o| su|ab|cu|di|end|ent|ic|id|ió|ión|mi|or |por|res|ri|ría|se | al| an| cu| f| nu| po|aci|ana|ce|cio|ec|ev|im|jo|li|mp|ne|ni|no |nu|pe|sa |so|ta |to |us|vo|á|é | a | in| mu| pe| ti|ado|al |an |ara|ed|ej|ga|las|le|los|me |mo|mu|nta|nue|om|on |op|par|pre|rd|re |ren|ro |rt|tar|tes|tie|ues|un |z| g| ma| no| si| so| te| tr|aba|ada|am|ard|asa|ay|añ|ba|cas|cia|d |da |dad|dar|dr|egu|ejo|emp|ez|go|i |iar|ici|io |ion|is|iv|jor|ll|ma |mej|mpo|nc|nto|od|ona|ot|per|qui|ras|rm|rs|str|sus|tan|tro|u |ua|ud|ued|ui|una|us |va|vo |ña|ño| ce| do| j| ll| mi| ot| sa| ta| to|ad |alg|ase|at|av|aña|bi|br|ca |cer|ch|ció|cl|ct|deb|del|drí|eb|ema|ene|eq|equ|era|ere|ers|esa|ese|ez |eñ|gun|ho|ias|ido|iem|ier|ivo|lg|lle|mañ|men|mos|nad|nas|ndo|ntr|nv|oc|ont|ora|ort|otr|pi|pia|po |pro|rc|rec|reg|rta|seg|son|su |ter|tu|uev|uie|ver|vez|ye|z |ñan|ó |ú| ap| as| b| cl| di| gu| he| im| ju| má| na| ni| op| pu| va| vi|abí|act|ag|aj|ali|amo|ap|are|ari|arí|atr|ay |ban|be|ber|bo|bre|bí|bía|cho|cli|co |com|cto|cua|cue|cuá|das|dec|des|dio|dos|dé|dé |dí|dó|ebe|ece|ei|ein|env|eo|eo |ep|erc|erm|ero|erí|eu|eun|eve|evo|eño|fi|fo|gar|go |gr|gra|gur|ha |hac|hay|he|hi|ho |ia |ica|ida|ig|ij|ijo|ima|imp|ina|inc|ini|int|ip|ir|ir |je|ju|lar|leg|lgu|lic|lo |lt|lu|man|mb|mer|mes|mi |mie|min|mo |mpr|muc|má|más|nci|nda|nde|ne |nes|ng|nic|nió|nos|nvi|ob|oda|odr|of|ol|oma|one|opi|pas|pc|pci|pl|pod|pri|pu|pue|qué|rab|rad|rar|rda|rde|reu|rid|rio|rme|rn|ros|rr|rso|río|sal|sar|sem|señ|si |sie|sió|ste|tac|tal|tiv|tod|tre|uc|uch|uda|ul|uni|ur|uri|uá|ué|ué |var|ve |ven|via|vie|vis|á |ás|ás |í |ío|ío |ís|ño |ños| ab| ac| ag| am| aq| ar| at| ay| añ| bi| bo| cr| có| dí| dó| ej| em| eq| er| fa| fe| fi| fr| fu| fí| ga| gr| hi| ho| id| ja| le| li| ne| nú| of| ol| pl| pó| rí| tu| ú| úl|abr|ace|ací|ade|adi|adr|af|afé|aga|agr|aje|ajé|ala|alu|amb|ami|and|ano|apl|apr|aq|aqu|arc|arm|arn|ars|art|ará|asc|asi|asl|así|ati|avi|avo|aví|aya|ayu|aí|aís|año|ba |baj|bid|bie|bio|bl|ble|boc|bot|bro|c |cac|cad|caf|cam|can|car|cc|cci|ce |cen|cep|chi|cic|cie|cin|cip|cir|clu|col|cop|cor|cr|cre|ctu|cum|cí|cía|có|cóm|dav|der|dez|did|die|dij|dim|dis|doc|dom|dre|día|dín|dó |dón|ebi|ecc|eci|eco|ect|eda|ede|edi|edo|edé|ega|egl|ego|egó|egú|eje|ell|elé|emb|emo|ena|enc|epa|epc|er |erd|eri|erl|ern|err|ert|erv|esd|esi|esp|esu|et|ete|eva|evi|ey|eye|ezc|eí|eía|eña|fa|fav|fe|fes|fic|fin|fon|for|fr|frí|ft|ftw|fu|fun|fé|fé |fí|fís|ga |gab|gas|gl|gla|goc|gos|gua|gul|guo|gus|gó|gó |gú|gúr|hab|hag|he |her|hij|hiv|hor|ian|ib|ibr|ic |idi|idé|ie |ies|iet|iev|igo|igu|ime|imi|in |inf|ing|ins|iom|ior|ios|ipi|ipo|isa|ise|isi|ist|it|ita|ivi|iz|iza|iñ|iño|ja|jar|je |jer|jo |jos|jue|jug|jé|jé |lad|lay|lem|lev|ley|lgo|lib|lie|lir|liz|lla|lor|lta|lti|lud|luy|lv|lvi|lé|léf|mad|mar|mas|mbi|mbo|mig|mud|mue|mus|nac|nal|nar|nca|ncl|ndi|ndr|ndó|neg|nem|nf|nfo|nga|ngo|nie|niñ|ns|nst|nti|nun|nve|nó|nó |nú|núm|obl|obr|oca|oci|ocu|ofi|oft|olo|olv|ome|omi|omo|ono|onv|onó|opc|ope|opo|ore|orm|orq|orr|osa|otó|oy|oye|pac|pad|paí|ped|peq|pla|pli|pos|pró|pó|pón|quí|rac|raj|ran|rat|rav|rca|rch|rci|rdí|rei|reo|rep|req|rev|ria|rim|rin|rl|rla|rma|rmi|rna|rno|rob|rop|roy|rq|rqu|rra|rre|rse|rsi|rte|rti|rv|rva|rá|rá |ró|róx|sab|sad|sc|sco|sd|sde|seo|ser|ses|sic|sis|sit|sl|sla|sob|sof|sop|sp|spo|sti|stu|stá',
+    'fi': 'a|i|t|n|e|s|ä|k|l|o|u|n |a |m|en|ta|v|ä | k|r|p|h|tä|y|j|si| t|i |in|an|en |is|tt|st|ll| o|se| m| v|it|ka|ta |aa|el|t | s|ki| j| p|d|mi|e |et|sa|tä |än|ää| l|un|va| e|ai|as|in |le|li|to|ut| a|al|ei|ko|ks|on| h|ii|ik|ist|ja|ne|nn|oi|sta|ti|än | ka|la|ss|ttä|ar|ett|he|me|ns|pa|te|us|uu| va|aa |at|ku|kä|na|nu|on |os|sa |si |sä|vä|ak|an |au|de|ell|ie|jo|ke|lle|lä|nen|nt|ol|uk|yt| ja| ku| mi| on| tä| u|im|iv|ja |kse|mm|mu|ra|tu| en| jo| n| ol| pa|ee|em|ia|id|ma|mis|mä|ok|ot|s |ssa|sä |taa|tää|vi|äi|ää |ö| he| ki| lä| si| ta|ap|at |enn|er|es|ha|il|ir|ivä|le |lla|lu|ni|nta|pä|rj|sk|tta|ty|uo|ytt|äy| ko| me| mu| ti| to| uu|all|ans|dä|dän|et |ht|hä|ia |isi|itä|je|kaa|kan|ksi|kun|ky|kä |la |lm|lo|lt|läh|mme|na |nä|par|pi|sen|sit|ssä|stä|su|uks|ul|un |ut |äh|äl|är|äs|ään| ai| as| ei| et| i| kä| la| nä| r| ra| tu| vi| y|aan|ah|aik|ain|ara|asi|aut|del|den|een|eid|eli|emm|ens|ent|idä|ine|inu|irj|iss|itt|kir|kk|len|li |lin|lis|lj|lli|me |min|muu|nk|nne|nsa|nut|o |ois|oli|op|or|pu|re|rja|rt|sia|tel|ten|tie|tii|tk|ust|uut|van|vat|ve|vo|ys|yy|äyt| hä| ke| lu| sa| se| su| vo|aki|aks|anh|ann|aps|auk|eit|elm|g|hd|hän|ih|iik|iin|ika|ikk|ill|imi|imm|jok|jä|kai|ki |ko |kui|käy|lee|lmi|lta|lä |mei|men|ng|nh|ni |nna|nss|oi |oit|ole|om|ota|ov|pp|ps|päi|pää|ran|ri|rk|rs|rv|sem|ses|set|sin|so|ste|sto|tal|toi|ua|ud|ude|ui|uin|una|unt|uta|uud|uus|var|vie|voi|vu|vät|y |yh|ähe|äiv|äk|ät|äv| au| ha| hu| il| ju| ky| ma| ov| pe| pi| pu| pä| so| sä| ve| yh|ais|alj|alo|alu|am|anu|arm|as |ase|asu|ati|aup|av|da|da |do|ea|ee |ei |eik|ek|elj|ene|enk|ert|esi|est|ey|eyt|ge|gel|hal|han|hde|he |hei|hen|het|hi|hin|hu|huo|iak|ide|iel|ien|iet|iim|iit|ikä|ina|io|ise|ita|itk|ity|jau|jon|jot|ju|kah|kas|kau|ker|kii|kin|kis|kiv|kki|kok|kos|kou|lap|las|ljo|llä|lmä|ltä|lua|luk|maa|mii|mit|mma|mp|mä |mää|nat|nge|nha|nkä|nni|nnu|no|nsi|nsä|nul|nun|näy|oa|od|ode|oh|oki|oko|oks|opp|os |osi|osk|ost|ou|ous|ova|pal|pe|pse|rit|rje|rke|rm|rsi|rta|saa|san|se |sei|sii|sim|sis|ska|ske|soi|sun|suo|sy|sää|tai|tak|tan|tap|tar|tas|til|tko|tod|tos|tot|tte|tty|tul|tyy|tär|täs|täv|tö|ua |uki|ull|uom|up|use|usi|usk|uto|utt|vai|vel|väl|vän|vää|yht|yk|ym|yy |yö|äin|äis|äks|äll|ält|äm|äp|ärk|äse|äss|ät |ävä|ääs| aa| al| ar| av| f| fy| ih| ik| jä| le| li| lo| my| na| ne| ni| oh| om| op| os| ot| pr| py| pö| te| ty| ul| un| us| vu| vä| yr| ys|aad|aah|aak|aam|aas|aat|ad|ada|aha|ahd|aht|ahv|ai |aid|aih|aim|ait|aka|akk|ako|ala|alm|alt|ami|amu|ana|ani|ano|ant|apa|apo|apä|are|arh|ari|ark|arv|asa|ask|ass|ast|asv|ata|att|ava|avu|det|doi|dos|eaa|eas|ed|edo|eet|eh|ehd|eil|eis|eiv|ekt|ekä|ele|elä|ema|emp|emä|eng|eni|eo|eoo|ere|ers|eru|erv|es |ess|eto|eä|eäm|f|fy|fyy|gi|gin|ha |has|hdo|hel|hem|hes|hj|hje|hm|hmi|hta|hte|hti|hto|htu|hv|hvi|häp|häs|ida|iea|ied|iem|ihi|ihm|iht|ii |iid|iir|ij|ija|ike|iko|iks|iku|iky|ila|ili|ilt|imo|imu|ini|ink|inn|inv|ioi|ion|irr|irt|isy|isä|it |ite|iti|ito|its|itu|iva|ivi|iö|iö |jaa|jal|jan|je |jek|jel|jen|jes|joi|jos|jun|juo|jäi|jäl|jär|ka |kak|kea|kee|kei|kel|ken|ket|keä|kia|kie|kim|kit|kka|kku|koa|kol|kop|kor|kot|ksa|kt|kti|kuk|kuu|kyk|kyl|kym|kyp|kys|kär|kää|lai|lal|lau|lei|lel|lii|lij|lil|lje|ljä|lk|lko|llo|llu|lo |loi|lok|lop|los|lun|luv|läp|ma |mak|mal|man|mat|mer|mia|mih|mik|mmä|mo|mon|mpa|mpä|muk|mun|mus|mut|my|myö|mäi|mäk|män|nal|nan|nap|nee|nel|nem|nes|ngi|nhe|nii|nik|nis|nki|nko|nny|nnö|noh|noi|nte|ntä|ntö|nuk|nus|nv|nvä|ny|nyt|nä |näi|näk|nö|nöl|oa |oas|oe|oeh|ohj|oht|oid|oim|oiv|oj|oje|oka|oll|olt|oma|ome|omi|ong|onk|ons|onu|oo|oon|opi|opä|ori|orj|ors|ort|oso|oss|ote|oti|ott|otu|ove|pa |pah|pai|pan|per|pet|pi |pie|pim|pio|pit|po|por|ppa|ppi|ppu|pr|pro|psa|pua|puh|pun|puu|py|pyh|pö|pöy|rak|rap|ras|rat|rau|ree|rei|rem|ret|rh|rha|ris|rki|rmi|rmu|ro|roj|rr|rre|rst|rti|rto|ru|rus|rva|rve|rvo|sai|sal|sau',
+    'fr': "e|a|s|r|n|i|e |t|u|l|o|s |d|p|c|m| l|t | d|v|re|é|le| p|en|er|on|es|n |de|ou|nt|r | a|ai|q|qu|an| c| s|a | de| e| le| v|es |le |ue| m|'|ie|ur|f|que|re | q| qu|er |la| la|et|nt |is|j|ne|co|la |ns|se|te| j| r|de |g|tr|ue |us|ve| t|eu|il|io|it|ma|ns |on |pr|ta|u |vo| n|ent|et |in|me| et| f|b|h|ion|ne |or|us |é | co| vo|ant|av|ll|pa|ra|ri|rs|ti|un| i| pa|au|lle|nd|st|tre|ar|as|at|ce|i |ien|it |li|ous|pe|se |si|ur |è| av| en| pe| pr| u| un|em|ez|ez |is |je|les|nc|no|our|po|so|tio|z|z | il| je| no| se| à| à |'a|ait|ati|ce |ch|ci|di|ec|eur|ons|pl|res|ro|rs |ré|son|té|ui|vou|à|à |ét| a | du| l'| me| mo| re|ais|ans|au |ava|com|da|dan|du|du |dé|el|est|ic|ill|in |l |l'|mai|mo|mp|oi|om|pas|sa|su|te |té |va|vi|y| b| d'| da| ma| ne| po| ré| tr| vi|'e|al|ap|ass|ave|cor|d'|ea|eau|end|ers|il |im|je |man|me |nou|pou|pre|pro|rai|ren|rie|rr|ss|ter|un |urs|ut|uv|vr| ce| dé| o| pl| sa| so| su| ve| é|aie|ain|anc|and|app|bl|ca|ct|d |dev|dr|en |enc|ev|fi|fo|ga|ge|he|iez|jo|jou|leu|lu|lus|men|mi|mm|mé|nn|oc|onn|ore|ot|ouv|plu|pp|rer|rè|sur|tan|to|ts|ts |tt|uel|ul|une|ure|uve|van|x|èr|ère|ée| au| ch| di| fe| fo| g| h| j'| jo| te| to| ét|'ai|'i|'é|'ét|ag|am|ard|as |bu|c |cie|der|des|ec |ect|ei|ell|ema|ep|ett|fa|fe|fr|gar|ha|id|ier|if|ils|ine|iè|ièr|ié|j'|j'a|l'a|lo|ls|ls |mon|na|nce|nco|nde|ndr|ni|nne|nts|ois|omm|ont|ort|os|otr|par|per|por|pt|qui|rc|rd|rec|rm|rre|rt|ser|st |sé|tai|tra|tte|ua|ud|vec|ver|veu|ys|ée |él|ép|éta|été| ai| al| am| ap| be| bu| c'| ca| cl| es| fi| fr| ga| he| im| ja| li| mi| ou| ri| si|'ap|'en|'ex|ab|ac|age|ai |aim|ale|all|amé|aq|aqu|ara|are|be|bea|bi|ble|c'|cat|cha|che|chi|ci |cl|cli|con|cou|cte|cu|d'i|dem|di |dra|dre|dém|eg|eil|elq|emp|enf|ens|env|erc|erm|ern|eui|eux|evr|ex|fan|fic|foi|fé|ge |gi|gu|he |heu|hi|ho|ica|ici|ie |ifi|ig|ime|imp|ior|iq|iqu|isa|ise|iso|ist|ite|iv|ié |ja|jet|l'e|ler|lez|lie|lio|lq|lqu|lé|mb|mer|mma|mme|mpo|mps|mél|nd |ner|nf|nfa|ng|nio|not|nta|nte|ntr|nv|nvo|och|omp|op|orr|os |out|oy|pen|peu|ph|ppr|pré|ps|ps |qu'|qua|rav|rci|rn|roc|rri|rso|rta|rès|rés|réu|sai|sem|sin|sse|sta|tal|tat|tem|tes|ton|tou|u'|ues|uil|uis|ule|uni|urr|ux|ux |vai|vea|vie|vos|voy|vre|vri|x |èm|ème|ès|ès |éc|éli|ém|ér|éri|és|éu|éun| an| as| bo| do| dî| el| fa| fé| ge| ha| in| lo| m'| mu| n'| op| où| ph| ra| rè| s'| sy| sé| t | ta| té| vr| vé| éq|'an|'as|'es|'ic|'il|'in|'o|'on|'u|'un|'y|'y |abi|abl|act|acé|af|afé|aga|aid|ail|alo|ama|ang|apr|arc|arr|asi|atr|ats|auc|aus|aut|auv|ay|ays|bie|bit|bli|blè|bo|bou|bu |bur|but|c'e|c'é|caf|cau|ces|cet|cho|cic|cié|coû|ct |cti|cum|cur|cé|cée|d'a|d'e|d'u|dep|deu|dif|dim|din|dir|dit|do|doc|déb|dée|dép|déç|dî|dîn|eco|ed|edé|ega|egi|eig|el |emb|emi|emm|enr|enu|enê|epr|ept|epu|era|erf|eri|erv|esi|esq|eta|eti|eud|eul|eut|eve|evo|exe|exp|fai|fem|fen|fer|ff|ffr|fie|fin|fon|for|fre|fro|frè|fé |fér|gas|gen|ger|gic|gis|gl|gle|gn|gn |gt|gt |gue|gul|hab|hai|haq|hie|hif|hon|hos|hy|hys|ice|ich|id |ide|idi|iei|iel|ieu|iff|ige|ign|ima|ing|ino|ins|int|ip|ipe|ir|ire|isi|ita|itt|ité|ivi|ivr|iét|jam|jar|jeu|l'é|lac|lan|laq|len|let|lic|liq|lis|liv|lié|llé|log|loi|lor|lt|lta|lè|lèm|lé |lép|m'|m'e|mag|mar|mat|mbi|mbl|mei|mes|mid|min|mis|miè|mod|moi|mot|mpr|mpt|mu|mus|mée|mén|n'|n'y|nag|nal|nat|nch|nci|nda|ndé|nec|nei|nes|ngt|ngu|niè|nné|non|nr|nre|nse|nst|nté|nu|nue|né|né |nê|nêt|ob|obl|oci|ocu|od|odi|og|ogi|oi |oid|oit|oj|oje|omb|ona|ond|one|opr|opt|ora|orm|ors|ose|ot |oua|oub|oud|ouj|oul|oup|oya|oye|où|où |oû|oût|p |pat|pay|pe |pet|pho|phy|pla|pli|plo|ppl|ppo|pri|prè|pt |pte|pti|pu|pui|ra |rag|rap|rat|rce|rd |rde|rdi|rea|red|reg|rem|rep|ret|rf|rfo|rif|rio|ris|rit|riv|rié|rma|rmi|rmé|rna|rni|rob|roi|roj|rop|rou|rse|rsi|rt |rv|rve|règ|rèr|réc|rég|rép|s'|s'é|sa |san|sau|sav|sep|ses|si |sie|sig|sio|siq",
+    'hr': 'i|a|o|e|j|n|r|t|s|u|a |i |k|l|v|e |p|je|d|m|o | p| s|u | n|z|ra| i|b|g|li|na|pr|je |ij|ti| k|ko| pr|po|ov| d| po|ni|re|š|ž| j| na|it|no|st|ti | o|ta|vi|vo| m| u|ije|ka|ma|ri|ro|te| je| t|at|ja|nj|od|oj|va|č| b| i |ju|lj|mo|se| z|an|el|la|li |ne|os|ć| r| v|ak|av|da|en|h|im|na | ko| ne| sa| se| u |al|bi|em|ik|ja |ju |ko |m |ma |ol|sa|su|te |tr| bi| su|ar|ati|ek|er|ih|is|og|or|pro|se |to|za| mo| za|ad|am|d |do|ed|et|gu|iti|k |ku|lo|no |ovo|rij|sn|sta|t |če| do| g|až|bo|c|da |di|g |go|il|ima|in|io|io |ka |n |nov|pri|sl|vr|št|že| a| da| ka| l| re| st| sv|aj|ali|anj|as|az|dj|dje|es|ez|h |ih |ite|ji|la |le|lik|lje|ne |nja|nje|ob|ovi|rav|ru|s |su |sv|to |tv|ut|voj|zi|ći|ći |ži| im| od| ž|ako|am |avi|bis|de|dr|elj|ig|iju|ir|ist|iz|j |jek|jel|jen|kol|me|mi|mo |nij|od |og |oj |ok|oli|om|on|op|ot|pi|pos|pra|pre|si|sni|ta |ur|vj|vje|vo |ze|će|će | iz| li| mi| ni| nj| os| ov| ra| s | tj| tr| vr| č| š| št| že|ak |ala|ao|ao |ap|ara|ava|aš|ba|bol|br|ci|cij|dn|dv|eb|ec|eda|eg|ele|eli|ema|enj|ese|eć|eš|gr|gra|gu |igu|ija|ika|iko|ilo|im |ina|ira|ita|jer|jez|ki|kl|kn|koj|kr|ku |lij|lju|lo |mož|naj|nji|nos|nu|odi|oje|olj|osl|osn|ovj|oz|ož|ože|pe|pl|pod|pu|ran|rat|reb|rem|ri |rn|rno|rov|rt|sam|sla|ste|svo|tan|tel|tit|tj|tje|tra|tre|ul|un|us|utr|uć|va |ve|vi |vij|vit|vrt|za |zn|čet|š |ša|što|žel|ži | bo| br| dj| dv| go| h| in| is| kl| kr| ku| no| op| pi| pu| si| te| ti| to| uv| va| ve| ć| će| če|ac|aci|ad |ajn|ama|an |ana|aro|ast|ate|ač|aži|ažn|ažu|bal|bil|bl|bra|ca|ca |dno|do |dok|dvo|eba|eca|eg |ek |eka|eme|eni|ent|ep|epo|eri|et |eti|ezi|eći|eč|eče|f|fo|god|gur|ho|hov|id|iho|ili|ism|iv|ič|ičk|iš|jec|jed|jeg|jes|jih|jn|jo|jš|jša|kad|kak|ki |kli|kuć|lat|lji|ljš|mal|men|mi |mj|mje|mog|mor|mu|nap|nar|naš|nek|ni |nih|nik|nio|nit|nk|ns|nt|obo|odn|ogu|oja|oju|ono|ope|opi|ora|ore|ost|ovn|oć|oći|oč|oš|per|pob|pok|pom|pon|r |ra |rad|ram|raz|raž|red|ren|rez|rit|rod|rog|roj|roz|rug|rv|rvi|rš|sas|sat|sig|sli|sm|smo|sno|sp|spr|sti|str|sut|tao|tar|tim|tk|tva|tvr|ud|ug|uli|um|urn|ust|ut |uv|uvi|uz|uze|uč|vak|van|var|važ|vl|vn|vno|vor|zin|zni|zo|zu|zv|če |či|čk|đ|šta|žb|živ|žn|žni|žu| a | ak| al| ap| až| c| ci| di| dr| ga| gd| gr| gu| hl| hv| id| ig| ik| ja| jo| ju| kn| lj| lo| ma| me| mj| mu| o | ob| ot| pa| pe| pl| ps| ri| ro| sl| sn| sp| tv| ul| ur| uč| vi| vl| vo| zb| zd| ze| zn| či| ži|ab|abo|ada|ade|adi|adn|adr|aja|ajb|aju|aka|aki|akn|alo|amo|ank|ans|apl|apr|apu|ari|arn|aru|as |asl|asn|at |ato|atv|avd|avl|avr|azi|azn|azo|azu|azv|ače|aču|aša|aše|ašn|b |ba |be|be |bi |bih|bit|ble|bli|bn|bni|bog|boj|bor|bro|ce|ce |dam|dan|dat|dav|de |dem|des|deć|dil|dim|din|dio|dit|diz|dne|dog|dov|doć|dra|dru|drš|drž|du|duz|dva|dž|džb|ebn|ece|ed |ede|edj|edo|ef|efo|ego|ej|eja|eki|ekl|eko|ekt|elo|em |emi|eml|emo|ena|ene|enu|er |era|erf|eru|erv|erz|esn|esu|ete|etn|etv|ev|eva|eze|ezn|ezu|eće|eđ|eđu|eš |ešt|ešć|ež|ežb|fon|for|ga|gar|gd|gdj|gl|gle|go |gom|got|gov|gum|guć|hi|hič|hl|hla|hv|hva|ide|idj|igr|ihi|ijs|ik |ikn|iku|ila|imu|in |ink|ins|ip|ipr|iri|isl|isp|itk|iva|ive|iza|izg|izr|izv|iš |išt|iž|iži|jak|jam|jat|jav|jb|jbl|jem|jep|jet|jev|ješ|jež|ji |jig|jim|jk|jke|jn |jno|joj|još|js|jsk|jud|juk|jut|kac|kas|kav|kaz|ke|ke |kih|kla|kni|knj|knu|kod|kog|kop|koš|kra|kre|kro|kt|kt |kum|kus|l |lad|lak|laz|laž|le |led|lef|lem|les|lim|lio|lir|lit|liš|liž|lod|loj|lov|loz|lt|lta|mak|man|mat|mb|mb |me |međ|mil|mis|ml|mlj|moć|mu |muz|nak|nal|nao|nas|nač|ned|neg|nem|neš|nim|nič|niš|nka|nku|nsi|nst|nt |nta|nu |nul|nut|obe|obl|obr|oda|odr|odu|odv|ogo|ogr|ojk|ojo|ok |oka|okr|oku|ol |olo|om |oma|omj|omo|on |oni|or |ori|orm|oru|os |osj|oso|ote|oto|otr|otv|ova|oz |ozi|ozo|oča|oče|ođ|ođe|oš |ošt|pa|pa |pet|pij|pio|pis|pit|pla|pli|plj|pop|por|pot|poč|pru|prv|ps|psi|pun|pus|put|rac|raj|ral',
+    'hu': 'e|a|t|n|l|s|k|m|o|i|z| a|g|a |é|r|á|t | a |b| m|el|d|y|v|h|j|k |n |s |en| k|sz|és|i |eg|gy|l | e|le| h|z |ö|f| t| v|al|et|te|tt|ü|at|ke|me| s| é|an|er|in|la|m |p|u|va|ő| me| n|az|mi|ol|ta|és |be|e |ho|on|re| az| és|em|ne|nt|át| f| mi|ek|ka|nd|y |í|ó| va|az |el |en |et |gy |meg|na|ra|to|ze|ás|ít| el| ho| l|ak|an |c|ele|em |es|ma|nk|og|so|tá|ég| b| j| sz| te|am|ez|ik|lt|ni|ny|ok|zt|ú| le|ap|ba|bb|cs|de|ere|g |ja|kk|kö|min|ni |ot|rt|se|st|tt |té|ál| i| ke| r|ak |egy|fo|hog|je|kal|kel|ki|ll|ogy|on |oz|ra |sze|sé|tu|tö|ve|át |él|ül|ün| eg| g| ne|ab|ag|ar|at |do|ek |fe|ge|ha|ik |ind|int|lat|lt |ly|má|nem|nn|om|ott|ro|rá|tés|van|ye|zer|ár|ás |öz|új|ünk|őt| c| d| ez| fe| fo| ké| ma| má| o| re| tu| ú| új|agy|ai|al |ala|as|av|b |ban|bb |be |ben|den|ej|ell|ent|esz|gi|há|id|já|ket|ki |kka|ké|köz|kü|len|lk|lé|mo|mé|nap|nek|nk |nt |ná|né|ok |or|os|p |r |sá|ség|ts|tud|tás|ud|ut|yi|zn|án|ése|ön|őtt| al| be| cs| gy| há| ka| ki| kö| kü| né| p| pr| se| tö| vo| ü|abb|aj|am |ami|ap |att|bi|cso|dn|dt|dta|dő|eg |elő|end|eni|ett|ez |fel|fon|gb|get|gi |gye|gyo|gá|gé|hol|hoz|ig|ig |is|it|iz|ja |jel|kke|ko|kül|lal|leg|les|lj|ln|ls|lá|lés|lő|lőt|mb|men|más|nak|nde|ola|olt|oz |pr|pro|rek|ren|ri|sa|sol|st |sí|sít|tam|tel|ten|tet|ti|tot|tta|um|vas|vel|vo|vá|yo|za|zo|zá|zé|ág|ége|én|ér|ét|év|éve|ítá|ól|ő | ak| am| bi| do| ha| hé| id| ja| je| mo| na| ny| st| vá| á| át| ó| üg|ah|ain|ajá|alk|alm|alt|ann|apc|ará|atj|ato|atá|ava|aví|azt|ba |bes|biz|bl|bá|d |di|dig|dná|dok|dr|ds|dsz|dé|eb|ebb|egb|ei|eje|eke|ekk|elk|els|ep|ert|est|ezn|fej|fi|fol|fé|fél|ga|gbe|gl|go|gyf|ha |he|hán|hé|hét|idő|ink|is |it |izt|ió|j |jav|jl|jr|jra|ju|ját|jö|kap|kat|ker|kez|kor|ku|kés|lak|ld|lde|lg|li|lka|ll |lle|lm|lma|lna|lo|lom|lsz|lv|lyi|lát|ma |maz|mel|mi |mik|mon|már|mén|nag|ndi|nds|nke|nkk|nne|ns|nsá|nto|nté|nye|nyi|nád|nü|nün|nő|ob|okk|olg|oln|oly|omb|ond|ons|ont|or |ot |pc|pcs|pe|pí|pít|ret|rn|rna|rt |rát|ró|ról|se |sen|sok|son|sti|sz |sza|szo|szt|szá|szé|szí|ság|ta |tak|tal|tat|tb|te |tem|tes|th|tj|tk|tm|ton|tos|tte|ttá|tör|tü|udn|uk|uta|val|vol|vál|vé|ví|vít|ya|yer|yf|yfé|yik|yj|yja|yon|zb|zni|znü|zs|zt |zta|zto|zél|zí|zü|zül|á |ád|ád |ági|ák|ák |áll|ány|ára|áso|áz|égé|éh|ék|ék |élé|ény|ért|ést|ész|ésé|ét |íts|íté|ód|ódo|óla|öl|ölt|öm|ör|ört|új |újr|üg|ügy|ül |üld|őz| ab| ah| aj| an| as| ba| bo| bá| cé| de| dé| eb| em| er| fi| fá| fő| ga| go| hi| hó| hú| in| ir| is| it| jo| ju| já| jö| ku| ká| la| lá| mu| mé| mó| mú| ni| nő| ol| op| or| ot| ré| ró| sa| so| ta| tü| ve| vé| ép| ér| év| ór| óv| ö| öm| ün| ő| ők|abl|abá|ac|acs|ad|adt|agá|aha|ahh|ai |aid|ajd|aka|aki|akn|aln|alo|aló|ama|amf|and|ani|anu|aná|api|apí|ara|arn|art|aso|asz|asá|asú|atb|atu|azo|azá|bar|bba|bbe|bbi|bej|bel|ber|bi |bla|blé|bo|bol|br|bra|bál|bát|ci|ció|cs |csa|csu|csü|cé|cég|da|dan|de |deg|del|dj|djö|dm|dmé|dne|dol|dos|dot|dra|dró|dá|dát|dél|dés|dí|dít|dő |dőn|dőt|ed|edm|ef|efo|egf|egg|egi|egk|egl|egs|egt|egv|egé|egí|egú|eh|ehe|ei |eik|ejl|ejt|ekt|ekü|elf|elh|eli|elj|elv|ely|elé|emb|emz|emé|ene|eng|enk|enn|enő|ep |epí|er |erb|eri|erv|erá|erü|es |esé|esí|etk|etn|etü|ető|eu|eum|ev|eve|ezd|eze|ezé|fin|fió|fog|fr|fri|fá|fáj|fő|főz|gar|gat|gba|gel|ger|gf|gfi|gg|gge|gin|gk|gkö|gla|glá|gom|goz|gr|gra|gs|gsz|gt|gta|gv|gva|gya|gyj|gyü|győ|gál|gás|gát|géi|gés|gév|gí|gít|gú|gúj|gü|gün|hag|hat|hav|het|hez|hh|hho|hi|hid|hon|hál|ház|hó|hón|hú|hús|ia|iat|ib|ibe|ide|idr|ie|iel|ike|iko|ikö|im|imm|inc|inn|ino|ir|iro|iss|itt|izn|iók|iós|jab|jai|jd|jdn|jek|jes|jez|jle|jlj|jo|job|jt|jte|juk|jut|ják|ján|jön|jöv|kar|kek|kem|kik|kis|kn|kna|kom|kt|kte|kum|kut|kv|kva|ká|káv|kér|két|köl|kön|kös|kük|la |lah|lam|lan|lap|leb|lef|leh|lei|lej|lel|lem|lep|let|lev|lf',
+    'id': 'a|n|e|i|k|an|m|u|r|t|a |s|d|g|n |l|p|b|ng|ka|an |i | m|er|da|h| s| k|me|in|y| me|sa|ya| d| t|en| b| p|ang| a|ak|g |ng |k |ra|ar|la|ta|ma|o|ah|be|pa|pe|tu|u |at|h |kan|ya |em|men|se| pe|ke| ke| se|un|al|am|as|ba|da |di|ha|ri|te|ti| da|ik|j|na|nt| be| i| ka| sa| te|ad|el|ga|t |ai|ap|ber|ing|li|ny|si| an|ah |ak |at |dan|eb|nd|per| l| y| ya|ada|gi|m |nya|ru|uk|yan| di|aka|ay|aya|c|mem|mi|ni| ma| ti|di |it|ja|ka |lu|nda|ran|re|say|ter|ua|um| in|and|apa|ara|asi|bi|bu|eng|es|is|l | h|ana|ari|e |ek|era|gi |id|ih|ika|il|ini|ir|mu|ni |or|pi|ri |seb|ta |tu | ak| ba| ha| la| o| pa| u|ama|dak|de|ebe|eka|ela|ere|gg|gk|gka|ida|kam|ke |ki|ku|ma |mb|nga|ngg|ngi|ngk|ntu|pa |r |rap|san|tan|tid|uk |ul|um | ad| bi| it| j| un|aik|ami|aru|ata|au|bar|ca|ent|ert|esa|et|har|ia|im|in |itu|kat|man|mas|mer|nak|nta|ok|ora|pad|ra |rt|su|tin|tuk|ua |un |unt|ur|w|wa| bu| ki| or| r| su|ag|aha|ai |ain|al |ala|ali|asa|bai|bel|bis|dah|elu|ema|emb|ep|eri|ers|gal|gga|hu|ih |iny|iri|ju|lah|lan|le|lik|lum|mba|mi |mp|na |pat|pen|rek|rs|s |si |st|uh|uh |ula|ung|up|us|ut| ap| c| de| ja| mi| si| ta| tu| w| wa|aa|aan|adi|agi|ahu|ant|any|bah|dar|du|ec|eme|emu|ena|eni|erj|eru|eta|gan|gu|hat|iha|ik |ili|ip|ir |isa|ita|jad|kal|kas|kit|kn|kny|ko|lam|lih|min|nan|ne|nin|nj|nu|ok |p |pan|pi |pu|rg|rim|rj|rja|rn|rna|rsa|rta|ru |rus|sa |sak|sam|so|tah|tem|to|tua|uku| at| du| e| ko| le| lu| pi| pu| ra| ru| to|ab|akt|aku|alu|am |api|are|as |atu|au |ban|beb|bes|bih|buk|bun|car|ci|co|dia|dir|dua|eba|ebi|ebu|ed|ele|eli|emi|emp|enc|end|enu|eny|epa|erb|erd|erg|erk|erl|erm|ern|eso|eti|gai|gar|gat|ggu|gh|gha|gin|gir|gu |haa|han|has|hu |ia |iki|ikn|il |ila|im |ind|int|ipa|ist|ja |kah|kak|kar|kec|ker|kes|ki |kt|ktu|kun|la |lag|lai|lal|lau|leb|lin|mah|mau|mel|mil|mpa|mu |mua|mul|nc|nca|ndi|ngh|nju|nti|ol|on|op|pel|pem|pin|po|ras|rat|rb|rba|rd|rde|ren|ret|rgi|rik|rin|rip|rk|rl|rm|rum|sah|sai|sal|sem|sih|sil|sok|sud|tai|tas|tel|tia|tik|tur|uan|ub|ud|uda|uma|unj|up |ur |ura|usa|ut |utu|wa |wak|ye| ca| ci| co| do| em| en| f| fi| g| ga| hu| is| je| ji| kl| li| mu| n| ne| ol| op| pr| so| st| ul| v| ve|aba|abi|ac|aca|aga|ahk|ahr|ahw|aj|aja|akh|akn|alj|alk|amb|amp|amu|ank|anm|ann|ap |apl|apo|arg|arn|ast|asu|atk|auh|aup|aut|bac|bat|bia|bil|bo|bol|bua|bul|bur|but|ca |cad|cak|ce|cew|cil|cin|coc|cok|dal|dap|dat|dek|del|den|dep|der|des|did|din|dip|do|dok|duk|ea|eam|eca|ece|eci|eda|edu|eg|ega|eh|eha|ej|eja|ek |em |en |ene|enj|epe|epo|ese|eu|eum|ew|ewa|f|fi|fis|ga |ge|ger|gun|hab|ham|hi|hir|hk|hka|hr|hra|hub|hun|hw|hwa|ian|iap|iay|ib|ibu|idi|iks|ima|imk|imp|ine|inu|io|ion|ipi|is |isi|isk|iti|iu|iun|jak|jam|jar|jau|je|jen|ji|jik|ju |juh|juk|jun|kea|keb|ked|kem|kep|ket|kh|khi|kin|kk|kka|kl|kli|ko |kop|kot|ks|ksa|ku |kul|kum|kup|laj|lak|lap|lep|les|li |lib|lir|lit|lj|lju|lk|lka|lu |luh|lui|lun|lup|mai|mak|mal|mbe|mbo|mej|mes|mis|mk|mka|mpe|mpi|mus|nah|nal|nas|nde|neg|nel|ner|nge|ngu|nja|nk|nka|nm|nmu|nn|nny|nte|nto|num|nun|nur|nye|nyi|o |oc|oco|oko|oku|ol |ola|om|omb|on |ona|ope|opi|or |ore|ot|ota|oy|oye|pag|pal|pas|pes|pil|pir|pl|pli|pon|por|pr|pro|puk|pul|pun|rag|re |rga|rka|rke|rla|rli|rma|rmu|ro|roy|rsi|rti|rtu|rua|rub|rut|sab|sar|sec|sed|seh|sek|sel|sen|sep|ser|set|seu|sik|sin|sio|sis|siu|sk|ska|sor|sta|ste|sti|str|suk|sun|sur|tal|tam|tap|tar|ten|tet|tim|tk|tka|tok|tom|tor|tr|tri|tuh|tuj|tup|tut|uah|uar|uba|ubu|ui|ui |uj|uju|uka|ukk|ul |ulu|ume|una|upa|upu|uru|us |use|v|ve|ver|war|yaa|yek|yel|yi|yim',
+    'it': "e|a|i|o|r|n|l|t|s|e |o |a |c|u|d|m|p|i |re|v| d| s| p| c| a|on|g| i| l|ar|f|ta|er|en|io|re |ri|st|b|la|nt|di|l |n |no|h|an|co|in|ra|z| f| m|ma|to|de|or|pr|te| n|are|el|le|ne|si|to |tr|al|at|ch|ic|la |ni|ro| di| e|es|ia|im|no |q|qu|sa|un| la| q| qu|ent|il|ll|me|se|zi| co| de| pr|do|le |li|vo| ch| il| r|che|di |he|he |il |ion|pe|sta|ve| e | v|as|fi|ne |ti|tt|zio| t| u| un|'|av|ca|ci|del|ie|lo|ni |ol|os|ov|so|su|ta |te |va| al| do| fi| g| in| pe| ri|am|az|azi|ell|ima|io |ma |men|mi|mo|na|nd|on |one|per|ro |ss|ua|uo|è|è | st| su|con|ed|em|gl|gli|lla|lo |lt|mp|po|pre|ra |sa |tro|ue|un | a | b| i | le| no| se| si|bb|be|da|est|gi|ig|is|iu|nte|nu|om|ono|pa|pi|pri|qua|rim|rs|se |tat| h| l'| ma| mo| nu| o| pi| sa| ve| è| è |ano|ant|ata|cc|ce|el |ers|et|ett|ev|ia |in |iv|l'|man|na |og|ora|ost|que|ri |ti |ul|us|ut|vi|vo | ca| fa| gi| mi| ne| pa|ac|and|ap|ass|att|bbe|be |bi|cu|do |dom|eb|ebb|eg|er |era|fa|fo|ge|gio|iar|ica|ien|igl|imp|ir|iù|iù |llo|mi |mpo|non|nti|ntr|nuo|ovo|più|pro|r |rd|reb|rr|sic|son|sto|str|tra|tre|uov|ver|ù|ù | da| ha| im| me| pu| re| so| te| tr| vo|'a|al |ale|all|ara|ato|ava|avo|chi|ci |cl|co |cos|d |da |de |ede|ego|emp|ere|eri|ese|eva|ez|fe|fin|gg|gn|go|ha|ha |hi|ici|ine|ior|ire|lar|lie|lio|lu|mo |nc|nda|ns|nta|nto|oc|olo|olt|oma|ome|oni|op|ori|pu|qui|rat|rc|rez|sar|si |sia|so |ssi|ste|sul|tem|tte|tti|tu|ues|ui|um|ume|uni|uo |uto|va |van|var|ven|vor|za|za |zie| ac| am| an| ap| as| ba| be| ce| cl| er| fe| fo| fr| ho| li| lo| op| or| po| sp| tu| vi|'u|'è|'è |acc|ag|ai|alc|alt|ame|ami|amo|ani|app|ard|asa|ati|avv|ba|bbi|bia|br|ca |cas|cce|cco|cen|cia|cli|col|cor|cur|din|dir|div|dov|ei|ei |end|eni|eno|enz|erc|ess|ezz|far|fer|ff|fic|fis|fon|fr|gen|ggi|gol|ho|ho |iam|ian|ich|ico|icu|ie |ime|ina|inc|ini|isi|ist|it|iun|ius|ive|ivo|iz|izi|l'a|l'u|lc|li |lic|lle|lor|lta|lto|ltr|mar|mb|me |mer|mig|mol|mpr|ndi|ndo|nes|nio|nos|nz|nza|ob|ogl|ogn|ont|ord|orr|ort|osa|oss|ot|par|pas|po |por|pp|può|rar|rav|rci|rdi|reg|ren|res|ria|ric|riu|rn|rna|rov|rre|rsi|rso|rt|rta|sal|sc|sem|ser|set|sf|sig|sis|sp|suo|tal|tan|tar|tav|taz|tel|ter|tim|tor|tto|ttr|ua |ual|uan|ud|ue |uel|ul |ult|ur|use|uò|uò |ved|via|vol|vv|w|zz|ò|ò | ab| ad| ai| ar| at| az| bi| bu| c'| ci| du| ed| en| ga| ge| gl| gr| mu| ni| og| sf| sq| ta|'ag|'an|'ap|'e|'es|'i|'im|'uf|'ul|ab|abb|ace|ack|ad|ad |ae|aes|af|aff|age|agg|ai |aiu|alu|alv|ama|amb|ana|anc|ann|ape|apr|arc|ari|arl|arm|arr|arà|asc|asf|asi|ast|ate|au|aus|ave|bac|bam|bel|bev|bin|bis|bl|ble|bra|bro|bu|buo|c |c'|c'è|caf|cat|cau|cav|caz|cch|ced|ces|cev|ché|cin|cio|cip|ciz|ck|cku|clu|com|cou|cum|cun|dar|dat|dav|dd|ddo|dei|der|des|det|dev|dia|dif|dim|dio|dob|doc|du|due|dì|dì |ec|ecc|ed |edd|edi|edì|ef|efo|egg|ela|ele|elu|ema|emb|emi|emm|ena|ens|enu|eo|eo |ep|epa|ern|ero|err|erv|esa|esc|esi|eve|evu|ezi|fac|fav|fes|ffi|ffè|fig|fil|fiu|foc|fos|fra|fre|ft|ftw|fè|fè |ga|gar|ge |get|gge|gia|giu|gn |gne|gni|goz|gr|gra|gu|gua|hie|hio|hiu|hé|hé |iav|ib|ibr|ic |icc|ied|ier|ies|if|ifi|igg|ign|ile|ill|ind|ing|ino|ins|int|ioc|iov|ip|ipi|irs|iso|isu|ita|ito|ium|iut|iva|k|ku|kup|l'e|las|lat|lav|laz|lco|lcu|lef|leg|lem|let|lib|lin|ls|lsa|lti|lud|lus|lut|lv|lva|mai|mas|mat|mbi|mbr|mes|mic|mio|mm|mmo|mod|mog|mos|mpa|mu|mus|n'|n'i|nal|nam|naz|nci|ncl|nco|nde|neg|nel|ner|nev|ng|ngu|nic|nie|nir|nit|nn|nni|not|nsi|nso|nst|nt |nt'|num|nut|obb|obl|oca|oci|ocu|od|odi|of|oft|oge|ola|ole|oll|ona|ond|ons|ope|opr|opz|ore|orn|oro|ota|otr|ou|oun|ov'|ova|ove|ovi|ovr|oz|ozi|p |pae|paz|ped|pen|pev|pia|pic|pl|pli|pom|pos|pot|ppl|ppr|pul|pz|pzi|rag|ram|ran|ras|raz|rch|rd |rdo|red|rei|rel|rem|rep|rie|rig|rin|rir|ris|rit|riv|rl|rle|rm|rmi|rob|rog|rol|rop|ros|rri|rro|rsa|rse|rv|rvi|rà|rà |san|sap|sci|sco|seo|sfe|sfo|sim|sio|sof|sog|spe|spo|sq|squ|ssa|sse|sso|ssu",
+    'mk': 'а|о|е|и|т|а |н|р|д|в|е |с|к|п|м|и |о | н| п|л| с| д|на|ра|ј|ат|з|у|та|те|г|от|ш|да|т |б|ни|пр|ре|то| в| да| и|ка|те | на| м| пр|да |но|ч|во|ко|от | к|од|по| по|ж|не|ја|ов|се|та | о|ата|ва|ет|ст| г| з|ит|ме|на |ти|то | б| во| не| т|во |де|ите|ли|ро| и | се|ве|д |ек|за|ор| за| р|до|ед|м |мо|со|ц|ја |ав|ен|ла|ма| мо| со|ам|ан|ар|ел|ер|еш|ин|ис|ка |се |шт| ко| ре|аж|ал|аш|ај|ви|им|ој|про|ри|ста|тр| до| од| ј| ја|ак|ам |ат |га|го|ем|ку|ле|ме |ни |ос|пра|пре|че|ш | го| ст| ч|ад|ди|за |ик|ио|иот|ир|иј|ија|не |но |ог|од |оп|си|у |ув|ува|ше|ше |ќ| би| ве| де| ка| ни|аа|ате|ањ|бе|би|бр|вн|вр|гр|гра|ез|ека|еко|ето|еше|же|зи|ив|ие|из|ли |ма |ми|мож|ова|ож|ок|ом|ора|рав|рат|ред|сн|со |тре|ф|ца|чи|што|њ| а| бе| ги| л| ов| си| у|ави|али|ара|ас|ати|аш |в |ги|ги |го |дек|дн|др|ед |ела|ес|ете|еч|зе|име|ира|к |кат|ку |ла |н |нај|нов|нот|нт|об|ол|ост|ото|ој |пов|под|рад|рам|са|тан|тв|ти |тот|ча|чет|ј |јат|ќе|ќе | вр| гр| е| е | им| ис| ме| ми| но| са| ти| то| тр| ут| ш| шт| ќ| ќе|аа |ажу|аз|ака|ап|ари|ач|ање|ба|беш|бл|бо|ват|вер|вни|вт|вто|га |дал|де |доб|еб|еме|ени|ент|ера|есе|ец|ече|еј|жа|жн|жу|зн|зо|иг|ид|ие |ил|има|ина|ини|ист|иц|ица|иш|ки|ког|кол|кот|кој|л |лк|лку|мен|ми |нек|ник|нит|обр|овт|ога|оди|одо|оже|оз|ои|олк|он|орн|па|пе|пи|пл|рв|реб|рез|рем|рн|рно|ров|род|ру|сак|си |сл|сти|тар|тел|тор|ту|ум|ут|утр|ца |чк|ѓ|јо|јот|ње| бр| дв| ж| из| ин| кл| ли| ма| мн| ос| пи| ра| сл| те| ф| фи| ча| че| чи|аат|аб|або|ад |ади|ае|ажа|ажн|ако|ана|ани|ано|асо|аша|ајн|ајо|ања|ба |би |бид|бро|ва |ваа|важ|вањ|ве |веа|вк|вор|вре|гаш|год|гу|гу |дат|дв|дел|дец|дин|дна|до |еа|еба|ев|еде|едн|езе|еле|ели|ен |ерв|ети|еца|ешт|жа |жет|жи|жно|жув|зер|зин|зни|иве|ивн|иде|ик |ико|исп|ич|ичк|иш |каж|кит|кл|кли|кн|ко |коп|кт|лед|лик|ло|лу|мат|мес|мн|мно|мор|нав|нам|нап|нар|нат|наш|нед|неш|нив|нио|ниц|ног|нок|нос|нс|нта|нто|оа|оа |ове|ови|ово|огу|ода|озо|ои |ок |опр|оре|осн|отв|оте|оч|оја|пер|пла|пом|поп|пор|ра |раж|раз|рач|рај|рет|реч|ри |рио|риј|рм|рма|рт|руг|рш|сек|сет|сит|ск|ска|см|сно|сос|сот|сп|спр|сте|тал|тво|тир|тит|тоа|уг|уга|ум |уч|учи|уш|ушт|фи|фо|цат|це|ци|час|че |чка|ша|ши|шта|јн|ња|ња |њет| а | аж| ак| ап| бл| бо| ва| ви| вл| га| ди| др| же| жи| зд| зе| зн| иг| кн| кр| ку| ло| лу| му| оп| от| па| пе| пл| ро| сè| св| см| сн| су| та| ту| уш| ц| це|è|è |ав |ава|авк|авн|авр|авј|аг|аго|аде|адн|аес|аеш|аже|ази|азн|азо|акт|аку|ал |ала|але|алн|ама|аме|ан |анс|анц|ао|аоѓ|апл|апр|апу|аро|арт|аса|асн|атв|ато|ау|ауч|аф|афе|ац|аци|ача|ачк|ачу|аше|аши|аѕ|аѕв|аја|ајб|ајв|ајт|бањ|бед|без|бил|бла|бле|бли|бн|бни|бои|бор|бот|бра|бри|бру|вае|вам|ван|ваш|веж|вен|веч|веш|веќ|вив|вид|вие|вил|вио|вир|вис|вит|вки|вку|вл|вле|вна|вно|воз|вои|вон|вој|вп|впа|врс|врт|врш|вј|вје|г |гар|гат|гл|гле|гн|гна|гот|дав|дар|два|две|дд|ддр|ден|деј|ди |диз|дим|дит|дне|дно|дов|дод|док|дом|доц|дој|дра|држ|дру|дрш|ду|дум|еа |еат|ебн|ев |ева|ег|ег |еда|едо|еду|еж|ежб|езб|езн|езу|еки|ект|ел |ем |ема|еми|емј|ена|ено|еп|епо|ере|ерз|ери|ерф|ест|ет |етв|етк|етн|еф|ефо|ецо|ечи|еш |ешн|еѓ|еѓу|ејз|ејо|ејќ|еќ|еќе|жам|жб|жба|же |жел|жеш|жи |жив|жни|жур|з |заб|зав|зат|зач|заѕ|зај|зб|збе|зв|зве|зг|згл|зд|здр|зем|зеј|зик|зич|зиј|зна|зор|зот|зоч|зу|зул|ив |ига|игн|игр|ида|иел|иен|из |иза|изв|изг|изи|ика|икн|ил |ила|ило|им |инк|инс|ину|ири|ирм|иси|иск|исл|исм|ита|ишт|каа|кад|как|кал|кан|каф|кац|каш|ки |кне|кни|кои|ком|кон|кр|кра|кти|кто|кум|кус|куќ|лаг|лад|лаж|лам|лар|лат|ле |лев|лез|лем|леф|лие|лим|лир|лис|лит|лиц|лн|лно|ло |лоз|лт|лта|луч|луѓ|мал|ман|мас|мет|меѓ|мин|мис|мо |мол|мош|мој|мп|мпа|му|муз|мј|мја|нае|нак|нао|нау|нег|нем|нет|неј|ниг|ние|низ|нич|ниш|ниј|нк|нка|нси|нст|ну|нув|нц|нце|обл|ов |овн|огр|одд|оде|одн|одр|ое|оек|ожа|ожн|ози|оит|ока|око|оку|оли|ома|оме|оми|омо|омп|они|оно|онт|опе|опи',
+    'nl': 'e|n|t|a|i|r|o|n |d|en|e |en |s|t |l|g|er|de|k|u|v|h| d|w|m|et| e| h| v|r |an|j|te|de |z|b|in|ee|p|et |ge| o| de|ij|s |st|ie|nd|aa|he| he| w| b| k| z|at|on| i| t| m|el|ve|be|d |het|re|an |c| n|da|er |g |le|nde|ng| be| a|ar|oo|or|ver|ing|k |op|we| ee| g| u| ve|at |f|nt|oe|ze| en|aar|der|een|es|gen|ke|me|ri|va| op| s| va|ar |ers|eu|l |ni|oor|p |ren|rs|ta|ten|ti|van|wa| wa|ag|al|ei|ijn|is|jn|la|m |nie|ou|ro|ste|te |zi| da| l| ni| on| te| ze|dat|ik|ik |li|na|ond|ra|rg|uw|vo|wi|zo| er| ge| ik| ko| r|and|ch|est|ete|is |jn |ko|ne|ng |ns|om|op |u |ur|ze | in| is| j| me| st| vo| we| wi| zi|aan|eg|ere|ev|gi|gin|hu|iet|je|ll|mi|nd |nt |or |rd|sta|tel|tr|ui|un|uw |voo|w |zij| al| je| kl| mo| na| p| u | zo|ad|ati|cht|den|eer|ek|el |em|euw|eve|ga|ht|ie |ig|ijk|in |it|je |jk|ke |kl|lle|ma|men|met|mo|naa|om |oud|rt|ter|tw|ud| di| do| ho| hu| mi| om| re|aat|ac|ag |as|as |dag|dan|di|do|eb|ed|ef|ein|ek |end|erg|eri|ez|gr|ho|ic|ieu|ij |il|ind|j |jke|kt|laa|lan|lo|mij|nge|no|ns |pe|rge|rin|rs |st |ts|tu|was|we | aa| c| ga| ka| la| le| ma| ou| pr| vr|ade|age|al |am|ant|ate|bes|bet|bi|bij|br|co|eel|ege|ert|eur|fe|ft|ge |gs|ha|hi|hoe|hui|ich|id|ier|ijd|it |jd|jd |ka|kan|kt |ld|len|lij|ls|ls |moe|ngs|nk|oek|oet|og|ons|ont|ord|org|os|pl|pp|pr|rag|rb|rda|res|rij|rst|se|so|stu|tat|tie|tij|to|tur|ude|ul|unt|ure|vi|vr|wee| an| bi| br| co| ei| ha| hi| ki| ku| li| no| ra| ta| ti| to| tr| tw| ui| up| uw| vi| za|ad |af|all|als|ame|ang|ap|app|b |bed|bel|ben|bev|bl|ble|con|ct|ct |dit|doo|dr|du|eb |ec|edr|ee |eef|eem|ees|eft|egi|eid|ela|eld|ele|eli|elk|ell|em |ens|erb|ern|erp|erv|ets|ew|ewe|eze|ezo|f |ft |gaa|gad|geb|ged|gel|ges|gri|heb|hee|ht |hun|id |ien|ige|igi|ijf|ijz|ill|ins|int|io|ion|jf|jz|jzi|ken|ker|ki|kin|kle|kom|kos|ku|kun|ld |le |ler|leu|lic|lk|lke|lt|maa|mor|nee|nen|ngr|nke|nog|nst|oc|oe |of|og |ol|on |one|ost|ot|ou |pen|pro|rbe|rd |reg|rei|rg |rga|rie|rn|roe|ron|rp|rt |rte|rv|si|sl|ss|str|tig|tio|tra|tre|tro|ts |tst|twe|uis|uit|um|un |up|us|vee|ven|vie|waa|weg|wel|wer|wij|wil|win|wo|za|zen|zie|zoe|zon|zou|ó| ac| af| ap| av| ba| bo| ci| du| ec| el| f| fe| gi| gr| ie| ja| ke| kn| mu| ne| oo| ov| pa| pe| ri| sl| sn| so| sp| th| tu| uu| vó| wo|a |aag|aal|acc|ach|ack|act|afe|afr|agi|agm|ak|ake|ale|alt|am |ank|ano|anr|anw|ara|ard|are|art|ats|av|avo|ba|bac|beg|beu|bew|bez|bo|boe|bre|bri|bro|ca|cat|cc|cco|cha|chi|ci|cij|ck|ck |cou|cu|cum|dd|dda|dee|det|dez|dh|dhe|dic|die|doc|don|dri|dro|dt|dt |dul|dus|ea|eam|ebe|ebl|ech|ect|eda|edu|eek|eeu|ef |efo|egr|ei |eig|eil|ekk|elm|els|ema|eme|emi|eng|ent|erd|erh|erk|erl|erw|erz|es |ese|esl|esu|eum|eun|eva|fee|fel|fer|ff|ffi|fi|fie|fo|foo|fr|fro|ftw|gar|gee|geg|ger|get|gew|gez|gg|gge|gm|gmi|gra|gro|gso|gss|gst|haa|had|ham|hei|hie|hij|hil|hou|hte|hts|htw|hul|i |ica|idd|ief|iem|ies|iev|ig |ijl|il |ili|ine|ink|inl|inn|isg|ist|itg|itz|iv|ivi|iz|ize|ja|jaa|jec|jf |jfe|jkt|jl|jl |jna|jnd|kee|kel|kk|kke|kla|kli|klo|kn|kno|kof|koo|kou|kte|lat|lde|lee|lef|lei|lek|lem|lev|lez|lg|lge|lig|lik|lin|lli|lm|lma|log|lop|los|lot|lp|lp |lta|lti|mak|man|mat|mel|mid|min|mt|mt |mu|mus|na |nal|nat|nda|ndh|ne |nem|ner|nin|nkt|nl|nlo|nn|nne|noc|nop|nr|nra|nse|nta|nte|nti|nto|ntr|ntw|nw|nwe|nz|nze|ob|obl|och|ocu|oei|oen|oer|oev|off|oft|ogg|oi|oit|oj|oje|ok|okt|ole|olg|ome|omt|ona|onk|onz|ooi|ook|oom|oon|ope|opg|opl|opn|opp|opt|orb|ort|oss|ot |ote|oun|ouw|ov|ove|ow|owe|pa|paa|pd|pda|pee|per|pg|pge|pla|pli|plo|pn|pni|po|por|ppe|ppl|ppo|pre|pt|pti|raa|rad|ram|ran|rap|rbr|rde|re |rh|rhu|ric|riv|rk|rkt|rl|rla|rna|rne|rob|roj|rol|roo|rou|rp |rpl|rsc|rsi|rso|rtr|rve|rvo|rw|rwi|rz|rzo|sc|sch|sen|ser|seu|sg|sge|sie|sin|sla|slo|sn|sne|sof|son|sop|sp|spe|ssi|ssy|stb|std|su|sul|sy|sys|taa|tac|tad|taf|tal|tan|tar|tb|tbi|td|tda|tea|tee|teu|tg|tge',
+    'no': 'e|n|t|r|a|i|s|d|g|l|e |o|k|en|m|n |t |r |er|et|v| d|en |te|et |f|g |de|ne|u| s|b|h|p| f| h| m|å|or| de|er |j|me| t| v|re| b| e|es|in|le| i|ge|st|ti| k|ke|je|og| o|an|il|ar|i |ne |y| a| p|d |eg|l |nn|te |vi|å | n| og|a |el|fo|kk|og |tt|ø| g| me| vi|det|ed|for|se| fo| ti|be|ig|il |ng|s |ste|til| ha| l|ar |de |eg |ene|ha|ik|kke|ll| i | j|ag|al|at|da|di|du|est|gen|ka|ke |on|ta|tte|u | du| en| je|an |dr|du |ikk|ing|ko|le |li|nd|nne|ra|re |rt|sk|ør| hv| ka| ko| å|av|enn|he|hv|is|jeg|lle|na|nes|ri|rs|si|sj|ter|v | av| be| ga| på| r|am|av |den|ed |em|es |ga|har|la|med|mm|mme|nge|pr|på|på |rd|rn|va|ve| er| et| fø| in| ny| pr| se| å |bl|dag|dd|ere|ett|fø|før|gr|id|kan|kt|m |men|mo|no|nt|ny|oe|om|or |rg|rin|ro|ss|ten|tet|to|ut|yt|år|ør | bl| di| fi| he| ik| no| re| sk| st| ta| u|ag |all|as|bed|bes|edr|ern|fi|ge |ir|jo|k |ket|kon|ku|ld|ler|mi|ner|ng |nn |noe|ok|ord|ort|pe|pp|pro|ren|rge|rna|ser|tel|tt |un|vil|ye|ytt| al| at| bo| fl| la| mi| mo| si| to| ut| va| ve| vå|ang|asj|at |ate|ba|ble|bo|br|der|dig|din|dre|dri|ek|ell|els|end|ers|fe|fl|gan|ger|gj|gje|gl|het|id |ig |ige|ine|inn|jon|kte|lag|lig|ls|lse|lt|me |meg|mor|må|na |nde|nen|oen|om |one|ont|op|ore|org|os|res|rm|rt |rte|ru|sa|sen|sje|sjo|ske|so|sta|sy|sø|tid|ts|uk|ut |va |var|vi |vis|vo|vå|vår| an| ba| br| bu| dr| el| gj| gl| gr| hj| hu| kl| le| li| må| mø| ne| sa| sj| sp| så| sø|ad|age|ak|al |aml|amm|and|ap|app|arn|ati|bar|bli|bu|da |dd |dda|ef|ekt|eld|em |emm|erh|ets|fa|ff|ffe|fir|fly|gam|gd|gg|gge|gle|gn|gne|gra|gru|gt|hel|hj|hje|hu|hva|hvi|hvo|idd|ikt|ill|in |is |isk|iss|it|iv|jek|jen|jer|ju|kal|ken|ker|kk |kl|kom|kti|lem|len|lli|lm|lo|lu|ly|lyt|ma|mer|mes|met|mid|ml|mle|mø|møt|nb|nda|net|ns|nte|nto|nye|nyt|ob|od|oe |ogr|omm|ona|orb|ors|pen|per|po|por|ppo|ra |ram|rb|rbe|rde|rdi|reg|ret|rh|rhe|rog|run|set|sig|sik|sin|sku|sp|sti|su|så|så |tak|tal|tar|tem|tig|tiv|tor|tr|ue|ukk|ul|unn|us|use|ven|ver|vik|vor|ye |yn|ys|ål|år |årt|æ|ær|ørs|øt|øte| bå| bø| da| do| eg| fa| fe| fy| ig| jo| kn| ku| lo| lu| læ| ma| mu| my| nå| næ| om| op| os| pa| pe| ps| ra| ri| sl| sn| so| su| sy| te| tj| tr| tå| uk| vo| y| yt| åp| år|ad |add|ae|aet|af|aff|agd|agr|agt|akk|akt|ald|ale|alt|ame|amo|anb|ane|ann|ara|arg|art|ass|att|ave|ban|bb|bbe|bef|beg|bet|bod|bok|bor|bre|bri|bro|bur|but|by|bye|bå|båd|bø|bør|dan|dat|dde|dem|des|di |die|dis|do|dok|dra|dru|dt|dt |due|ea|eam|eb|eby|edd|ede|ee|eet|efa|efo|ege|egl|egn|egy|eh|eho|ekk|ele|eli|elm|elp|elv|eme|emt|eni|ens|ent|era|erd|erf|eri|erm|ert|esf|esi|esk|ess|esu|esø|ev|ev |fal|far|fen|fer|fet|fil|fin|fle|fon|fr|fra|ft|ft |fy|fys|gar|gda|gde|gel|ges|get|gh|ghe|gla|gre|gt |gte|gy|gyn|had|hag|han|hav|hen|her|ho|hol|hun|hus|hve|ie|ien|if|ift|igd|igg|igh|igj|ign|ilb|ile|ilk|ind|ink|ins|int|ir |ire|irk|irm|ise|ite|itt|ive|ivs|je |jed|jel|jem|job|ju |jue|ka |kaf|kel|ki|kis|kj|kje|kka|kli|klo|kn|kna|kop|kos|ks|kst|kuf|kul|kum|kun|lad|lan|lat|lb|lbr|lde|ldi|ldr|ldt|leb|lef|lek|les|li |lik|lin|lir|lit|lk|lke|llt|lme|lmo|log|lok|lp|lpe|lta|lte|lti|luk|lut|lv|lva|læ|lær|mae|man|min|mit|mod|mop|mt|mt |mu|mus|my|mye|må |mål|mån|nal|nap|nas|nat|nba|nbe|nd |ndr|ndu|ned|neh|ngt|ni|nin|nk|nke|nl|nla|nnl|nno|nom|ns |nst|nta|nyb|nå|når|næ|nær|nø|nø |o |obb|obl|odd|odi|oge|ogg|ok |okk|oks|oku|ol|old|on |ope|opi|opp|orl|osj|oss|ost|pa|pas|pd|pda|pi|pi |pn|pne|ppd|ppe|pri|prå|ps|psy|pø|pør|ran|rap|ras|rat|rd |rda|rel|rer|rev|rf|rfr|rg |rif|ris|rk|rke|rl|rla|rma|rme|rmi|rnb|rne|rob|ror|ros|rs |rsd|rsi|rsj|rsm|rso|rst|rts|rtt|ruk|rå|råk|sa |sam|sat|sd|sda|se |see|ses|sf|sfo|sis|sju|ska|skj|sko|sl|slu|sm|små|sn|snø|som|son|sor|spr|spø|sr|sre|ss |sse|ssi|sso|sst|st |str|stu|sul|sup|syk|syn|sys|søk|søn|sør|ta |tas|tat|tea|tik|tj|tju|to |toe|tog|tra|tre|tsa|tsk|tsr|tu|tud|tå|tål',
+    'pl': 'a|i|o|e|z|n|s|r|w|p|d|c|m|y|t|k|ie| p|j|a |e |l|u|ni| z|ł|o |ę| s| n|i |za|pr|dz|y | w|g|ą|b|ze| k|ow|po|ra|st|zi|ę | m| pr|cz| d|dzi|ie |m |na|ro|ż|ię|nie|rz|si|sz| i| na| po|u |wi|zy|ą | za|ia|wa|ć|an|ci|ed|em|li|ć | c| j| o|ar|ał|prz|rze|ta|ó| i | r|as|do|h|je|le|mi|z |ś| b| do| ni| si|ad|ch|ię |ka|ko|od|się|zie|aw|em |es|go|no|t |w |wie| ko| w | z |ac|d |ied|k |kt|ne|on|os|owa|sta|wo|ym| cz| t|aj|al|ani|by|er|mo|nia|pa|pro|sp|to|wy|yc|ym |ła| g| je| mi| ra| st| wy|ap|dy|ec|edz|eg|ej|ek|en|ia |ic|ik|ja|ki|ma|mu|my|ne |op|pi|pra|te|za | a| l| mo| sp| ż|ak|am|az|ać|ać |ch |cj|czy|da|dy |ep|h |in|ić|ić |ił|ją|mi |my |na |now|oc|og|oj|ol|om|or|ot|raw|re|tał|to |tu|ty|wn|ws|zo|ł |łe|łem|ń|że|że | dz| ki| ma| pa| zo| że|acj|awi|aż|ba|bi|by |ce|ci |cza|do |eci|ego|eni|go |iał|ies|j |ją |ję|kie|kt |la|lep|lik|mu |n |nt|ny|ob|odz|oje|owi|pow|raz|szy|sł|sła|tk|tw|uj|we|wsz|ych|ys|zas|zed|ła |ło|ły| ba| go| ja| kt| op| ro| to| ty| u|ad |ada|adz|an |ałe|ało|c |co|cze|dw|dza|ed |edy|ej |ek |est|ez|f|ga|god|icz|iec|iem|ier|im|is|iu|ią|iż|jak|je |jes|jn|ju|ję |ka |kl|kn|kol|któ|ku|li |ma |nad|naj|nas|no |ok|opr|ost|oś|pan|pe|pie|pl|pli|ps|rod|ros|row|rt|rzy|sk|spo|stw|sza|sze|tu |tó|tór|ud|wa |yj|yn|zap|zar|ze |zn|zos|zy |zą|ór|ów|ąc|ęd|ędz|łb|łby|ło |śc|ści|żo| by| ch| co| dw| f| fi| gd| in| ju| ka| kl| li| mu| no| o | od| pi| sk| sw| są| wa| wi| ws| ś|ajn|ają|ak |akt|ale|ali|any|apo|are|aro|art|as |asu|asz|at|at |awd|az |ał |ała|ażn|bl|był|ca|ca |ce |chc|cia|cie|cja|czn|czą|da |dn|dni|dom|du|ejs|ekt|el|emu|emy|ent|eps|era|erw|esi|esz|ew|ewn|eń|fi|g |gd|gr|ha|hc|iej|ien|il|imy|inn|io|iu |iw|iz|ió|ięt|ił |iś|iż |ja |jek|jno|js|jsz|jut|jś|kan|kli|kni|kon|koń|kuj|ką|ką |le |lo|lę|lę |mia|mie|mn|mog|mor|mó|neg|nik|niu|nił|niż|nn|ny |obi|ogr|ole|omu|ont|orz|osz|otk|owe|oz|oł|oń|ońc|ośc|oż|pew|poc|pom|pop|pot|poł|psz|ra |rac|ram|rob|roj|roz|rs|rte|rw|ry|s |sa|sim|sią|st |sto|stu|su|su |sw|swo|sy|są|są |tar|tem|tka|tr|twa|two|tyc|ują|ul|um|ur|ut|utr|wan|war|wać|waż|wd|wię|wni|wo |woj|wu|ycz|yg|yk|yni|yst|yt|yta|ył|zam|zaw|zc|zcz|zen|zes|zeń|zia|zin|zne|zr|zro|zt|zw|zyc|zym|zys|ące|ąd|ęt|łym|ńc|ńs|ńst|ś |śl|ź|ż |żn|żon| a | ab| ak| al| ap| be| bi| bo| br| bę| ci| dl| du| ga| h| ha| ic| il| ję| kr| ks| la| le| lu| my| mó| ob| og| ok| os| ot| pe| pl| ps| py| pł| re| rz| sy| te| ul| up| ur| we| wp| wł| zd| ze| zg| zi| zm| zn| zr| ć| ćw| śn| św| żo|ab|aby|aci|aco|acy|acz|ady|ag|aga|ajb|ajl|aju|aką|al |ala|alo|am |ami|amk|amo|amó|ano|apa|api|apl|apr|ara|arc|ard|arn|ary|aró|asa|asn|aso|ast|asł|au|auk|awa|awe|aws|aze|azi|azu|ałb|ały|ań|ańs|ażd|ażu|b |bac|bad|bar|baw|be|bez|bia|bio|biu|bić|ble|bli|bo|bo |br|bra|bym|bę|będ|cem|cen|cha|chi|cho|cis|ciw|ció|cią|cił|cji|cją|cję|co |cow|coś|cy|cyj|czb|czt|czw|cą|cą |daj|dal|dan|dc|dcz|dl|dla|dm|dmą|doc|doj|dok|dot|dow|dr|dro|ds|dsi|du |duż|dwi|dwu|dwó|dyk|dzo|dzw|dzy|dę|dę |dź|dźm|ech|ecz|eds|ef|efo|eg |egu|ejo|eka|ele|elę|ep |epi|epr|ere|erp|ers|esp|esł|eu|eum|ez |eze|ezp|eć|eć |eń |eńs|eś|eśl|eż|eży|fir|fiz|fo|fon|ga |gad|gar|gdy|gdz|gl|glą|got|gow|gra|gro|gu|gul|gą|gą |gę|gę |gł|głb|ha |has|hci|hcą|hi|hic|ho|hom|iad|iam|ian|ias|ic |ice|ich|ieg|iek|iel|ieć|ij|ij |ik |ika|iki|ikn|ikt|ikó|ile|ilk|imn|ini|ins|inę|ion|ior|ir|irm|isa|isk|ist|iur|iwn|iwo|iza|izy|iód|iół|iąc|iąg|iąż|ięb|ięc|ięd|ięk|iłb|iłe|iły|iś |iśm|iżs|jac|jb|jbl|jed|jej|jeś|ji|ji |jk|jką|jl|jle|jne|jo|jow|ju |jąc|jęz|jśc|jść|kac|kaj|kaw|kaz|każ|ki |kil|kle|kna|koc|kop|kos|kr|kra|ks|ksi|ktu|kum|kó|ków|kę|kę |l |la |lac|lar|lat|lec|lef|lej|lem|leż|lic|lie|lis|liw|liz|liż|lk|lka|log|lor|lu|lud|lw|lwi|lą|ląd|mag|maj|mał|me|men|mić|mię|mk|mkn|mni|mno|moc|mow|moż|mus|muz|myś|móg',
+    'pt': 'a|e|o|s|r|i|n|o |t|a |m|e |u|d|c|s |p| a| e|l|v| d|ar|es| p|as|q|qu| c|nt| n|de|r |ra|re| o|m | m|an|as |g|h|os|te| s|do|f|ta|er|ri| de| q| qu|ma|ar |en|ia|que|ue| t| v|de |or|os |se|ã|do | f| o |co|da|em|in|me|no|sa|st| a |el|to|ue |ão|ão | no|al|am|ca|ci|nte|pr| co| do| r| se|ant|po|tr|ua|vo| e | es| re|pa| pa|ad|es |est|io|na|on|te |to |um| pr|ent|ho|i |is|ma |om|ria|sa |sta|va|ve|ç|ê| me|ai|at|b|da |ec|gu|ia |la|nh|oc|pe|ra |ss|á| ca| i| u| um|ara|com|em |eu|fi|ic|im|io |j|lh|mp|nd|par|qua|so|u |ui|vi|ê |ó| as| en| ma| po| vo|av|cê|cê |eg|ei|go|ha|hor|ig|le|mo|ocê|por|ro|rt|se |ta |tra|voc| an| fi| h| l| nã| os| pe| te|ac|am |ce|cio|con|ela|elh|emp|ha |ica|id|ir|is |lho|li|men|mi|ne|ni|no |nos|nta|nto|nã|não|om |or |pre|re |rio|si|ti|uma|á |é|í| al| am| at| el| in| j| mu| sa| to| tr| ve| vi|ada|ado|ais|al |ava|br|des|di|ele|eri|eu |fe|go |it|iv|ja|l |man|mel|min|mos|mpo|mu|na |nha|nov|ns|od|ont|ora|ou|ov|qui|ras|rec|res|ssa|su|tar|tem|tes|uan|um |un|us|vam|ver|vo |x|z|é | em| fe| há| ja| na| ne| su| à|ab|aci|alg|ama|amo|anh|anç|atr|aç|car|cas|ch|cia|cl|ece|eci|egu|ei |ema|end|er |era|ess|ev|eve|fic|fo|ga|há|há |hã|hã |iar|ias|ida|igo|inh|int|ion|iq|iqu|la |lg|mai|nc|nda|ng|nhã|ntr|nç|nça|ob|ode|oi|ona|ort|oss|ou |ovo|pod|pró|ran|rem|ro |rta|ró|sem|seu|sso|tan|ter|tre|tã|tão|ua |ud|via|xi|à|ã |ça|çõ|çõe|õ|õe|ões|ú| ac| ap| b| ce| cl| da| di| eu| ex| fa| fo| g| ho| im| mi| mo| op| so| ta| ti| va| à | é| é |ade|ag|ap|ard|are|ari|asa|aso|açã|bre|bri|ca |cer|cid|cli|cor|cr|cri|cu|dad|dar|das|dev|dos|eir|enh|env|ep|eq|equ|ert|esa|ese|et|eun|ex|eç|fa|fer|fiq|foi|gar|ge|gos|gr|gra|gua|gur|he|ho |ian|ici|ido|if|ifi|im |ima|imp|inc|ing|ini|ira|ito|ivo|iz|iã|ião|jan|lar|las|les|lgu|lt|mas|me |mei|mpr|mui|nad|nal|ndo|ngu|nic|niã|nv|nvi|oa|oas|obr|oi |oj|ome|op|ost|pes|po |pri|pro|ram|rar|rav|rd|reg|reu|rm|rn|rq|rqu|róx|seg|sig|soa|ste|sua|tal|tav|tiv|tro|tu|tó|tór|ual|uas|uda|ui |uit|ul|uni|ur|ura|va |var|ve |xim|ze|zer|à |ár|ári|ça |çã|ção|ís|óp|ór|óri|óx|óxi| ab| ag| ai| aj| ao| ar| bo| br| ch| ci| cr| cu| có| dú| eq| er| fr| fu| fí| ga| go| ir| já| la| le| li| lo| lí| mê| ni| nu| nú| ob| on| ou| ri| si| vá| às|aba|abi|abr|ach|aco|af|afé|age|agr|ai |aia|ain|air|aj|aju|ala|alh|ali|alm|alt|alv|ame|ami|ana|and|ane|ano|ans|ao|ao |apl|apr|aq|aqu|arq|art|ase|ass|ati|ato|atu|até|ató|au|aus|ave|avo|az|aze|açõ|aí|aís|aú|aúd|ba|bal|bi|bia|bl|ble|bo|bot|cad|caf|cat|cau|cav|ce |cen|cep|cha|che|cho|ci |cis|ciê|clu|cou|cum|cus|cí|cíc|có|cóp|daq|dec|del|der|deç|did|dim|dis|diz|doc|doi|dom|dê|dê |dú|dúv|ea|eal|ech|eco|ed|edi|ef|efo|ega|egr|egó|ein|ena|enq|epa|epc|erc|ere|erm|ern|ero|ers|erv|erí|esc|esi|esp|esq|esu|esá|ete|eto|eus|exe|exi|ez|ez |eço|eçõ|fav|faz|fec|fei|fil|fim|fon|fr|fri|ft|ftw|fu|fun|fé|fé |fí|fís|gad|ge |gem|gn|gn |gul|gum|gun|gué|gó|góc|had|heg|hei|hos|iad|iam|ie|ien|iga|ige|ign|il|ilh|ime|ina|ind|ins|ip|ipe|ir |iri|irm|isa|isi|iss|ist|ita|itó|ive|ivr|iza|ize|iê|iên|ja |jar|je|jet|ju|jud|já|já |lat|le |lef|lem|len|lgo|lha|lhe|lic|lie|liq|liv|liz|lm|lme|lo|loj|lta|lte|lu|lui|lv|lva|lí|lín|mar|mer|mes|mig|mo |mor|mpe|mud|mus|mã|mão|mê|mês|n |nac|nar|nca|nci|ncl|nde|ndê|ne |neg|nel|nes|nev|ngo|nho|nin|nou|nq|nqu|ns |nsf|nsi|nst|nti|ntã|nu|num|nú|núm|obl|oco|ocu|oda|of|oft|ois|oja|oje|omi|omo|ond|one|ons|ope|opç|ore|ori|orn|orq|orr|osa|ot|otã|out|ova|pac|pai|pas|paí|pc|pci|pe |ped|pel|pen|peq|per|pi|pia|pl|pli|pos|pra|pç|pçõ|rab|rac|rad|rag|rai|raç|rc|rcí|rde|rdi|rea|rei|rel|ren|rep|reç|rid|rif|rig|rim|rin|rit|rmi|rmã|rna|rno|rob|roj|ros|rr|rre|rs|rsã|rte|rti|rto|rv|rva|rá|rár|rí|ría|róp|sab|sai|sal|sam|sar|saú|sc|scr|sen|ser|set|sf|sfe|sic|sis|sit|so |sob|sof|sos|sou|sp|spo|sq|squ|sse|str|stu|stá|stã|sul|sup',
+    'ro': 'e|a|i|r|t|n|c|u|ă|e |o|m|s|i |l|ă |a |p|d| c| a|re| d| s|te|ar| p| m|f|ț| î|de|in|nt|v|î|ce|t |u |ul|ș|tr| de|at|ri|st| în|ea|or|în|ec|tă|un|ți| n|b|g|ma|re |să|te |z|â| f| r| v| ș|are|de |er|n | l|ta|tă | a | t|as|en|l |pr|să |și| o| să|ca|im|mi|ni|pe|r | ma| și|ac|ai|co|ii|la|le|m |ne|ra|ul |și | ce| co| pe|că|di|ea |es|ic|it|oa|ră|ți | re|cu|ia|ie|la |le |na|nu|tre|ui| e|an|ci|că |da|el|mp|nă|se|tu| ca| i| la| no| pr| tr|ace|ai |al|am|ap|ată|bu|cea|câ|din|ent|fi|fo|ii |mai|me|ne |no|ntr|on|op|ro|ru|se |si|to|ut|ve|în | ac| cu| că| mu| o | se| u|ast|ate|aț|ch|chi|h|hi|int|li|lu|mu|nd|o |or |ou|pa|po|rec|ră |ui |va|ât|ăm|ăt| am| ar| b| câ| di| fi| fo| nu| ve| îm|ar |au|ați|c |car|ce |ct|cât|ele|ez|eț|eți|imp|is|j|lo|lt|nte|nu |nț|pro|ri |rt|ru |ste|tat|ti|tru|tul|um|va |vă|zi|ât |îm|înt|ăr| ap| do| un|am |at |bă|cu |do|eb|ed|eg|eni|est|gu|ia |il|ile|imi|in |ine|iu|iz|lor|min|ni |nou|nă |opi|os|ost|pe |pen|pi|por|pre|pri|pu|pă|rat|reb|reg|sc|so|str|stă|ună|vă |ze|ân|ăm |ța| ci| da| du| g| in| lo| mi| or| pa| su| ti| va| vă|ain|aj|apr|ara|asă|au |aș|bui|bun|ci |cl|com|con|cop|cr|ctu|d |dat|des|du|eas|eau|ebu|ece|ech|eci|ect|egu|em|ere|esc|eu|ev|fa|fac|fe|fos|fr|ga|gul|gă|ic |ică|if|ig|inț|ist|ita|izi|ju|lui|lă|lă |man|mb|men|mi |mp |mul|mâ|na |nai|nc|nda|nii|nt |ntu|nul|năt|oar|oas|oi|om|ori|ort|ot|ou |p |per|rel|rez|rim|rs|sp|st |su|sun|ta |tea|tel|tim|tor|tri|tră|tâ|ult|ulu|ur|ute|za|îna|ări|ăț|șt|ță|ță | aj| al| as| aș| bi| bu| cl| es| ex| fa| fr| ga| im| j| lu| me| mâ| ne| ni| op| po| pu| pă| ru| ră| so| sp| te| vi| șe|act|af|aju|alt|ală|and|ani|ant|art|ară|asi|av|az|bi|cas|cau|ces|ceț|cli|cta|cum|cân|da |dar|dea|dec|dum|ecâ|edi|ei|ei |el |em |ep|era|ers|erv|esi|et|eu |eva|ex|eze|fic|fiz|fon|g |gar|găm|hi |iar|iat|ica|ie |iec|ifi|iil|ină|ir|it |ite|iun|iț|iți|lic|mar|mas|mbu|mic|mpo|mut|mâi|mă|nd |nea|nec|nim|noa|nta|ntâ|nța|nță|oc|ocu|od|oi |oma|ont|ora|ot |oul|par|pii|pl|pot|pt|put|păr|ra |rea|rii|ril|rin|rm|rn|rop|rta|rte|rug|rv|s |sc |sig|sis|soa|spu|sta|tal|tan|ten|ter|teț|toa|tăț|uc|ud|ug|ugă|uie|ume|un |una|une|uni|unt|uri|uto|uz|vec|ver|vi|vo|x|zer|zic|ză|âi|âin|ând|âr|îmb|îmi|înc|ăp|ăto|ătă|ăți|șa|șe|șed|ști|ța |țar|ția|ții| af| ai| an| at| av| aț| bă| ch| cr| ea| ec| ei| er| fe| gr| ia| iu| jo| ju| le| li| mo| mă| oa| pâ| ra| râ| sa| sc| sf| si| st| to| ui| ul| vo| vr| z| ză| îi| șa| șt| ț| ța|aca|acă|ad|adă|afa|afe|ag|aga|aic|aj |ala|ali|alv|ame|ami|amă|ane|anț|ape|apl|apo|apt|aro|ars|as |ase|atr|atâ|aun|auz|ave|avo|azi|ază|aș |așa|așu|ață|bd|bda|be|beș|bin|bir|bl|ble|but|bă |băr|băt|bău|ca |caf|caț|cei|cel|cen|cep|cer|cev|cie|cif|cin|cit|ciț|clu|cor|cos|cra|cre|cri|cui|cul|cur|căm|căr|dac|dev|dez|dif|dim|diu|doc|doi|dor|dou|dup|dă|dă |eav|eaț|ebă|eca|eco|ecu|ed |ede|ef|efo|egă|elo|eme|enu|enț|eo|eod|epo|epă|erc|erf|erg|eri|erm|ern|esp|ete|etr|eun|eve|exe|exi|ez |eza|ezu|eș|eșt|fea|fel|fer|fi |fie|fiș|foa|for|fra|fre|fri|ft|ftw|fâ|fâr|gaz|ge|gem|gi|git|gn|gn |gr|gră|gur|găt|hia|hid|hip|his|iaz|ice|ici|id|ide|ien|ier|ies|iet|iez|ifr|ig |ign|igu|iii|iit|ima|imb|ime|ina|inc|ini|ins|inu|io|ion|ip|ipa|iri|iro|ise|iso|ito|itu|ită|iub|iul|iza|iș|iși|j |jo|joi|juc|jun|jut|las|lat|lef|lem|li |lie|lim|liz|loc|lt |lta|lte|ltf|ltă|luc|lud|lun|lv|lva|lț|lțu|ma |mag|mbă|me |mer|mes|meu|mia|mit|miț|mn|mne|mo|mod|mpa|mpl|mpr|muz|mân|mă |măg|nal|nat|naț|nce|nch|ncl|nde|ng|ng |nia|nic|nit|noș|ns|nst|nto|ntă|nui|nv|nvă|năm|nți|oam|oan|oap|oat|ob|obl|oda|odi|of|oft|oie|ol|ola|omp|on |ona|ond|one|onu|ope|opr|opț|ore|orm|orn|oră|otd|ouă|oș|oșt|oț|oți|pa |pad|pan|pat|pet|pia|pie|pla|pli|pte|ptă|pun|pus|pâ|pân|pă |păt|pț|pți|raj|rap|rar|raș|raț|rb|rbă|rc|rci|red|ren|reo|rep|res|reu|rf|rfo|rg|rge|rie|rif|rig|ris|rit|rma|rmi',
+    'ru': 'о|е|а|и|т|н|с|р|в|л|д|к|п|у|м|з|ь| п|ы|е |ч| в|и | н|а |о | с|я|ж|г|то|ь |б|й| и|ко|на|я |ст|ит|но|ов|пр|ро| о|ра|ре|т |ть| ч|ен|й |не|ни|по|ы | д| к| по|ть | на|ет|ка| пр|ес|за|та|ю| з| у|в |де|ер|ли|од|х|че| и | м|ва|ле|м |ос|от|у |ал|до|ом|те|то | б| в | за| не|ак|во|ед|ск|сл|чт| чт|аз|ан|бы|го|ел|ить|ли |на |ог|он|ти|что| ко| р|ат|вы|ди|ез|ем|из|л |ой|ор|про|ц|ш| до| ст| я|аж|ам|ар|да|дит|ени|ет |же|жн|ие|к |лу|ль|мо|не |нов|ой |ол|пе|ста|уж|ф|ю | бы| вы| г| е| т| че| я |ать|ве|ил|ис|ия|ла|ло|н |об|ое|оп|пер|ри|ры|с |ско|ти |тр|х |э|эт|ё| вс| л| мо| с | э| эт|ав|бы |ви|вс|гу|да |дн|ег|ере|еск|з |зд|ие |ите|ич|ия |ме|ми|ну|ова|оди|оль|ом |па|пра|се|сн|сь|ся|том|уч|хо|чи|ый|ый |ьк|ько|это| ва| во| го| из| ка| но| он| от| пе| ре|ад|ае|ает|ак |ал |аро|ас|бо|был|гд|го |д |дет|ду|ек|ем |ень|жа|зак|их|иче|ка |каз|ко |кол|ку|ла |луч|льк|ма|ми |мы|нам|ния|но |нт|ны|нь|ож|ои|ок|оро|ост|ото|оч|при|рез|ров|род|си|сле|сти|сь |ся |тел|ты|ул|щ|ыл|ё | де| ес| ж| ну| ра| св| ск| сл| уж| ф| х| хо| ц|ажн|ай|ам |ани|аш|бе|ван|вер|вк|вой|вы |гда|де |дел|до |еде|ей|ей |еле|есь|жд|же |жи|зи|из |ик|ин|ит |их |как|кн|кр|лед|лен|лю|мог|му|мы |мя|мя |нес|ние|нуж|ов |ове|ого|одн|ое |они|осл|пи|пос|рав|раз|са|св|сно|со|сто|стр|та |тал|тов|тра|тс|ты |ужн|ум|ус|ут|учш|ую|фи|ца|ци|ча|чес|чит|чш|ше|ьм| вк| вп| вр| дв| др| ещ| же| зд| ис| их| кн| лю| ма| ме| ни| об| оп| ос| оч| пи| са| се| сн| та| те| у | ул| фи|аб|ави|авт|аже|аза|ака|ако|али|алу|аю|ая|ая |бед|бл|бо |бр|бра|важ|вет|вил|вл|вле|вод|вп|вр|вре|все|вст|вт|втр|ву|г |га|гл|гор|гр|гра|гу |дв|дно|дом|дор|др|дру|его|ее|еж|ежд|ека|ели|емя|ене|ент|ерв|есл|ест|еч|ещ|ещё|жал|жен|жне|жно|жны|за |зав|зв|зво|зе|зич|зн|зо|зу|зы|иб|ибо|иг|изи|ий|ий |ил |ило|ин |ию|ию |йс|йст|каж|ки|кл|ког|кое|кой|ком|кон|кот|кры|кт|ку |лат|ле |лов|луй|ля|мен|мн|мор|му |наш|нен|ни |ний|ник|ной|нос|нт |нц|нь |ню|обы|ови|ово|огд|огу|ожа|оит|ока|ому|он |оре|оры|оте|оф|оче|пас|под|пое|пож|пок|пре|раж|ран|рат|рв|ре |ред|рем|реч|рог|рос|ру|рый|сво|сег|ска|сла|сли|слу|сов|сп|сть|так|тан|тар|те |тес|тоб|тои|тор|тре|тся|уже|уз|уй|уйс|улу|ун|уст|ут |учи|ую |физ|ход|хот|ца |чем|чен|чет|чше|ша|щё|щё |ыв|ыва|ые|ые |ыр|ых|ых |ье|ье |ьми|юд|ят| а| ак| бе| бл| бр| бу| ве| га| гд| ди| ду| её| жи| зн| иг| ин| к | кл| ле| ли| лу| мн| му| мы| ок| оф| па| пс| ро| си| со| сп| то| ты| уб| ув| уп| ус| ут| ух| фа| цв| це| ци| ча| чи| яз|або|абы|авл|аг|ага|ад |ада|аду|адц|ажд|ажм|аз |азв|азд|ази|азо|азу|азы|айл|айн|айш|акк|акр|ала|але|алс|ами|амм|амн|амы|ан |ана|ано|ант|ану|анц|ап|апу|ара|ари|ары|ас |аси|асн|асо|ат |аты|ау|аун|ах|ахо|ац|аци|ач|аче|аша|аше|ашн|аю |ают|без|би|биш|бле|бли|бн|бно|бой|бот|бу|буд|ва |вад|вае|вал|вар|вас|ваю|век|вид|вит|вич|вкл|вко|вку|вн|вну|во |вои|вон|воп|вос|впа|впе|всё|вум|вут|выг|вые|вый|выр|выу|вь|вье|вя|вяж|газ|гар|где|гли|гля|год|гос|гот|гул|гут|гую|дае|дал|два|дву|дд|дде|дем|дер|дес|диз|дни|дню|дня|доб|дов|дог|док|дп|дпр|дс|дск|ду |дум|дун|дую|дц|дца|дь|дьм|ег |егд|егу|ед |еда|еди|едн|едо|едп|еду|ее |еез|ез |еза|езд|езе|езж|езн|езо|езу|ек |ект|ел |ела|ело|ель|емы|емь|ено|еню|ера|ерг|ерж|ери|ерп|ерс|есе|еся|ета|етв|ете|ети|ето|етс|еты|еть|еф|ефо|ечи|ечу|ея|ея |её|её |жай|жат|жб|жбо|жде|ждо|жду|жел|жет|жив|жин|жит|жк|жки|жм|жми|жна|заб|заз|зай|зал|зап|зат|зд |зда|зде|здн|здо|зер|зея|зж|зжа|зин|зм|зме|зна|зно|зоп|зоч|зу |зул|зыв|зык|зь|зья|иа|иан|ив|иву|игр|игу|ид|иде|иед|иен|иж|ижа|иза|изв|изм|ик |ика|икт|ила|или|ина|ио|ион|иса|исл|исп|исс|ист|ись|ита|итс|иф|ифр|ихи|ичк|иш|ишь|ият|йл|йло|йн|йн |йт|йти|йш|йша|кае|кау|ки |кие|кк|кка|кли|клю|кна|кни|кно|коп|коф|кре|кт |кто|кум|кус|лез|лем|лет|леф|либ|лие|лиж|лик|ло |лод|лож|лос|лс|лся|луж|ль |льн|льт|люб|люд|люч|ляд',
+    'sk': 'a|o|e|i|t|n|s|l|r|k|v|d|m|a | s|e |p|u|z|á|j|o | p| n|h|y|i |b|c|ž| a| m|st|č| v| z|pr| d|í|š| pr|to|ť|ko| k| t|u |y |ť |al|ie|li|m |ov|ra|te|ý| b| o|ak|na| na|de|ú| a | st|ed|le|ni|po|re|ta|va|aj|ch|do|l |la|me|za|ľ|že| do|ia|ie |je|lo|ma|ne|om|sa|te |é| za|k |ol|os|ro|si|á | po| sa|ať|ať |el|et|h |ho|li |no|od|rá|sa |ve|vi|vo|ô|ú | ak| r| si| č|ch |en|ná|or|ova|pre|s |to |tr| i| ne|an|ar|at|by|by |ej|er|es|in|j |je |ka|ko |kt|mi|mi |na |ok|on|si |sl|sta|ti|v |é |í |ím|ši|št|že | by| j| ma| ni| so| ž| že|ali|bo|di|do |em|ic|il|iť|iť |kon|la |lo |lá|nie|nu|oj|om |ri|so|ud|uj|áv|ím |ý |či|čn|ži| bo| je| ko| me| sv| to| u| v | vy|ad|ak |ako|al |av|az|bol|ci|de |dn|ej |ek|ep|epš|ez|eľ|f|ia |id|it|ke|ká|lep|ma |mal|me |mo|mu|nov|né|ní|ob|olo|op|ost|ož|pro|pš|ret|som|sv|t |tal|tn|tu|tí|vať|vy|vý|zaj|zi|zá|ýc|ých|čo|čo |ľk| f| h| ic| in| mo| má| ob| od| op| s | sk| sú| ve| vl| zá| čo| š| št|am|as|avi|ač|bu|bud|ca|ca |d |del|dí|em |ete|ev|eč|ho |iat|ich|ik|ili|ite|iu|iu |ič|jt|kn|koľ|kto|ky|ky |mu |má|mô|môž|n |naj|nos|nt|nut|ná |né |ný|oh|ot|ou|ou |ove|oľ|oľk|pe|pra|pši|ra |rav|ráv|rý|sk|sla|ste|svo|sú|sť|tak|tar|tv|tá|tý|uje|ut|va |ved|vid|vl|voj|vš|ze|zn|ác|áci|ár|ás|át|áž|ôl|ôž|ôže|ď|ľu|še|žd| bu| de| dv| dô| ka| ke| kt| l| mi| mô| no| ná| ot| re| ro| sp| ta| te| tr| tý| vý| z | ča| čí| ľ| ľu|ab|ac|ah|aj |ajn|ajt|akt|ale|alo|ani|arý|as |ato|ači|aľ|bl|ce|cel|chc|da|det|dl|dok|dom|dp|dpo|du|dv|dy|dy |dí |dô|dôl|ed |eda|ede|el |ele|etn|eš|ež|eži|g|hc|hod|hov|hr|hra|hu|iaľ|ide|idl|iek|ih|il |im|is|ist|iz|ja|jn|jtr|jú|jú |jš|kan|kaz|kl|kni|kov|kr|ktu|ku|ká |ké|ké |lať|le |lež|lik|lož|man|men|mes|my|mát|nc|nej|nem|nes|nič|nu |ny|ny |ní |ník|ný |oc|odi|odp|oho|oje|ok |oko|ol |ola|oma|ont|ory|osl|osť|oč|očn|ože|pl|pol|por|pos|pov|pri|prá|r |rad|raj|re |red|rie|rod|rt|rto|ru|rv|ry|ry |sp|stn|sto|str|sí|sím|sú |sť |tan|tia|tie|tl|tla|tnu|tok|tom|tor|tra|tre|tu |té|tím|týc|uč|val|veľ|viť|vla|vá|výk|yr|ys|yz|z |zat|zer|zl|ál|áte|áži|éh|ého|ém|íd|íde|ík|ôle|ýk|ča|čas|če|čia|čno|čí|ľko|šia|šie|šta|ž |žel|žit| ab| aj| al| ap| be| br| bý| c| ch| di| dn| du| fa| fi| fy| g| ga| he| ho| hr| ja| k | kd| kl| kn| kr| ká| le| li| mu| my| mú| o | ok| ov| pi| pl| pô| ra| ri| rá| sm| sn| sy| sť| ti| tl| tá| tí| ui| uk| ul| už| va| vi| vá| vš| vž| zd| zi| zl| zm| zn| zo| ú| úč| ď| ďa|abu|aby|aca|aco|ade|adi|ads|adu|aho|ahu|ajb|aji|ajl|ajú|ajš|akm|aku|aké|akú|ala|alá|ama|ami|amu|anc|ane|aný|anž|ao|aoz|ap|apl|arb|ari|art|ará|ast|at |ate|ati|atv|au|auč|avš|azn|azu|azv|azy|ačn|aľ |aľt|aš|aša|až|ažd|b |ba|bam|bc|bch|be|bez|bj|bje|bli|blé|bor|br|bra|bs|bsa|bý|býv|c |cho|cht|ci |cia|cio|ciu|ck|cké|co|cov|cú|cú |dal|dať|dem|deľ|deň|deť|di |die|din|diz|dič|dk|dky|dlo|dlá|dm|dmu|dne|dná|dní|dnú|dol|dos|dr|dra|ds|dsa|dt|dti|duj|duš|dva|dvo|dz|dzi|díd|dú|dúc|dý|dý |ea|ea |ec|ech|edk|edm|edn|edy|edz|edí|ef|efó|eh|eh |eja|ejš|eka|eko|ekt|eká|eli|elk|eln|elá|eme|emô|en |eni|ent|eny|ená|ené|ení|er |era|eru|erv|erz|erá|es |ese|esi|esl|est|esu|eti|etk|eto|eva|eve|evn|eze|ezl|ezn|ezp|eče|ečn|ečo|eď|eď |eľa|eľk|eľm|eľu|eň|eň |ešk|ešt|eť|eťm|fa|far|fi|fir|fy|fyz|fó|fón|ga|gar|gr|gra|hce|hcú|he|hes|hl|hlá|hol|ht|hto|hu |huj|hy|hyb|iac|ica|ick|ied|iev|ieč|ihl|ihu|ikn|ikt|iká|im |ima|ina|ine|inu|iny|iná|inš|io|iou|ir|irm|itý|iv|ivo|iza|izá|ič |iči|ičn|iž|ižš|jak|jaz|jb|jbl|jd|jde|jed|jej|jek|jem|jh|jho|ji|jin|jl|jle|jn |jno|jo|jou|jte|jí|jí |jši|jší|ka |kaž|kd|kde|ke |ked|kej|keď|kla|kli|km|kme|kná|kou|kra|krá|kt |kuj|kum|kác|káv|kô|kôr|kú|kú |lak|lam|las|lač|led|lef|lej|lez|lie|lis|liv|liz|liž|lk|lko|ln|lný|loh|lov|loč|lu|lud|lá |lác|lár|lás|láž|lé|lém|lí|lím|med|mer|meš|moc|moh',
+    'sr': 'а|е|и|о|р|а |н|с|т|е |д|у|в|и |к|м|п| с|л|о |ј| п|з|у | д| н| и|б|да|ра|г|ш|да |ли|пр|ре| к| да|на|ни|је|ко| пр|по|та|ов| м| по|ж|ма|ст|те| о| у|во|не|ро|је | б| в| на| са| ј|ка|м |мо|са|ти|ч|њ| з|ве|ви|им|но| и | је|ат|ма |од|се|љ| не| у |ва|де|за|иј|ој|х|ћ| р|ал|ем|ер|ик|ла|ли |те |ју| за| ко| се| т|ав|би|их|ор|ри|шт| би| мо| су|ад|ед|ек|ен|ет|из|ис|ко |ле|ме|ово|ог|про|ста|су|ти |то|тр|ц|ју | ре|ам|ан|ар|ез|ел|ит|ку|ло|на |ос|се |че|ја|ње| ве| из| ст|аж|ак|ас|ај|ањ|бо|ди|до|же|зи|има|ио|ио |к |нов|ом|он|пре|т |то |ш | а| г| до| ка| л|аз|ви |во |г |го|д |еле|зе|ил|ин|ир|ист|их |ка |ла |лик|мо |н |не |ови|ол|оли|оп|рав|ру|са |си|сн|су |та |ф|х |ље|ње |ће|ће | ж| ли| ов| од| св| ш| шт| њ|ави|али|ам |ате|ати|аш|ба|вн|вој|вр|гр|гра|гу|дн|др|ег|еш|ељ|ећ|жи|за |ив|ико|им |ите|иш|ије|ију|ло |ни |об|од |оз|ок|оје|пи|пра|рат|ре |св|сл|ут|ца|ца |ша|шта|ја |њи|ћи|ћи | ва| де| же| им| ми| ни| ос| то| ч| њи|ала|ало|ао|ао |ара|ања|ање|бе|бољ|вер|го |гу |дно|ду|еб|еде|ека|ем |ема|ес|ец|жел|з |зн|иг|ика|ило|имо|ира|ихо|ич|ичк|ија|ки|кл|кол|кој|кр|ку |ме |ми|мож|нај|нег|ник|ниј|но |нт|ог |оди|ож|оже|ом |от|ош|ој |ољ|пе|рад|рв|реб|рез|рем|рен|ри |риј|ров|род|с |сам|сни|сте|тан|тв|тра|тре|ув|уг|ул|утр|ућ|хо|хов|це|чет|чк|што|ј |ље |љу|ња|ња |њих| бо| бр| во| вр| гр| дв| ин| ис| кл| кр| ку| ме| но| оп| пи| ра| си| сл| те| ти| тр| ув| ф| фи| х| че| ћ| ће|ада|ажи|ажн|ажу|ак |ако|ама|ана|ап|ари|аро|ас |аст|ат |ач|ајн|ају|бил|бис|бл|бр|важ|вал|ве |век|вни|вре|га|дав|дв|де |дес|дец|дељ|до |док|еба|ег |его|еда|езе|ези|ек |еме|ен |ени|ент|ео|ерв|ери|есе|ет |ете|ети|еца|еч|ече|еш |ешт|ељи|ењ|ење|еће|жи |жив|жн|жни|жу|зб|зв|зер|зи |зни|зо|зу|ива|ид|иде|иза|ина|ита|иц|ица|иш |кад|ки |кли|кућ|ле |лед|лим|мал|мен|ми |мог|мор|нал|наш|нед|нек|нем|нио|них|ниц|нк|нос|нс|нта|ну|обо|ове|огу|ода|одн|оз |они|оно|опе|опи|ора|оре|ору|осн|ост|оч|оја|оју|ољш|оћ|оћи|пер|пл|поб|под|пок|пом|пон|поп|пор|при|ра |раж|раз|рам|рви|ред|рек|рм|рма|рог|роз|рој|руг|рш|сас|сат|сво|сет|си |сла|сп|спр|сти|стр|сут|так|тао|тар|тељ|тим|тир|уве|уз|узе|ули|уч|фи|фо|че |чи|чко|ша |шти|ђ|јн|љи|љу |љш|љша| а | аж| ак| ал| ап| ба| бе| ви| га| гд| го| ди| др| ду| жи| зб| зд| зе| зн| иг| ид| ик| књ| ло| ма| мн| му| он| от| па| пе| пл| пс| пу| ро| ск| сн| сп| ул| уч| хв| хл| ц| це| чи| јо| ју| љ| љу| ње|аб|або|авд|авк|авн|авр|ављ|ад |аде|ади|адн|адр|аду|азв|ази|азн|азо|азу|аи|аис|аки|акт|амо|ан |ани|анк|анс|анц|апл|апр|асл|асн|атв|ато|аф|афа|ац|аци|аче|ачу|аш |аша|ашт|ашњ|ађ|ађе|аја|ајб|аљ|аље|ба |бал|баш|бањ|бе |бед|без|би |бин|био|бит|бих|бле|бли|бн|бни|бог|бор|бој|бра|бро|ва |вад|вак|ван|вар|вас|вањ|вд|вде|веж|вез|вео|веч|веш|већ|вид|вил|вим|вио|вит|вих|виш|виј|вк|вки|вно|вну|вод|воз|вол|вом|вон|вор|врт|врш|вљ|вље|га |гар|гд|где|гл|гле|гм|гме|гн|гне|год|гом|гућ|дам|дат|два|дво|дел|дем|дећ|диз|дим|дин|дио|дит|диш|дне|дов|доћ|дра|држ|дру|дрш|ду |дуг|дуз|ебн|ев|еве|едн|едо|еду|еж|ежб|езб|езн|езу|еки|екл|еко|ела|ели|емо|емљ|ене|ену|ео |еом|еп|епо|ер |ера|ере|ерз|еру|ерф|еси|етв|етн|еф|ефо|еце|еђ|еђу|еј|еја|еље|ељу|ећ |ећи|жа|жа |жб|жба|же |жет|жеш|жу |жур|заб|зав|заз|заи|зат|зађ|зај|збе|збо|зве|зво|зг|згл|зд|здр|зем|зеј|зећ|зик|зин|зич|зиј|зм|зме|зна|зор|зоч|зр|зра|зул|зуј|иве|ивн|игн|игр|игу|иж|ижа|из |изв|изг|изи|изм|изр|ик |икн|ику|ила|или|инк|ино|инс|ири|ирм|исл|исм|исп|ити|ихи|ише|ишт|каз|как|кан|кас|кат|каф|кац|ких|кла|кн|кни|код|кон|коп|кор|кош|кра|кре|кро|кт|кти|кум|кус|књ|књи|лад|лаж|лаз|лар|лањ|лез|лем|лео|леф|лив|лиж|лир|лиш|лиј|лог|лоз|лој|лт|лта|ман|мат|мер|мес|међ|мис|мн|мно|мол|моћ|му|муз|мљ|мљу|нак|нао|нап|нар|нас|нач|неш|ним|нит|нич|ниш|нка|нку|ног|ном|нси|нст|нт |ну |нул|нц|нце|обе|обл|ова|овн|ога|ого|огр|одр|ози|озо|ок |ока|окр|оку|ома|оме|омо|он |онт|опо|ори',
+    'sv': 'e|t|a|n|r|i|s|d|l|o|g|k|n |t |m|r |a |de|h|en| d|f|v|ä|ar|et| s|e |er|u|en |in|p|å| v|tt|te| f| m|et | de| h|ar |b|c|st|ta| i| t|ra|ö|an|ll|na| a|ka|ti| k| o|at|tt | b|g |ag|d |or|an |ge|j|oc|on|re|ör| oc|ag |ch|ch |fö|h |il|nn|och| fö| in| p|de |för|i |le|me|sk|vi|y| e| ti| vi|da|den|er |ga|m |nd|ng|ra | ha| l| n|ck|det|ha|ig|ko|ne|nt|om|s |sta|te |är| g|att|ill|ing|ja|ka |u | at| i | me|era|es|gen|ke|l |ll |rs|se|si|ste|til| du| j| ja| ko| r| st|ad|du|du |ed|go|har|inn|jag|la|med|om |ri|ro|äl|än|å |åg| et| hä| ka| sk| va| ä|ade|am|di|ed |ett|hä|id|ler|li|lle|mm|na |nna|ns|pp|pr|rin|rn|rt|ta |ter|tr|v |va| bo| pr| på|al|as|av|bo|cka|dag|gar|gr|he|in |is|it|kan|kt|ku|lt|ma|mi|mo|nde|nte|on |på|på |sa|ska|tet|var|ve|är |ät|ätt|år|ör | av| di| fl| mi| mo| nä| re| si| ve|all|and|ara|ati|av |be|din|el|em|fl|fr|id |int|io|ion|ki|kl|kon|nat|nen|nga|nge|nne|nä|one|ont|pro|rd|re |rna|ru|rä|so|tan|tar|tid|tta|ul|un|und|vil|vå| al| be| fi| ga| he| hu| kl| lä| ny| nå| om| se| tå| u| vå| än|af|ann|ast|bl|br|bä|bät|cke|der|des|dr|ef|eg|ek|em |ern|ers|eta|ff|fi|ga |gd|gon|gra|hu|här|ic|ick|ige|ik|ina|isk|k |ker|ket|kom|kul|la |le |llt|lo|ls|lä|ma |men|mma|mme|mor|nan|nar|nda|ner|ni|ns |ny|nå|någ|od|og|ok|omm|or |ord|ort|ot|pe|rb|ret|rg|rå|sa |sen|sin|sku|som|ss|stä|tat|tio|to|ts|ttr|tä|tå|ull|up|upp|ut|ut |ver|vi |vik|vår|yc|yck|yt|ytt|äls|äs|äst|ågo|ån|öre| an| ba| bl| br| ef| en| fr| fy| gr| ig| la| li| my| må| mö| ri| so| sp| sä| så| ta| ut| vä| är| å|aff|age|aml|ap|app|are|arn|as |at |ate|ba|bar|bes|bli|bok|bor|bö|bör|dd|dda|eft|ekt|ena|eno|erh|erk|es |est|ets|fin|fly|fo|frå|ft|fte|fy|fä|fär|gam|gda|ger|get|gg|gl|gn|gru|gå|het|hur|häl|idd|ie|if|ig |iga|ikt|ilk|it |itt|iv|je|ju|kar|ken|kic|kli|kte|kti|lb|ld|lig|lk|lke|lsa|lt |ly|lyt|lö|mid|mit|ml|mla|mu|my|myc|må|mö|möt|nad|nd |ngd|nin|nns|no|nst|nto|när|näs|o |ogr|op|org|ors|os|per|po|por|ppo|ps|ram|ran|rar|ras|rbä|rd |rde|reg|res|rgo|rh|rhe|rj|rk|rm|rog|ror|rse|rso|rt |run|rät|se |sig|ski|sko|sp|su|sy|sä|säk|så|tag|ten|tig|tiv|tor|tra|tåg|ur|ur |us|use|vis|vä|ys|äk|äke|äld|äm|än |änn|åk|ål|årt|ön|örb|örs|öt|öte| af| ar| bä| bå| bö| do| dr| eg| fo| fä| ge| gl| go| gå| hj| ho| kn| ku| le| lo| lö| ma| mu| mä| op| os| pe| ps| ra| sa| sj| sl| sn| su| sö| te| tj| to| tr| tv| ty| up| vu| äl| åk| år| ö| öp|ac|ack|ad |afö|aga|ak|akt|alt|am |amm|amo|amu|arb|arj|ars|art|ats|ave|ber|bet|ble|bot|bre|bri|bro|bu|bun|bå|båd|ck |cki|da |dad|daf|dan|das|dat|dem|dg|dgå|die|dig|do|dok|dra|dri|dru|ea|eam|ec|eck|eda|ee|eet|efo|ege|egl|egn|eh|ehå|eko|elb|ele|elg|ell|emm|end|enn|ens|ent|eri|erm|erä|esi|ess|esu|esv|ev|ev |fa|far|fe|fe |ffe|ffr|ffä|fil|fle|flo|fon|for|fro|fru|fyr|fys|fön|gad|gde|ge |gel|gga|gge|gle|glö|gna|gne|go |god|gor|got|gs|gst|gt|gt |gån|går|had|han|hav|hel|hem|hen|hj|hjä|ho|hon|hus|hän|hå|hål|ien|ier|iff|ifr|igg|ign|igt|ike|ile|ilj|ins|ir|ir |isa|iss|ite|iv |ivs|ja |jar|je |jek|ju |jug|jä|jäl|kaf|kal|kat|kis|kit|kla|klo|kn|kna|kop|kor|kos|kta|kum|kun|lag|lam|lan|lar|lbr|lbu|ldi|ldr|lef|lek|lem|lg|lgd|li |lic|lir|lit|lj|lja|lla|llb|lln|ln|lni|loc|lod|log|lp|lp |lsk|lta|lte|lti|lu|lut|läm|lär|läs|löm|lös|man|mas|mer|met|mig|mn|mna|mod|mot|mt|mt |mup|mus|mä|män|mån|mås|nap|nas|ndr|neh|nel|nes|ng |nis|nni|nom|nor|nsi|nt |nta|ntr|nya|nyb|nyt|nö|nö |ob|obl|ock|od |oda|ode|ogg|oj|oje|ok |oka|oku|ol|oll|ons|ope|opi|ore|orn|oss|ost|ot |oti|ott|p |pa|par|pd|pda|pen|pi|pie|pn|pna|ppd|ppe|ppn|pps|pre|prå|psk|psy|rag|rap|rat|rbe|rek|ren|rev|rge|rif|rja|rje|rka|rkl|rma|rmi|rn |rne|rob|roj|rol|rs |rsd|rsi|rst|rta|rte|rtf|rtt|ru |ruc|räd|räl|råg|råk|rån|san|sar|sd|sda|see|ser|set|sif|sio|sis|sj|sju|sl|slu|sn|snö|son|spa|spr|sr|srä|ss |ssa|sst|str|stu|sul|sup|sv|svi|syk|sys|så ',
+    'tr': 'e|i|a|r|n|l|k|m|d|t|y|s|ı|u|o|n |e |b|r |ar|en|i |z|ü|g|in|er|ş| b|ç|de|le| k| g|h|ir| i|a |la|v|ğ|or| y| s|bi|k |m |ni|yo|ö| d|an|en |ka|me|yor|ek|ı | bi| v|el|iz|ma|p|ri|te| e| h| t|c|da|em|il|iy|lar|li|mi|ne|re|si|u |ve| ka|ak|in |ya|ye|bir|im|ini|is|ra|rı|ta|ve | ve| ç|ar |arı|ce|di|ed|eri|ge|ir |ki|nd|rd|sa| a| ge| m|al|ay|de |ey|ha|kl|ti|z |ön| o| ö|am|an |den|et|f|ik|iş|ler|on|or |rm|st|un|ün|ın|şi| bu| n| so| ye|bu|du|dı|ede|eni|es|iz |l |ld|ni |niz|nu|ru|so|tm|yi|ze|zi|üz|ği|ım|ır| gö| ha| he| iç| ne| ya| ön| ş|ad|ada|aş|ba|ek |ere|gi|gö|he|ist|iyo|iç|lı|nc|nce|nl|ok|rı |se|sin|ste|ur|çi|şe|şt| ba| p| sa| ço|ah|ap|as|bu |dan|ele|emi|er |eç|eğ|eği|gü|ile|im |isi|it|ke|kle|kt|ku|mek|nde|rl|rla|tme|tu|tı|um|um |va|ye |yl|çe|çin|ço|üze|ım | ak| de| gü| is| ki| ta| u| va| z|ak |ama|ara|ard|at|aya|az|aç|be|bil|ce |du |eb|ec|ece|ev|eye|eş|geç|ili|irm|iyi|izi|içi|işi|kur|kü|ldı|le |lec|li |lik|man|mi |ml|mü|na|ol|oru|pa|rde|ren|rin|rk|rme|si |son|t |uy|uğ|yen|yle|yı|za|ör|ü |ğu|ıl|ın |ıy|ıyo|şl| da| dü| gi| il| iy| iş| ku| mi| mü| ol| pe| r| te| şe| şi|ab|ald|ayı|baş|ceğ|da |dar|der|di |dü|ebi|edi|ekt|el |eme|esi|eti|etm|evd|gör|gün|her|id|ide|ik |ikl|imi|ind|irk|kad|kar|kaç|kit|ktu|kı|ldu|let|ll|mak|mes|miz|na |ne |ner|nk|nm|ns|nt|nü|ok |onu|ord|orl|p |pe|rdu|rdı|ri |rma|rs|rt|rum|rü|sab|sı|ten|ter|tir|tr|ul|unu|uğu|var|vd|zı|ç |çok|çü|önc|öne|örü|üt|üy|üyo|ğin|ğr|ğı|ık|ır |ığ|ığı| ay| be| di| do| dö| en| es| ev| ke| l| lü| ma| ok| ra| se| si| sö| to| tr| yi| yo| za| zi| ça| çü| öğ| ü|aa|aat|abı|aha|akı|akş|alı|aml|ang|ant|ap |apa|asa|ası|at |aza|azı|aç |ağ|aşl|aşı|bah|bı|cu|dah|do|duğ|dö|düz|dı |dım|dır|eh|eki|ekl|eli|ell|em |eml|enc|end|ene|enl|erd|esk|eçe|eçi|eşt|fe|fen|fi|fo|gel|gen|ger|gu|gön|ha |han|hem|hi|ins|iri|ita|izl|iğ|iği|işl|j|kal|ken|ki |kla|ks|kte|kü |kş|kşa|la |lan|lay|led|lem|leş|lg|lin|lk|lu|lü|lüt|lığ|ma |mad|mel|mey|min|mis|miy|mla|mli|müz|mı|nda|ndi|nem|ng|ngi|nin|nkü|nla|nle|nli|ntı|nu |nı|oc|ocu|oku|old|on |op|opl|oğ|per|pl|pla|rar|ray|reb|red|rek|rim|riy|riş|rka|rke|ro|rsi|run|rün|rım|sa |saa|se |sel|sk|ski|sor|sy|sö|söy|sı |ta |tap|tar|tas|tek|tel|tem|tf|tfe|tim|tma|to|top|tre|tt|tü|uk|un |und|ura|uru|ut|uyo|vde|y |ya |yal|yar|yed|yi |yil|yn|zam|zel|zer|zi |zik|zl|zle|â|ça|çal|çer|çoc|çt|çün|çı|önd|öy|öyl|öğ|ün |ünk|ünü|ütf|üş|üşt|ğim|ğl|ğun|ğın|ıkl|ılı|şa|şam|şey|şim|şin|şla|şle|şti|ştı|şı| am| ar| aç| bü| eb| ed| eg| ek| em| er| et| f| fi| ga| hâ| ik| in| ko| kü| kı| me| na| of| on| oy| pa| pr| re| tu| tı| ul| un| uy| uğ| yü| yı| çı| ül| üz|aba|ac|aca|af|aft|ah |ahv|ahç|aj|ajd|aka|akd|aki|aks|al |ala|ali|all|am |amı|ana|anl|ans|anı|apo|are|ari|ark|arl|ars|asy|ati|atm|av|ava|ay |ayd|açt|açı|ağa|ağl|aşk|aşt|ban|be |bel|ben|bev|bim|bit|biz|bug|bur|bü|büt|bım|bır|ca|cak|cek|cel|cer|cuk|cuğ|deb|dek|des|det|dey|değ|deş|did|dil|dim|din|dir|diy|diğ|dos|doğ|dum|dön|dör|düğ|dığ|ebe|ef|efo|eg|egz|ehi|ehr|ekk|ekr|elg|elt|emb|enk|enm|erf|erh|erm|ers|ert|erç|erş|esa|est|ete|ett|eve|ey |eyi|eyl|eyn|eys|ez|ez |eç |eşe|eşi|fis|fiz|fon|for|fr|fre|ft|fta|ga|gar|gi |gid|gil|gir|gis|git|gul|gun|gz|gze|gös|güv|güz|h |haf|hal|hav|hay|haz|hes|hin|hir|hr|hri|hv|hve|hâ|hâl|hç|hçe|ib|ibi|if|ifr|ih|ihi|iki|iks|il |ilg|ilk|ilm|imd|ime|ims|ine|inl|inn|ip|ipa|ird|ire|irs|it |iti|itm|iya|iye|iyl|ize|içe|içt|iş |işe|jd|jda|je|jey|ka |kah|kam|kap|kay|kd|kdi|ket|key|kez|kib|kim|kis|kiy|kiş|kk|kkü|kli|klı|km|kma|ko|kon|kr|kra|kse|ksi|kuy|kür|küç|kın|kır|kıy|lam|lat|lef|len|lge|lgi|lir|lis|liy|lk |lke|lla|lle|lli|lm|lmi|lt|ltm|lun|lus|lâ|lâ |lı |lım|lıy|lış|mas|may|mağ|mb|mbe|md|mdi|me |med|mem|meğ|ms|mse|müy|müş|mın|mıy|nas|ndu|ned|neh|nek|nel|net|nid|niy|nkl|nma|nme|nmü|nn|nne|nr|nra|ns ',
+    'uk': "о|а|н|и|і|т|в|е|р|с|д|к|у|з|и |п|л|м|я| в| п| з|о | н|а |б|ь|е |ч|на|я |ж|ти|і | д|г|за|ст|у |ра| за| м|ер| к| на|ні|ти | с|та|в |ли|но|ре|ц|щ|ю| б|й|не|по|ро|ь |ї| по|ви|до|ит|ов|х| я| і|ва|пр|ть|ш|є| т| щ|во|ен|ко|ю | до|ав|ат|го|ка|мо|од|ом|пе|ся|що| не| пр| ч| що|ан|ас|бу|ди|ере|з |ив|ити|ма|на |не |ни|ог|ос|от|пер|ся |то|тр| ви| ко| о| р| і |ад|ал|ар|ві|до |ла|ле|ли |ня|ні |рі|чи|є |ін|іс| бу| пе| ц|ді|же|ин|ки|кі|ми|ми |нн|об|ок|он|ої|ста|ть |ьо|як|ід|ї | г| мо| я | як|ай|ам|ати|ез|ис|й |к |ку|ль|му|мі|ння|нов|ня |ого|ол|ої |про|пі|ри|сл|трі|ті|ф|що |із| в | ва| л| мі| ст| та| у|ає|ає |б |буд|го |ду|же |зн|их|ка |ки |лен|лі|м |му |оди|ому|ор|рез|т |те|то |уд|ул|х |хо|ча|чн|ьк|ів|іт|іч| го| з | ма| ні| у |аж|аз|ак|ап|ас |би|ве|ви |вл|вле|вон|вс|де|дь|ем|енн|зап|зв|зу|ий|ий |кр|кра|ку |ла |міс|н |ни |нь|оп|отр|пок|пот|пра|с |ск|та |тан|ту|уж|ут|ці|че|ще|іб|ів |іл|іст| во| вп| ві| ду| ді| зв| зн| кі| пі| ре| ро| св| ф| х| хо| че| чи| ї|ав |али|аро|ач|аш|ащ|ба|бл|бн|бул|вер|вж|вп|га|год|де |дин|дит|дн|дь |діс|ень|жн|зав|зал|зи|иж|ил|их |ич|ичн|кн|кол|кіл|ло|льк|лю|мов|над|най|но |нт|ну|нц|ова|овл|ово|одн|ож|оли|они|ост|па|пи|під|рав|ращ|ре |ров|ріб|річ|св|си|ска|сла|сн|сто|сті|су|сь|сі|тьс|ті |ув|удь|ус|уст|уть|ую|фі|ця|чер|чит|шо|ще |ьом|ьс|ься|ібн|іж|ій|ік|іль|іть| б | ве| вж| вс| дв| др| зу| кн| кр| ла| лю| но| об| ос| ск| сь| те| ти| фі| це| ци| ць| ча| ще| є| є | із| ін| їх|аб|ави|авт|аг|ага|аді|ажл|ак |але|ам |ами|амо|анн|анц|апи|аск|аст|ац|ачи|аще|бе|би |бно|ва |важ|ван|вар|вже|вих|вн|вог|вої|вся|вт|втр|ву|від|г |гл|гр|гра|гу|д |да|дає|дв|дж|др|дру|дуж|діт|ег|ед|ез |ек|ені|ерш|ес|ет|ж |жд|жи|жл|жли|жна|жу|за |зам|зас|зві|зе|зич|зна|зни|зус|ив |ивс|или|ир|ист|ися|ита|ить|иш|йн|йт|каз|ком|кт|ків|кін|лас|лат|лив|лис|ля|ма |має|ме|мен|мог|мож|мор|нам|нас|наш|нив|ну |нці|нь |ніж|ніт|об |обл|ови|ожу|окр|оль|ома|она|ора|оре|осл|оті|оч|при|рам|рац|рег|рн|рні|роб|род|ру|рш|сво|сні|сти|стр|су |сьо|так|тар|тат|тв|тис|тит|том|тра|тів|уже|уз|ум|ую |фіз|ход|це|це |ци|ць|цьо|цю|ця |час|чи |чин|чне|чні|чо|ш |ша|ша |ше|ше |шої|щоб|ька|ьки|ьм|ьми|як |яки|яку|ям|ят|іж |із |ізи|ізн|ісл|іш|ію|ію |ія|ія |їд|їде|їх| а| ал| ба| бе| би| бо| бр| вд| вр| га| гр| де| ди| дя| ж| жи| зб| зд| зм| й| й | ка| кл| ли| ме| ми| му| о | он| оп| оф| па| пи| пс| ра| рі| са| си| сл| сн| то| ту| ув| фа| ці| чо| її|'|'я|'я |аба|абу|ава|авж|авл|ад |ада|адз|ади|аду|адц|аже|ажі|аз |аза|ази|азу|айб|айж|айл|айн|айс|айт|акш|акі|ала|ало|алі|ана|ани|ано|ант|ані|апу|апі|ара|аре|ари|арт|арі|асн|ат |атк|ато|ать|ах|ахо|ацю|аці|ачн|аша|ашн|ашо|ащи|аю|аю |аї|аїн|баг|бат|бач|без|бер|бит|биш|бле|бли|блі|бні|бо|бо |бр|бра|був|бі|бід|в'|в'я|вав|вад|вал|вас|вд|вдо|веч|вжд|вив|виг|вий|вил|вип|вир|вит|вно|вну|во |вод|вом|впа|впе|впр|вр|вра|вст|всі|ву |вут|вц|вцю|вч|вчи|вя|вят|вій|вік|він|вір|віт|віш|газ|гар|гат|гли|гля|гос|гот|гт|гти|гу |гул|два|дво|дем|джа|дже|дз|дзв|ди |диз|дил|дк|дка|дне|дно|дні|док|дом|доп|дор|дос|дп|дпр|дс|дси|дт|дтр|ду |дук|дум|дц|дця|дч|дчи|дьм|дя|дяк|ді |діл|еб|ебу|ев|еві|егт|егу|ед |еді|еза|езе|езп|езу|еки|еко|ел|еле|ем |ема|еми|емо|ене|ент|ер |ера|ерв|ерн|ерп|ерс|ерю|есл|еся|етв|ете|еф|ефо|еч|ече|ею|ею |еї|еїж|жа|жат|жб|жби|ждж|жди|жен|жет|жив|жин|жк|жку|жня|жу |жут|жч|жча|жі|жі |заб|зад|зай|зак|зач|зб|збе|зве|зво|зд|здо|зер|зею|зин|зм|змі|зно|зп|зпе|зул|зую|зч|зча|зя|зям|иви|ивн|иву|ивч|иві|иг|игл|ижк|ижн|ижч|из|иза|ик|ик |ила|им|имк|ин |ине|инк|ино|ину|иня|ині|ип|ипр|иро|ирь|исн|ису|иф|ифр|ихо|ихі|иш |иши|иє|иєм|иї|иїд|йб|йбл|йж|йже|йл|йлі|йн |йно|йс|йсм|йте|йти|кав|каж|кає|кий|ких|кл|клі|кна|кни|кно|ков|кож|кон|коп|кот|кош|кт |кти|кум|кую|кш|кше|кщ|кщо|ле |лем|леф",
+}
@@ -0,0 +1,149 @@
+"""
+Tranfastic Segmenter Module
+Splits long text into sentence segments and keeps the whitespace between them
+"""
+
+import re
+from typing import List, Tuple
+
+# (piece, translatable): sentences are translatable, separators are kept verbatim
+Piece = Tuple[str, bool]
+
+# Longest segment sent to a backend (Google rejects requests above 5000 characters)
+MAX_SEGMENT_CHARS = 4500
+
+# Line breaks together with surrounding whitespace
+_LINE_SEPARATOR = re.compile(r"[ \t\f\v]*(?:\r?\n[ \t\f\v]*)+")
+
+# Sentence end: terminal punctuation with closing quotes/brackets, then whitespace;
+# CJK full-width terminals end a sentence without following whitespace
+_SENTENCE_END = re.compile(r"[.!?…]+[\"'”’»)\]]*(\s+)(?=\S)|[。！？]+[」』”）]*(\s*)(?=\S)")
+
+# Words whose trailing period does not end a sentence
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e",
+    "no", "nr", "inc", "ltd", "co", "corp", "fig", "approx", "dept", "z.b", "bzw", "usw",
+}
+
+def _is_abbreviation(sentence: str) -> bool:
+    """Check if a sentence candidate ends in an abbreviation or an initial"""
+    if not sentence.endswith("."):
+        return False
+    word = sentence[:-1].rsplit(None, 1)[-1].lower() if sentence[:-1].strip() else ""
+    word = word.lstrip("(\"'“‘«[")
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+def _split_long(sentence: str, max_chars: int) -> List[Piece]:
+    """Split an over-long sentence at whitespace (or hard) so each part fits max_chars"""
+    pieces: List[Piece] = []
+    while len(sentence) > max_chars:
+        cut = sentence.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            pieces.append((sentence[:max_chars], True))
+            sentence = sentence[max_chars:]
+            continue
+        pieces.append((sentence[:cut], True))
+        pieces.append((" ", False))
+        sentence = sentence[cut + 1:]
+    if sentence:
+        pieces.append((sentence, True))
+    return pieces
+
+def _split_sentences(line: str, max_chars: int) -> List[Piece]:
+    """Split one line into sentences and the whitespace between them"""
+    pieces: List[Piece] = []
+    start = 0
+    for match in _SENTENCE_END.finditer(line):
+        gap_start = match.start(1) if match.group(1) is not None else match.start(2)
+        sentence = line[start:gap_start]
+        if _is_abbreviation(sentence):
+            continue
+        pieces.extend(_split_long(sentence, max_chars))
+        gap = line[gap_start:match.end()]
+        if gap:
+            pieces.append((gap, False))
+        start = match.end()
+    pieces.extend(_split_long(line[start:], max_chars))
+    return pieces
+
+def segment_text(text: str, max_chars: int = MAX_SEGMENT_CHARS) -> List[Piece]:
+    """
+    Split text into sentence segments
+
+    Line breaks and the whitespace around sentences become separator pieces,
+    so "".join(piece for piece, _ in segment_text(text)) == text.
+
+    Args:
+        text: Text to split
+        max_chars: Longest allowed segment
+
+    Returns:
+        List of (piece, translatable) tuples
+    """
+    pieces: List[Piece] = []
+    stripped = text.strip()
+    if not stripped:
+        return [(text, False)] if text else []
+
+    leading = text[:len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+    if leading:
+        pieces.append((leading, False))
+
+    start = 0
+    for match in _LINE_SEPARATOR.finditer(stripped):
+        pieces.extend(_split_sentences(stripped[start:match.start()], max_chars))
+        pieces.append((match.group(), False))
+        start = match.end()
+    pieces.extend(_split_sentences(stripped[start:], max_chars))
+
+    if trailing:
+        pieces.append((trailing, False))
+    return pieces
+
+def merge_segments(pieces: List[Piece], max_chars: int = MAX_SEGMENT_CHARS) -> List[Piece]:
+    """
+    Merge neighbouring sentences, with the separators between them, into as few segments as fit max_chars
+
+    Used for backends that take one text per call, where many short segments
+    would mean many backend calls.
+
+    Args:
+        pieces: Output of segment_text
+        max_chars: Longest merged segment
+    """
+    merged: List[Piece] = []
+    run = ""  # Current merged segment, starts and ends with a sentence
+    gap = ""  # Separators after the run's last sentence
+    for piece, translatable in pieces:
+        if not translatable:
+            if run:
+                gap += piece
+            else:
+                merged.append((piece, False))
+            continue
+        if run and len(run) + len(gap) + len(piece) <= max_chars:
+            run += gap + piece
+        else:
+            if run:
+                merged.append((run, True))
+            if gap:
+                merged.append((gap, False))
+            run = piece
+        gap = ""
+    if run:
+        merged.append((run, True))
+    if gap:
+        merged.append((gap, False))
+    return merged
+
+def join_segments(pieces: List[Piece], translations: List[str]) -> str:
+    """
+    Reassemble text from pieces, replacing translatable ones in order
+
+    Args:
+        pieces: Output of segment_text
+        translations: One translation per translatable piece
+    """
+    translated = iter(translations)
+    return "".join(next(translated) if translatable else piece for piece, translatable in pieces)
@@ -0,0 +1,198 @@
+"""
+Tranfastic Subtitles Module
+SRT and WebVTT translation that rewrites only cue text, keeping numbering and timing
+
+Files are split into blank-line separated blocks. Blocks with a "-->" timing
+line are cues: everything up to the timing line (number or identifier, timing,
+VTT cue settings) is kept verbatim and only the text lines after it are
+translated. Other blocks (WEBVTT header, NOTE, STYLE, REGION) are kept as is.
+Files run through the resumable file pipeline in chunks of whole blocks.
+"""
+
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .file_pipeline import DEFAULT_CONCURRENCY, FileTranslationJob
+from .translator import TranslationEngine, TranslationResult, translator_engine
+
+# File extensions handled as subtitles
+SUBTITLE_EXTENSIONS = (".srt", ".vtt")
+
+# Blank lines between blocks
+_BLOCK_SEPARATOR = re.compile(r"(\r?\n(?:[ \t]*\r?\n)+)")
+
+# Line ending, kept when splitting a block into lines
+_LINE_BREAK = re.compile(r"(\r?\n)")
+
+# Dialogue line of one speaker ("- Hello.")
+_DIALOGUE_LINE = re.compile(r"^\s*[-–—]")
+
+def is_subtitle_file(path) -> bool:
+    """Check if a file should be translated as subtitles (by extension)"""
+    return Path(path).suffix.lower() in SUBTITLE_EXTENSIONS
+
+def wrap_lines(text: str, count: int) -> List[str]:
+    """
+    Break text into count lines of similar length at spaces
+
+    Returns:
+        Up to count lines (fewer if text has too few words)
+    """
+    words = text.split()
+    if count <= 1 or len(words) <= 1:
+        return [" ".join(words)]
+    lines: List[str] = []
+    remaining = len(text)
+    while words and len(lines) < count - 1:
+        target = remaining / (count - len(lines))
+        line = words.pop(0)
+        while words and abs(len(line) + 1 + len(words[0]) - target) <= abs(len(line) - target):
+            line += " " + words.pop(0)
+        lines.append(line)
+        remaining -= len(line) + 1
+    if words:
+        lines.append(" ".join(words))
+    return lines
+
+class SubtitleDocument:
+    """A parsed SRT or WebVTT file that can be rendered back with translated cue text"""
+
+    def __init__(self, content: str):
+        """
+        Args:
+            content: Subtitle file content
+        """
+        # Blocks at even indexes, separators between them at odd ones
+        self._parts = _BLOCK_SEPARATOR.split(content)
+        # (part index, header lines, text lines, line ending) per cue
+        self.cues: List[Tuple[int, List[str], List[str], str]] = []
+        for index in range(0, len(self._parts), 2):
+            pieces = _LINE_BREAK.split(self._parts[index])
+            lines, endings = pieces[0::2], pieces[1::2]
+            timing = next((number for number, line in enumerate(lines) if "-->" in line), None)
+            if timing is None:
+                continue
+            self.cues.append((index, lines[:timing + 1], lines[timing + 1:], endings[0] if endings else "\n"))
+
+    def units(self) -> List[List[str]]:
+        """
+        Get the texts to translate for each cue
+
+        A cue's lines are joined into one sentence (translated with full context
+        and re-wrapped afterwards), except dialogue cues where every line is a
+        different speaker and is translated on its own.
+        """
+        units = []
+        for _, _, text_lines, _ in self.cues:
+            lines = [line.strip() for line in text_lines if line.strip()]
+            if len(lines) > 1 and all(_DIALOGUE_LINE.match(line) for line in lines):
+                units.append(lines)
+            else:
+                units.append([" ".join(lines)] if lines else [])
+        return units
+
+    def render(self, translations: Optional[List[List[str]]] = None) -> str:
+        """
+        Rebuild the file, with translated cue text if given
+
+        Args:
+            translations: One list per cue, matching units()
+        """
+        parts = list(self._parts)
+        if translations is not None:
+            for (index, header, text_lines, ending), translated in zip(self.cues, translations):
+                lines = [line for line in text_lines if line.strip()]
+                if len(translated) == 1 and len(lines) > 1:
+                    translated = wrap_lines(translated[0], len(lines))
+                parts[index] = ending.join(header + translated + text_lines[len(lines):])
+        return "".join(parts)
+
+def _unit_translations(units: List[List[str]], results: List[TranslationResult]) -> Tuple[List[List[str]], int]:
+    """
+    Group translation results of the flattened units back per cue
+
+    Returns:
+        Tuple of (translations for SubtitleDocument.render, number of failed texts kept as is)
+    """
+    translated_texts = iter(results)
+    translations = []
+    failed = 0
+    for unit in units:
+        translated_unit = []
+        for text in unit:
+            translated_text, _, success = next(translated_texts)
+            if not success:
+                failed += 1
+                translated_text = text
+            translated_unit.append(translated_text)
+        translations.append(translated_unit)
+    return translations, failed
+
+def translate_subtitles(content: str, source_lang: str = "auto", target_lang: str = "en",
+                        engine: Optional[TranslationEngine] = None) -> Tuple[str, dict]:
+    """
+    Translate the cue text of SRT or WebVTT content
+
+    All cue texts go through one translate_many call, so repeated lines are
+    translated once and cached ones never reach the backend.
+
+    Returns:
+        Tuple of (translated content, statistics: cues, texts, unique, chars, failed, elapsed)
+    """
+    engine = engine or translator_engine
+    start = time.perf_counter()
+    document = SubtitleDocument(content)
+    units = document.units()
+    texts = [text for unit in units for text in unit]
+    results = engine.translate_many(texts, source_lang, target_lang)
+    translations, failed = _unit_translations(units, results)
+
+    stats = {
+        "cues": len(document.cues),
+        "texts": len(texts),
+        "unique": len(set(texts)),
+        "chars": sum(len(text) for text in texts),
+        "failed": failed,
+        "elapsed": time.perf_counter() - start,
+    }
+    logging.getLogger(__name__).info(f"Subtitle translation: {stats}")
+    return document.render(translations), stats
+
+class SubtitleTranslationJob(FileTranslationJob):
+    """
+    Translates the cue text of an SRT or WebVTT file, resumable through a checkpoint file
+
+    Chunks end after blank lines so every cue is translated whole; the
+    statistics count cue texts as lines.
+    """
+
+    blocks = True
+
+    async def _translate_chunk(self, chunk: bytes) -> Tuple[bytes, int, int, int]:
+        """
+        Translate the cue text of the blocks in one chunk
+
+        Returns:
+            Tuple of (translated chunk, cue texts, characters, failed cue texts)
+        """
+        document = SubtitleDocument(chunk.decode("utf-8", errors="replace"))
+        units = document.units()
+        texts = [text for unit in units for text in unit]
+        results, _ = await self._translate_texts(texts, len(chunk))
+        translations, failed = _unit_translations(units, results)
+        return document.render(translations).encode("utf-8"), len(texts), sum(len(text) for text in texts), failed
+
+def translate_subtitle_file(input_path, output_path, source_lang: str = "auto", target_lang: str = "en",
+                            engine: Optional[TranslationEngine] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                            resume: bool = True, on_progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """
+    Translate an SRT or WebVTT file in chunks of whole cues (UTF-8, a byte order mark is kept)
+
+    Returns:
+        Job statistics (see FileTranslationJob.run)
+    """
+    job = SubtitleTranslationJob(input_path, output_path, source_lang, target_lang, concurrency, engine=engine)
+    return job.run(resume=resume, on_progress=on_progress)
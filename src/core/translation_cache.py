@@ -0,0 +1,318 @@
+"""
+Tranfastic Translation Cache Module
+In-memory LRU and persistent on-disk caches for translation results
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+CacheValue = Tuple[str, Optional[str]]
+
+# Compact the on-disk cache after this many writes
+COMPACT_EVERY_WRITES = 500
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for cache lookups (Unicode NFC, collapsed spaces)
+
+    Line breaks and blank lines are kept: texts laid out differently are
+    translated (and cached) separately, so a cached result never reflows
+    the user's text.
+    """
+    lines = unicodedata.normalize("NFC", text).strip().replace("\r\n", "\n").split("\n")
+    return "\n".join(" ".join(line.split()) for line in lines)
+
+def make_cache_key(text: str, source_lang: str, target_lang: str) -> CacheKey:
+    """Build a cache key from text and language pair"""
+    return (normalize_text(text), source_lang, target_lang)
+
+class TranslationCache:
+    """Thread-safe LRU cache bounded by entry count and total byte size"""
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 2 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CacheValue]" = OrderedDict()
+        self._sizes: Dict[CacheKey, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(key: CacheKey, value: CacheValue) -> int:
+        """Approximate memory footprint of an entry in bytes (UTF-8 payload)"""
+        translated_text, detected_lang = value
+        size = sum(len(part.encode("utf-8")) for part in key)
+        size += len(translated_text.encode("utf-8"))
+        if detected_lang:
+            size += len(detected_lang)
+        return size
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        """Get cached value and mark it as recently used"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: CacheKey, value: CacheValue):
+        """Store value, evicting least recently used entries if over limits"""
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return  # Never cache a single entry larger than the whole cache
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._sizes[key]
+                self._entries.move_to_end(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+                old_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Current total size of cached entries in bytes"""
+        return self._total_bytes
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+class PersistentTranslationCache:
+    """
+    SQLite-backed translation cache shared across application restarts
+
+    Entries past their TTL are no longer served as fresh, but are kept for
+    stale_days longer as fallback while backends are unavailable.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_days: float = 30, max_entries: int = 50000,
+                 stale_days: float = 365):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or (Path.home() / ".tranfastic" / "translation_cache.db")
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.stale_seconds = stale_days * 24 * 60 * 60
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes_since_compact = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                source_text TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                detected_lang TEXT,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (source_text, source_lang, target_lang)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used)")
+        self._conn.commit()
+
+    def configure(self, ttl_days: Optional[float] = None, max_entries: Optional[int] = None,
+                  stale_days: Optional[float] = None):
+        """Update expiry, stale grace period and size cap"""
+        if ttl_days is not None:
+            self.ttl_seconds = ttl_days * 24 * 60 * 60
+        if stale_days is not None:
+            self.stale_seconds = stale_days * 24 * 60 * 60
+        if max_entries is not None:
+            self.max_entries = max_entries
+
+    def get(self, key: CacheKey, allow_expired: bool = False) -> Optional[CacheValue]:
+        """
+        Get cached value if present and not expired
+        
+        Args:
+            key: Cache key
+            allow_expired: Also return entries past their TTL (stale fallback)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated_text, detected_lang, created_at FROM translations "
+                "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                key
+            ).fetchone()
+            if row is None or (not allow_expired and now - row[2] > self.ttl_seconds):
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE translations SET last_used = ? "
+                "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                (now, *key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0], row[1]
+
+    def put(self, key: CacheKey, value: CacheValue):
+        """Store value, compacting the database every so often"""
+        translated_text, detected_lang = value
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(source_text, source_lang, target_lang, translated_text, detected_lang, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, translated_text, detected_lang, now, now)
+            )
+            self._conn.commit()
+            self._writes_since_compact += 1
+            should_compact = self._writes_since_compact >= COMPACT_EVERY_WRITES
+        if should_compact:
+            self.compact()
+
+    def get_many(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, CacheValue]:
+        """
+        Look up several keys in one transaction
+
+        Returns:
+            Dict of the keys that were found and not expired
+        """
+        now = time.time()
+        found: Dict[CacheKey, CacheValue] = {}
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT translated_text, detected_lang, created_at FROM translations "
+                    "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                    key
+                ).fetchone()
+                if row is None or now - row[2] > self.ttl_seconds:
+                    self.misses += 1
+                else:
+                    found[key] = (row[0], row[1])
+            if found:
+                self._conn.executemany(
+                    "UPDATE translations SET last_used = ? "
+                    "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                    [(now, *key) for key in found]
+                )
+                self._conn.commit()
+            self.hits += len(found)
+        return found
+
+    def put_many(self, items: List[Tuple[CacheKey, CacheValue]]):
+        """Store several values in one transaction"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(source_text, source_lang, target_lang, translated_text, detected_lang, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*key, translated_text, detected_lang, now, now) for key, (translated_text, detected_lang) in items]
+            )
+            self._conn.commit()
+            self._writes_since_compact += len(items)
+            should_compact = self._writes_since_compact >= COMPACT_EVERY_WRITES
+        if should_compact:
+            self.compact()
+
+    def compact(self, vacuum: bool = False) -> int:
+        """
+        Remove entries past TTL and stale grace period, and trim to the size cap (least recently used first)
+        
+        Args:
+            vacuum: Also rebuild the database file to reclaim free pages
+            
+        Returns:
+            Number of removed entries
+        """
+        cutoff = time.time() - self.ttl_seconds - self.stale_seconds
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM translations WHERE created_at < ?", (cutoff,)).rowcount
+            count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM translations WHERE (source_text, source_lang, target_lang) IN ("
+                    "SELECT source_text, source_lang, target_lang FROM translations ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+            self._conn.commit()
+            self._writes_since_compact = 0
+            if vacuum:
+                self._conn.execute("VACUUM")
+        if removed:
+            self.logger.info(f"Translation cache compacted, removed {removed} entries")
+        return removed
+
+    def most_recent(self, limit: int):
+        """Get the most recently used non-expired entries as (key, value) pairs"""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_text, source_lang, target_lang, translated_text, detected_lang FROM translations "
+                "WHERE created_at >= ? ORDER BY last_used DESC LIMIT ?",
+                (cutoff, limit)
+            ).fetchall()
+        return [((row[0], row[1], row[2]), (row[3], row[4])) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl_days": self.ttl_seconds / (24 * 60 * 60),
+            "stale_days": self.stale_seconds / (24 * 60 * 60),
+            "hits": self.hits,
+            "misses": self.misses,
+            "path": str(self.db_path),
+        }
+
+    def close(self):
+        """Close the database connection (safe to call more than once)"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,198 @@
+"""
+Tranfastic Translation Memory Module
+Fuzzy matching of new text against past translations (MinHash LSH index over history)
+"""
+
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Tuple
+
+from .history_store import HistoryStore, history_store
+from .translation_cache import normalize_text
+
+# (translated_text, similarity 0..1, matched_source_text)
+MemoryMatch = Tuple[str, float, str]
+
+# MinHash signature: BANDS bands of ROWS hashes. Two texts with Jaccard
+# similarity s share at least one band with probability 1 - (1 - s^ROWS)^BANDS,
+# about 0.95 for s = 0.7 and 0.2 for s = 0.3
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+
+# One random 64-bit mask per hash function: min(hash ^ mask) over a set is a
+# cheap stand-in for a random permutation
+_MASKS = [random.Random(seed).getrandbits(64) for seed in range(NUM_PERM)]
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+def shingles(text: str) -> FrozenSet[str]:
+    """
+    Get the shingle set of text
+
+    Words and word pairs with all numbers replaced by "0", so templates
+    differing only in numbers look identical; very short texts use
+    character trigrams instead.
+    """
+    normalized = _NUMBER.sub("0", normalize_text(text).lower())
+    tokens = _TOKEN.findall(normalized)
+    if len(tokens) < 3:
+        padded = f" {normalized} "
+        return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+def minhash(shingle_set: FrozenSet[str]) -> Tuple[int, ...]:
+    """Compute the MinHash signature of a shingle set"""
+    hashes = [hash(shingle) & 0xFFFFFFFFFFFFFFFF for shingle in shingle_set]
+    return tuple(min(h ^ mask for h in hashes) for mask in _MASKS)
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """Jaccard similarity of two sets"""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+def adapt_numbers(text: str, matched_source: str, matched_translation: str) -> str:
+    """
+    Carry numbers of text over into a fuzzy match's translation
+
+    Numbers are swapped only when both sources have the same count of numbers
+    and every number of the matched source appears in its translation.
+    """
+    new_numbers = _NUMBER.findall(text)
+    old_numbers = _NUMBER.findall(matched_source)
+    if len(new_numbers) != len(old_numbers) or new_numbers == old_numbers:
+        return matched_translation
+    mapping: Dict[str, str] = {}
+    for old, new in zip(old_numbers, new_numbers):
+        if mapping.setdefault(old, new) != new:
+            return matched_translation  # Same number maps to two different ones
+    if any(old not in _NUMBER.findall(matched_translation) for old in mapping):
+        return matched_translation
+    return _NUMBER.sub(lambda match: mapping.get(match.group(), match.group()), matched_translation)
+
+class TranslationMemory:
+    """In-memory fuzzy index over past translations"""
+
+    def __init__(self, store: Optional[HistoryStore] = None, min_similarity: float = 0.7,
+                 max_entries: int = 20000):
+        """
+        Args:
+            store: History store the memory is loaded from
+            min_similarity: Lowest Jaccard similarity reported as a match
+            max_entries: Entries kept (oldest are dropped first)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store = store or history_store
+        self.min_similarity = min_similarity
+        self.max_entries = max_entries
+        self.loaded = False
+        self._next_id = 0
+        # id -> (pair, normalized source, shingles, signature, source_text, translated_text)
+        self._entries: Dict[int, tuple] = {}
+        self._by_source: Dict[tuple, int] = {}
+        self._buckets: Dict[tuple, List[int]] = {}
+        self._order: Deque[int] = deque()
+        self._lock = threading.Lock()
+        self._load_thread: Optional[threading.Thread] = None
+
+    def start_background_load(self):
+        """Fill the memory from translation history without blocking the caller"""
+        if self._load_thread is None:
+            self._load_thread = threading.Thread(target=self.load, name="TranslationMemoryLoad", daemon=True)
+            self._load_thread.start()
+
+    def load(self) -> int:
+        """
+        Fill the memory from translation history (newest entries win)
+
+        Returns:
+            Number of indexed entries
+        """
+        start = time.perf_counter()
+        try:
+            rows = self.store.search(page_size=self.max_entries)
+        except Exception as e:
+            self.logger.error(f"Failed to load translation memory: {e}")
+            return 0
+        for row in reversed(rows):
+            self.add(row["source_text"], row["translated_text"], row["source_lang"], row["target_lang"])
+        self.loaded = True
+        self.logger.info(f"Translation memory loaded {len(self._entries)} entries in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return len(self._entries)
+
+    def _band_keys(self, pair: tuple, signature: Tuple[int, ...]) -> List[tuple]:
+        return [(pair, band, signature[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+
+    def add(self, source_text: str, translated_text: str, source_lang: str, target_lang: str):
+        """Index a translation (replaces an earlier one of the same text)"""
+        if not source_text.strip() or not translated_text.strip():
+            return
+        pair = (source_lang, target_lang)
+        normalized = normalize_text(source_text)
+        shingle_set = shingles(source_text)
+        signature = minhash(shingle_set)
+        with self._lock:
+            previous = self._by_source.get((pair, normalized))
+            if previous is not None:
+                self._remove(previous)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (pair, normalized, shingle_set, signature, source_text, translated_text)
+            self._by_source[(pair, normalized)] = entry_id
+            for key in self._band_keys(pair, signature):
+                self._buckets.setdefault(key, []).append(entry_id)
+            self._order.append(entry_id)
+            while len(self._entries) > self.max_entries:
+                oldest = self._order.popleft()
+                if oldest in self._entries:
+                    self._remove(oldest)
+
+    def _remove(self, entry_id: int):
+        """Drop an entry from all indexes (lock held)"""
+        pair, normalized, _, signature, _, _ = self._entries.pop(entry_id)
+        self._by_source.pop((pair, normalized), None)
+        for key in self._band_keys(pair, signature):
+            bucket = self._buckets.get(key)
+            if bucket:
+                bucket.remove(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> Optional[MemoryMatch]:
+        """
+        Find the most similar past translation
+
+        Returns:
+            Tuple of (translated_text, similarity, matched_source_text), None without a match
+            at or above min_similarity. Numbers in the translation are adapted to text.
+        """
+        if not text.strip():
+            return None
+        pair = (source_lang, target_lang)
+        shingle_set = shingles(text)
+        signature = minhash(shingle_set)
+        best_id, best_similarity = None, 0.0
+        with self._lock:
+            candidates = set()
+            for key in self._band_keys(pair, signature):
+                candidates.update(self._buckets.get(key, ()))
+            for entry_id in candidates:
+                similarity = jaccard(shingle_set, self._entries[entry_id][2])
+                if similarity > best_similarity:
+                    best_id, best_similarity = entry_id, similarity
+            if best_id is None or best_similarity < self.min_similarity:
+                return None
+            _, _, _, _, source_text, translated_text = self._entries[best_id]
+        return adapt_numbers(text, source_text, translated_text), best_similarity, source_text
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Global translation memory instance
+translation_memory = TranslationMemory()
@@ -1,45 +1,382 @@
 """
 Tranfastic Translator Module
-Handles translation operations using Google Translate API
+Handles translation operations through a pluggable backend (Google Translate by default)
 """
 
 import asyncio
-from typing import Optional, Tuple
-from googletrans import Translator, LANGUAGES
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import logging
-from pathlib import Path
-from datetime import datetime
+
+from .backends import BackendUnavailableError, GoogleBackend, RateLimitedError, TranslationBackend, create_backend_chain
+from .event_loop import event_loop
+from .glossary import Glossary, glossary
+from .history_writer import history_writer
+from .langid import SCRIPT_ONLY_CONFIDENCE, Detection, language_identifier
+from .segmenter import MAX_SEGMENT_CHARS, Piece, join_segments, merge_segments, segment_text
+from .translation_cache import CacheKey, TranslationCache, PersistentTranslationCache, make_cache_key
+from .translation_memory import translation_memory
+
+# Number of recently used disk cache entries loaded into memory at startup
+CACHE_WARM_ENTRIES = 500
+
+# Size of the worker pool for blocking work (persistent cache I/O)
+TRANSLATION_WORKERS = 4
+
+# Upper bound for one backend call including hedges and failover, in seconds
+TRANSLATION_TIMEOUT = 30.0
+
+# Texts at least this long are split into sentences translated (and cached) separately
+SEGMENT_MIN_CHARS = 200
+
+# Local language detections at least this certain are trusted for cache keys
+LOCAL_DETECT_MIN_CONFIDENCE = 0.95
+
+# Auto-detected text already in the target language is returned unchanged
+# (no backend call) when the local detector is at least this certain
+SAME_LANGUAGE_MIN_CONFIDENCE = 0.95
+
+# Backend calls a translate_many() runs at the same time by default
+BATCH_CONCURRENCY = 4
+
+TranslationResult = Tuple[str, Optional[str], bool]
+
+class TranslationRequest:
+    """Handle for a translation submitted to the engine's event loop"""
+    
+    def __init__(self, text: str, source_lang: str, target_lang: str, segmented: bool = False):
+        self.text = text
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.segmented = segmented
+        self.future: Optional[Future] = None
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """
+        Cancel the request
+        
+        A request that has not started yet never runs. A request already
+        talking to the backend is cancelled on the event loop, which aborts
+        its HTTP request.
+        """
+        self._cancel_event.set()
+        if self.future:
+            self.future.cancel()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Check if the request has been cancelled"""
+        return self._cancel_event.is_set()
+    
+    def done(self) -> bool:
+        """Check if the request has finished or been cancelled"""
+        return self.future is not None and self.future.done()
+    
+    def result(self, timeout: Optional[float] = None) -> TranslationResult:
+        """Wait for and return (translated_text, detected_language, success)"""
+        return self.future.result(timeout)
+    
+    def add_done_callback(self, callback: Callable[["TranslationRequest"], None]):
+        """Call callback(request) from the event loop thread once the request completes"""
+        self.future.add_done_callback(lambda _: callback(self))
 
 class TranslationEngine:
-    """Google Translate API wrapper for Tranfastic"""
+    """
+    Translation engine for Tranfastic (caching, connection state)
+    
+    Translations run as coroutines on a dedicated event loop thread, so many
+    concurrent requests share the backends' pooled keep-alive connections.
+    Blocking callers use translate() or submit_translation(), which bridge to
+    the loop through futures.
+    """
     
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, backend: Optional[TranslationBackend] = None):
+        """
+        Args:
+            backend: Translation backend, defaults to Google Translate
+        """
+        # Construction is cheap: the backend client, persistent cache and
+        # connection probe are all deferred (see start_background_init)
         self.logger = logging.getLogger(__name__)
-        self._connection_status = False
-        self._test_connection()
+        self._backend_settings: Optional[tuple] = None
+        self._backend_options: dict = {}
+        if backend is None:
+            self._backend_settings = self._read_backend_settings({})
+            backend = self._create_backend(self._backend_settings)
+        self.backend = backend
+        self._connection_status: Optional[bool] = None
+        self._last_success: Optional[float] = None
+        self._connection_listeners: List[Callable[[bool], None]] = []
+        self._init_thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.cache = TranslationCache()
+        self.disk_cache: Optional[PersistentTranslationCache] = None
+        self._disk_cache_settings: dict = {}
+        self.segment_min_chars = SEGMENT_MIN_CHARS
+        self.same_language_min_confidence = SAME_LANGUAGE_MIN_CONFIDENCE
+        self.round_trips_saved = 0
+        self.glossary: Glossary = glossary
+    
+    def set_backend(self, backend: TranslationBackend):
+        """Replace translation backend (in-memory cache is cleared)"""
+        old_backend = self.backend
+        self.backend = backend
+        self.cache.clear()
+        self._connection_status = None
+        old_backend.close()
+    
+    def start_background_init(self):
+        """Open the persistent cache without blocking the caller"""
+        if self._init_thread is not None:
+            return
+        self._init_thread = threading.Thread(target=self._background_init, name="TranslationEngineInit", daemon=True)
+        self._init_thread.start()
+    
+    def wait_until_initialized(self, timeout: Optional[float] = None):
+        """Block until background initialization has finished (no-op if it was never started)"""
+        if self._init_thread is not None:
+            self._init_thread.join(timeout)
+    
+    def _background_init(self):
+        """Background part of engine startup"""
+        self._open_disk_cache()
+    
+    def add_connection_listener(self, callback: Callable[[bool], None]):
+        """
+        Register a callback for connection status changes
+        
+        Callbacks are invoked from the thread that observed the change.
+        """
+        self._connection_listeners.append(callback)
+    
+    def _set_connection_status(self, status: bool):
+        """Update connection status and notify listeners on change"""
+        changed = status != self._connection_status
+        self._connection_status = status
+        if changed:
+            for callback in list(self._connection_listeners):
+                try:
+                    callback(status)
+                except Exception as e:
+                    self.logger.error(f"Connection listener failed: {e}")
+    
+    def _open_disk_cache(self):
+        """Open persistent cache and warm the in-memory cache from it"""
+        try:
+            self.disk_cache = PersistentTranslationCache(**self._disk_cache_settings)
+            for key, value in reversed(self.disk_cache.most_recent(CACHE_WARM_ENTRIES)):
+                self.cache.put(key, value)
+            threading.Thread(target=self.disk_cache.compact, name="CacheCompaction", daemon=True).start()
+        except Exception as e:
+            self.disk_cache = None
+            self.logger.error(f"Persistent translation cache unavailable: {e}")
+    
+    @staticmethod
+    def _read_backend_settings(config) -> tuple:
+        """Extract backend settings from config (a dict or Config)"""
+        return (
+            tuple(config.get("translation_backends", [GoogleBackend.name])),
+            repr(config.get("backend_options", {})),
+            config.get("rate_limit_per_second", 5),
+            config.get("rate_limit_burst", 10),
+            config.get("breaker_failure_threshold", 5),
+            config.get("rate_limit_max_wait", 0.25),
+        )
+    
+    def _create_backend(self, settings: tuple) -> TranslationBackend:
+        """Build guarded backend (or dispatcher) from settings tuple"""
+        names, _, rate_limit, burst, failure_threshold, rate_limit_max_wait = settings
+        return create_backend_chain(
+            names, self._backend_options,
+            rate_limit=rate_limit, burst=burst, failure_threshold=failure_threshold,
+            rate_limit_max_wait=rate_limit_max_wait
+        )
+    
+    def configure(self, config):
+        """Apply backend, cache and segmentation settings from application config"""
+        settings = self._read_backend_settings(config)
+        if settings[0] and settings != self._backend_settings:
+            try:
+                self._backend_options = config.get("backend_options", {})
+                self.set_backend(self._create_backend(settings))
+                self._backend_settings = settings
+                self.logger.info(f"Translation backends: {', '.join(settings[0])}")
+            except Exception as e:
+                self.logger.error(f"Invalid translation backend settings {settings[0]}: {e}")
+        
+        # Kept for the persistent cache, which may only be opened later by background init
+        self._disk_cache_settings = {
+            "ttl_days": config.get("cache_ttl_days", 30),
+            "max_entries": config.get("cache_max_entries", 50000),
+            "stale_days": config.get("cache_stale_days", 365),
+        }
+        if self.disk_cache is not None:
+            self.disk_cache.configure(**self._disk_cache_settings)
+        self.segment_min_chars = config.get("segment_min_chars", SEGMENT_MIN_CHARS)
+        self.same_language_min_confidence = config.get("same_language_min_confidence", SAME_LANGUAGE_MIN_CONFIDENCE)
+    
+    def _same_language_result(self, text: str, source_lang: str, target_lang: str,
+                              detection: Optional[Detection] = None) -> Optional[TranslationResult]:
+        """
+        Get the input itself as result if it is already in the target language, else None
+
+        Only trusts detections that langid checked against every profile: text
+        in a language without one is detected as None, never as its nearest
+        profiled neighbour.
+        """
+        if len(text) >= self.segment_min_chars:
+            return None  # Long texts may mix languages: their segments are checked one by one
+        if source_lang == "auto":
+            detected_lang, confidence = detection or language_identifier.detect_cached(text)
+            if detected_lang != target_lang or confidence < self.same_language_min_confidence:
+                return None
+            if confidence <= SCRIPT_ONLY_CONFIDENCE:
+                return None  # Script-only guess, never trusted whatever the configured threshold
+        elif source_lang != target_lang:
+            return None
+        self.round_trips_saved += 1
+        return text, target_lang, True
+    
+    @staticmethod
+    def _resolve_source(text: str, source_lang: str, detection: Optional[Detection] = None) -> str:
+        """Replace "auto" by the locally detected language when the detection is certain"""
+        if source_lang == "auto":
+            detected_lang, confidence = detection or language_identifier.detect_cached(text)
+            if detected_lang and confidence >= LOCAL_DETECT_MIN_CONFIDENCE:
+                return detected_lang
+        return source_lang
+    
+    @classmethod
+    def _cache_key(cls, text: str, source_lang: str, target_lang: str, detection: Optional[Detection] = None) -> CacheKey:
+        """
+        Build cache key for a request
+        
+        Auto-detect requests are keyed by the locally detected language when it
+        is certain, so they share entries with requests naming that language.
+        """
+        return make_cache_key(text, cls._resolve_source(text, source_lang, detection), target_lang)
+    
+    def _protect_terms(self, text: str, source_lang: str, target_lang: str,
+                       detection: Optional[Detection] = None) -> Tuple[str, List[str]]:
+        """
+        Swap glossary terms for placeholders before translation
+        
+        The protected text is what gets cached, so glossary edits never serve
+        translations made with the old terms.
+        """
+        try:
+            return self.glossary.protect(text, self._resolve_source(text, source_lang, detection), target_lang)
+        except Exception as e:
+            self.logger.error(f"Glossary matching failed: {e}")
+            return text, []
+    
+    def _restore_terms(self, result: TranslationResult, replacements: List[str]) -> TranslationResult:
+        """Put glossary terms into a successful translation"""
+        translated_text, detected_lang, success = result
+        if not replacements or not success:
+            return result
+        return self.glossary.restore(translated_text, replacements), detected_lang, True
+    
+    def _disk_cache_get(self, cache_key):
+        """Look up the persistent cache, promoting hits to the memory cache (blocking)"""
+        try:
+            cached = self.disk_cache.get(cache_key)
+        except Exception as e:
+            self.logger.error(f"Persistent cache read failed: {e}")
+            return None
+        if cached is not None:
+            self.cache.put(cache_key, cached)
+        return cached
+    
+    def _stale_cache_get(self, cache_key):
+        """Look up persistent cache ignoring expiry (used while the backend is unavailable)"""
+        if self.disk_cache is None:
+            return None
+        try:
+            return self.disk_cache.get(cache_key, allow_expired=True)
+        except Exception as e:
+            self.logger.error(f"Persistent cache read failed: {e}")
+            return None
+    
+    def _disk_cache_get_many(self, cache_keys: List[CacheKey]) -> Dict[CacheKey, tuple]:
+        """Look up several keys in the persistent cache, promoting hits to the memory cache (blocking)"""
+        try:
+            found = self.disk_cache.get_many(cache_keys)
+        except Exception as e:
+            self.logger.error(f"Persistent cache read failed: {e}")
+            return {}
+        for cache_key, value in found.items():
+            self.cache.put(cache_key, value)
+        return found
+    
+    def _disk_cache_put_many(self, items):
+        """Store several results in the persistent cache (blocking)"""
+        try:
+            self.disk_cache.put_many(items)
+        except Exception as e:
+            self.logger.error(f"Persistent cache write failed: {e}")
+    
+    def _disk_cache_put(self, cache_key, value):
+        """Store result in the persistent cache (blocking)"""
+        try:
+            self.disk_cache.put(cache_key, value)
+        except Exception as e:
+            self.logger.error(f"Persistent cache write failed: {e}")
     
     def _test_connection(self) -> bool:
-        """Test connection to Google Translate API"""
+        """Test connection to the translation backend"""
+        reachable = event_loop.run(self.probe_backend_async())
+        return bool(self._connection_status) if reachable is None else reachable
+    
+    async def probe_backend_async(self) -> Optional[bool]:
+        """
+        Send a test translation to the backend and update the connection status
+        
+        Returns:
+            True if the backend answered, False if not, None if our own rate
+            limiter held the probe back (the connection state is unknown)
+        """
         try:
-            # Simple test translation
-            result = self.translator.translate("test", dest="en")
-            self._connection_status = True
-            self.logger.info("Google Translate API connection successful")
+            await asyncio.wait_for(self.backend.translate_async("test", "auto", "en"), TRANSLATION_TIMEOUT)
+            self._set_connection_status(True)
+            self.logger.info(f"Translation backend '{self.backend.name}' connection successful")
             return True
+        except RateLimitedError as e:
+            self.logger.info(f"Translation backend '{self.backend.name}' probe skipped: {e}")
+            return None
         except Exception as e:
-            self._connection_status = False
-            self.logger.error(f"Google Translate API connection failed: {e}")
+            self._set_connection_status(False)
+            self.logger.error(f"Translation backend '{self.backend.name}' connection failed: {e}")
             return False
     
     @property
     def is_connected(self) -> bool:
         """Check if translation service is connected"""
-        return self._connection_status
+        return bool(self._connection_status)
+    
+    @property
+    def last_success_age(self) -> Optional[float]:
+        """Seconds since the last successful translation, None if there was none"""
+        if self._last_success is None:
+            return None
+        return time.monotonic() - self._last_success
+    
+    @property
+    def connection_checked(self) -> bool:
+        """Check if connection status has been determined yet"""
+        return self._connection_status is not None
     
-    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> Tuple[str, Optional[str], bool]:
+    def translate(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> TranslationResult:
         """
-        Translate text from source language to target language
+        Translate text from source language to target language, blocking until done
+        
+        Memory cache hits are answered on the calling thread; everything else
+        runs on the event loop.
         
         Args:
             text: Text to translate
@@ -52,19 +389,78 @@ class TranslationEngine:
         if not text.strip():
             return "", None, False
         
+        untranslated = self._same_language_result(text, source_lang, target_lang)
+        if untranslated is not None:
+            return untranslated
+        
+        text, replacements = self._protect_terms(text, source_lang, target_lang)
+        
+        # Serve repeated phrases from cache without a network round trip
+        cache_key = self._cache_key(text, source_lang, target_lang)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._restore_terms((cached[0], cached[1], True), replacements)
+        result = event_loop.run(self._translate_uncached(text, source_lang, target_lang, cache_key))
+        return self._restore_terms(result, replacements)
+    
+    async def translate_async(self, text: str, source_lang: str = "auto", target_lang: str = "en",
+                              segmented: bool = False) -> TranslationResult:
+        """
+        Translate text from source language to target language
+        
+        May be awaited from any event loop; the work itself always runs on
+        the engine's loop, where the backends' connection pools live.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code (default: "auto")
+            target_lang: Target language code (default: "en")
+            segmented: Translate sentence by sentence even below segment_min_chars,
+                so unchanged sentences of text being edited come from the cache
+        
+        Returns:
+            Tuple of (translated_text, detected_language, success)
+        """
+        if not event_loop.in_loop_thread():
+            return await asyncio.wrap_future(event_loop.submit(
+                self.translate_async(text, source_lang, target_lang, segmented)
+            ))
+        
+        if not text.strip():
+            return "", None, False
+        
+        untranslated = self._same_language_result(text, source_lang, target_lang)
+        if untranslated is not None:
+            return untranslated
+        
+        text, replacements = self._protect_terms(text, source_lang, target_lang)
+        cache_key = self._cache_key(text, source_lang, target_lang)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._restore_terms((cached[0], cached[1], True), replacements)
+        result = await self._translate_uncached(text, source_lang, target_lang, cache_key, segmented)
+        return self._restore_terms(result, replacements)
+    
+    async def _translate_uncached(self, text: str, source_lang: str, target_lang: str, cache_key,
+                                  segmented: bool = False) -> TranslationResult:
+        """Persistent cache lookup and backend call, runs on the event loop"""
+        if segmented or len(text) >= self.segment_min_chars:
+            pieces = segment_text(text)
+            if sum(1 for _, translatable in pieces if translatable) > 1:
+                return await self._translate_segments(pieces, source_lang, target_lang)
+        
+        loop = asyncio.get_running_loop()
+        if self.disk_cache is not None:
+            cached = await loop.run_in_executor(self.executor, self._disk_cache_get, cache_key)
+            if cached is not None:
+                return cached[0], cached[1], True
+        
         try:
-            # Handle auto-detect properly
+            translated_text, detected_lang = await asyncio.wait_for(
+                self.backend.translate_async(text, source_lang, target_lang), TRANSLATION_TIMEOUT
+            )
             if source_lang == "auto":
-                # For auto-detect, don't pass src parameter at all
-                result = self.translator.translate(text, dest=target_lang)
-                detected_lang = result.src
                 self.logger.info(f"Auto-detected language: {detected_lang}")
-            else:
-                # For specific source language, pass it explicitly
-                result = self.translator.translate(text, src=source_lang, dest=target_lang)
-                detected_lang = source_lang
-            
-            translated_text = result.text
             
             # Verify we got a valid translation
             if not translated_text or translated_text.strip() == "":
@@ -72,43 +468,333 @@ class TranslationEngine:
                 return "", detected_lang, False
             
             self.logger.info(f"Translation successful: {text[:50]}... -> {translated_text[:50]}...")
+            self._last_success = time.monotonic()
+            self._set_connection_status(True)
+            self.cache.put(cache_key, (translated_text, detected_lang))
+            if self.disk_cache is not None:
+                loop.run_in_executor(self.executor, self._disk_cache_put, cache_key, (translated_text, detected_lang))
             return translated_text, detected_lang, True
             
+        except BackendUnavailableError as e:
+            # Circuit open or rate limited: fail fast, serve a stale cache entry if there is one
+            stale = None
+            if self.disk_cache is not None:
+                stale = await loop.run_in_executor(self.executor, self._stale_cache_get, cache_key)
+            if stale is not None:
+                self.logger.info(f"Backend unavailable ({e}), served stale cached translation")
+                return stale[0], stale[1], True
+            self.logger.error(f"Translation failed fast: {e}")
+            if not isinstance(e, RateLimitedError):
+                self._set_connection_status(False)  # Our own rate limiter says nothing about the connection
+            return "", None, False
+        except asyncio.TimeoutError:
+            self.logger.error(f"Translation timed out after {TRANSLATION_TIMEOUT:.0f}s")
+            self._set_connection_status(False)
+            return "", None, False
         except AttributeError as e:
             self.logger.error(f"Translation failed - Attribute error (likely googletrans internal issue): {e}")
-            self._connection_status = False
+            self._set_connection_status(False)
             return "", None, False
         except Exception as e:
             self.logger.error(f"Translation failed: {e}")
-            self._connection_status = False
+            self._set_connection_status(False)
             return "", None, False
     
+    async def _translate_segments(self, pieces: List[Piece], source_lang: str, target_lang: str,
+                                  merged: bool = False) -> TranslationResult:
+        """
+        Translate sentence segments in parallel and reassemble them
+        
+        Each sentence is cached on its own, so editing one sentence of a long
+        text only sends that sentence to the backend again (backends that take
+        one text per call get the uncached sentences as lines of one text).
+        If some segments fail (e.g. held back by the rate limiter), the text
+        is retried once as merged segments instead of failing as a whole.
+        """
+        segments = [piece for piece, translatable in pieces if translatable]
+        results = await self.translate_many_async(segments, source_lang, target_lang, sentences=not merged)
+        failed = sum(1 for _, _, success in results if not success)
+        if failed and not merged:
+            merged_pieces = merge_segments(pieces)
+            if sum(1 for _, translatable in merged_pieces if translatable) < len(segments):
+                self.logger.warning(
+                    f"Segmented translation failed for {failed} of {len(segments)} segments, retrying merged"
+                )
+                # Merged segments may span line breaks, so they are not sent as lines again
+                return await self._translate_segments(merged_pieces, source_lang, target_lang, merged=True)
+        if failed:
+            self.logger.error(f"Segmented translation failed for {failed} of {len(segments)} segments")
+            return "", None, False
+        
+        # Report the language most segments were detected as
+        detected = Counter(detected_lang for _, detected_lang, _ in results if detected_lang).most_common(1)
+        translated_text = join_segments(pieces, [translated for translated, _, _ in results])
+        return translated_text, detected[0][0] if detected else None, True
+    
+    def translate_many(self, texts: Sequence[str], source_lang: str = "auto", target_lang: str = "en",
+                       max_concurrency: int = BATCH_CONCURRENCY) -> List[TranslationResult]:
+        """
+        Translate several texts, blocking until all are done
+        
+        See translate_many_async.
+        """
+        return event_loop.run(self.translate_many_async(texts, source_lang, target_lang, max_concurrency))
+    
+    async def translate_many_async(self, texts: Sequence[str], source_lang: str = "auto", target_lang: str = "en",
+                                   max_concurrency: int = BATCH_CONCURRENCY,
+                                   sentences: bool = False) -> List[TranslationResult]:
+        """
+        Translate several texts with as few backend calls as possible
+        
+        Duplicate texts are translated once, cache hits are served directly and
+        the remaining misses are packed into batches that fit the backend's
+        limits. Up to max_concurrency batches run at the same time.
+        
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code (default: "auto")
+            target_lang: Target language code (default: "en")
+            max_concurrency: Maximum number of backend calls in flight
+            sentences: Texts are sentences of one text (no line breaks); backends
+                that take one text per call get the misses as lines of one text
+                instead of a call per sentence
+            
+        Returns:
+            List of (translated_text, detected_language, success) in input order
+        """
+        if not event_loop.in_loop_thread():
+            return await asyncio.wrap_future(event_loop.submit(
+                self.translate_many_async(texts, source_lang, target_lang, max_concurrency, sentences)
+            ))
+        
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        replacements: Dict[int, List[str]] = {}
+        positions: Dict[CacheKey, List[int]] = {}
+        originals: Dict[CacheKey, str] = {}
+        detections = language_identifier.detect_batch(texts) if source_lang == "auto" else [None] * len(texts)
+        for index, text in enumerate(texts):
+            if not text.strip():
+                results[index] = ("", None, False)
+                continue
+            untranslated = self._same_language_result(text, source_lang, target_lang, detections[index])
+            if untranslated is not None:
+                results[index] = untranslated
+                continue
+            text, replacements[index] = self._protect_terms(text, source_lang, target_lang, detections[index])
+            cache_key = self._cache_key(text, source_lang, target_lang, detections[index])
+            if cache_key not in positions:
+                positions[cache_key] = []
+                originals[cache_key] = text
+            positions[cache_key].append(index)
+        
+        resolved: Dict[CacheKey, TranslationResult] = {}
+        misses = []
+        for cache_key in positions:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                resolved[cache_key] = (cached[0], cached[1], True)
+            else:
+                misses.append(cache_key)
+        
+        loop = asyncio.get_running_loop()
+        if misses and self.disk_cache is not None:
+            found = await loop.run_in_executor(self.executor, self._disk_cache_get_many, misses)
+            for cache_key, (translated_text, detected_lang) in found.items():
+                resolved[cache_key] = (translated_text, detected_lang, True)
+            misses = [cache_key for cache_key in misses if cache_key not in found]
+        
+        as_lines = sentences and self.backend.max_batch_size <= 1
+        batches = self._pack_batches(misses, originals, as_lines)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run_batch(batch: List[CacheKey]):
+            async with semaphore:
+                resolved.update(await self._translate_batch(batch, originals, source_lang, target_lang, as_lines))
+        
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+        self.logger.info(
+            f"Batch translation: {len(texts)} texts, {len(positions)} unique, "
+            f"{len(positions) - len(misses)} cached, {len(batches)} backend calls"
+        )
+        
+        for cache_key, indices in positions.items():
+            for index in indices:
+                results[index] = self._restore_terms(resolved[cache_key], replacements[index])
+        return results
+    
+    def _pack_batches(self, cache_keys: List[CacheKey], originals: Dict[CacheKey, str],
+                      as_lines: bool = False) -> List[List[CacheKey]]:
+        """Group keys into batches within the backend's item and character limits (or of lines of one text)"""
+        if as_lines:
+            max_size = len(cache_keys)
+            max_chars = min(self.backend.max_batch_chars, MAX_SEGMENT_CHARS)
+        else:
+            max_size = max(1, self.backend.max_batch_size)
+            max_chars = self.backend.max_batch_chars
+        batches: List[List[CacheKey]] = []
+        batch: List[CacheKey] = []
+        chars = 0
+        for cache_key in cache_keys:
+            length = len(originals[cache_key]) + as_lines  # Line break
+            if batch and (len(batch) >= max_size or chars + length > max_chars):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(cache_key)
+            chars += length
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    async def _translate_batch(self, cache_keys: List[CacheKey], originals: Dict[CacheKey, str],
+                               source_lang: str, target_lang: str, as_lines: bool = False) -> Dict[CacheKey, TranslationResult]:
+        """Translate one packed batch of cache misses, runs on the event loop"""
+        loop = asyncio.get_running_loop()
+        texts = [originals[cache_key] for cache_key in cache_keys]
+        try:
+            if len(texts) == 1:
+                # Single requests keep the dispatcher's hedging
+                call = self.backend.translate_async(texts[0], source_lang, target_lang)
+                translated = [await asyncio.wait_for(call, TRANSLATION_TIMEOUT)]
+            elif as_lines:
+                call = self.backend.translate_async("\n".join(texts), source_lang, target_lang)
+                translated_text, detected_lang = await asyncio.wait_for(call, TRANSLATION_TIMEOUT)
+                translated = [(line, detected_lang) for line in translated_text.split("\n")]
+                if len(translated) != len(texts):
+                    # Lines were merged or split: nothing can be cached per sentence
+                    self.logger.warning(f"Backend returned {len(translated)} lines for {len(texts)} sentences")
+                    translated = [("", detected_lang)] * len(texts)
+            else:
+                call = self.backend.translate_batch_async(texts, source_lang, target_lang)
+                translated = await asyncio.wait_for(call, TRANSLATION_TIMEOUT)
+        except BackendUnavailableError as e:
+            # Circuit open or rate limited: serve stale cache entries where there are some
+            self.logger.error(f"Batch translation failed fast: {e}")
+            stale = {}
+            if self.disk_cache is not None:
+                stale = await loop.run_in_executor(
+                    self.executor, lambda: {cache_key: self._stale_cache_get(cache_key) for cache_key in cache_keys}
+                )
+            if not any(stale.values()) and not isinstance(e, RateLimitedError):
+                self._set_connection_status(False)  # Our own rate limiter says nothing about the connection
+            return {
+                cache_key: (stale[cache_key][0], stale[cache_key][1], True) if stale.get(cache_key) else ("", None, False)
+                for cache_key in cache_keys
+            }
+        except asyncio.TimeoutError:
+            self.logger.error(f"Batch translation of {len(texts)} texts timed out after {TRANSLATION_TIMEOUT:.0f}s")
+            self._set_connection_status(False)
+            return {cache_key: ("", None, False) for cache_key in cache_keys}
+        except Exception as e:
+            self.logger.error(f"Batch translation of {len(texts)} texts failed: {e}")
+            self._set_connection_status(False)
+            return {cache_key: ("", None, False) for cache_key in cache_keys}
+        
+        results: Dict[CacheKey, TranslationResult] = {}
+        new_entries = []
+        for cache_key, (translated_text, detected_lang) in zip(cache_keys, translated):
+            if not translated_text or not translated_text.strip():
+                results[cache_key] = ("", detected_lang, False)
+                continue
+            results[cache_key] = (translated_text, detected_lang, True)
+            self.cache.put(cache_key, (translated_text, detected_lang))
+            new_entries.append((cache_key, (translated_text, detected_lang)))
+        
+        self._last_success = time.monotonic()
+        self._set_connection_status(True)
+        if new_entries and self.disk_cache is not None:
+            loop.run_in_executor(self.executor, self._disk_cache_put_many, new_entries)
+        return results
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Long-lived worker pool for blocking work off the event loop"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=TRANSLATION_WORKERS,
+                        thread_name_prefix="TranslationWorker"
+                    )
+        return self._executor
+    
+    def submit_translation(self, text: str, source_lang: str = "auto", target_lang: str = "en",
+                           segmented: bool = False) -> TranslationRequest:
+        """
+        Translate text on the event loop without blocking the caller
+        
+        Args:
+            segmented: Translate sentence by sentence (see translate_async)
+        
+        Returns:
+            TranslationRequest whose result is (translated_text, detected_language, success)
+        """
+        request = TranslationRequest(text, source_lang, target_lang, segmented)
+        request.future = event_loop.submit(self._run_request(request))
+        return request
+    
+    async def _run_request(self, request: TranslationRequest) -> TranslationResult:
+        """Event loop entry point for submitted requests"""
+        if request.cancelled:
+            return "", None, False
+        return await self.translate_async(request.text, request.source_lang, request.target_lang, request.segmented)
+    
+    def shutdown(self):
+        """Cancel in-flight translations, stop the event loop and the worker pool, close the persistent cache"""
+        event_loop.stop()
+        if self._executor is not None:
+            # Let queued cache writes finish before their connection is closed
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._init_thread is not None:
+            self._init_thread.join()
+        if self.disk_cache is not None:
+            try:
+                self.disk_cache.close()
+            except Exception as e:
+                self.logger.error(f"Closing persistent translation cache failed: {e}")
+            self.disk_cache = None
+    
     def get_language_name(self, lang_code: str) -> str:
         """Get language name from language code"""
+        from googletrans import LANGUAGES
         return LANGUAGES.get(lang_code, lang_code.upper())
     
     def detect_language(self, text: str) -> Optional[str]:
-        """Detect language of given text"""
+        """Detect language of given text (offline, the backend is only asked for languages without a profile)"""
+        detected_lang, confidence = language_identifier.detect_cached(text)
+        if detected_lang and confidence > SCRIPT_ONLY_CONFIDENCE:
+            return detected_lang
         try:
-            result = self.translator.detect(text)
-            return result.lang
+            return self.backend.detect(text) or detected_lang
         except Exception as e:
             self.logger.error(f"Language detection failed: {e}")
-            return None
+            return detected_lang
     
     def get_supported_languages(self) -> dict:
         """Get all supported languages"""
+        from googletrans import LANGUAGES
         return LANGUAGES.copy()
+    
+    def get_cache_stats(self) -> dict:
+        """Get translation cache statistics (hits, misses, size) and round trips saved by same-language detection"""
+        stats = {"memory": self.cache.get_stats(), "round_trips_saved": self.round_trips_saved}
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.get_stats()
+        return stats
+    
+    def get_backend_stats(self) -> dict:
+        """Get backend latency statistics (available for multi-backend setups)"""
+        get_stats = getattr(self.backend, "get_stats", None)
+        return get_stats() if get_stats else {}
+    
+    def clear_cache(self):
+        """Clear in-memory cached translations"""
+        self.cache.clear()
 
 def save_translation_history(source_text, translated_text, source_lang, target_lang):
-    history_dir = Path.home() / ".tranfastic" / "history"
-    history_dir.mkdir(parents=True, exist_ok=True)
-    today = datetime.now().strftime("%Y-%m-%d")
-    history_file = history_dir / f"{today}.txt"
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    line = f"[{timestamp}] {source_lang} -> {target_lang} | {source_text} => {translated_text}\n"
-    with open(history_file, "a", encoding="utf-8") as f:
-        f.write(line)
+    """Queue a translation history entry for the background history writer and index it in translation memory"""
+    history_writer.write(source_text, translated_text, source_lang, target_lang)
+    translation_memory.add(source_text, translated_text, source_lang, target_lang)
 
 # Global translator instance
 translator_engine = TranslationEngine() 
\ No newline at end of file
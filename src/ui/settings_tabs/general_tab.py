@@ -123,6 +123,8 @@ class GeneralTab(QWidget):
         app_layout.addWidget(self.save_history_cb)
         self.restore_clipboard_cb = QCheckBox("Restore original clipboard after translation")
         app_layout.addWidget(self.restore_clipboard_cb)
+        self.live_preview_cb = QCheckBox("Live translation preview while typing")
+        app_layout.addWidget(self.live_preview_cb)
         
         app_group.setLayout(app_layout)
         layout.addWidget(app_group)
@@ -152,6 +154,7 @@ class GeneralTab(QWidget):
         self.start_on_boot_cb.setChecked(self.config.get("start_on_boot", False))
         self.save_history_cb.setChecked(self.config.get("save_history", False))
         self.restore_clipboard_cb.setChecked(self.config.get("restore_clipboard", False))
+        self.live_preview_cb.setChecked(self.config.get("live_preview", False))
     
     def get_settings(self):
         """Get current settings from UI"""
@@ -161,5 +164,6 @@ class GeneralTab(QWidget):
             "hotkey": self.hotkey_input.text().strip(),
             "start_on_boot": self.start_on_boot_cb.isChecked(),
             "save_history": self.save_history_cb.isChecked(),
-            "restore_clipboard": self.restore_clipboard_cb.isChecked()
+            "restore_clipboard": self.restore_clipboard_cb.isChecked(),
+            "live_preview": self.live_preview_cb.isChecked()
         }
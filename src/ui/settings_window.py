@@ -160,45 +160,44 @@ class SettingsWindow(QWidget):
             general_settings = self.general_tab.get_settings()
             appearance_settings = self.appearance_tab.get_settings()
             
-            # Handle hotkey setting with validation
-            current_hotkey = self.config.get("hotkey")
-            new_hotkey = general_settings["hotkey"]
-            
-            if new_hotkey and new_hotkey != current_hotkey:
-                if hotkey_manager.set_hotkey(new_hotkey):
-                    self.config.set("hotkey", new_hotkey)
-                else:
-                    self.logger.error("Failed to set hotkey")
-            
-            # Handle startup setting with error handling
-            try:
-                current_startup = self.config.get("start_on_boot", False)
-                new_startup = general_settings["start_on_boot"]
+            # Apply all changes as one batch, config.json is written once
+            with self.config.batch():
+                # Handle hotkey setting with validation
+                current_hotkey = self.config.get("hotkey")
+                new_hotkey = general_settings["hotkey"]
+                
+                if new_hotkey and new_hotkey != current_hotkey:
+                    if hotkey_manager.set_hotkey(new_hotkey):
+                        self.config.set("hotkey", new_hotkey)
+                    else:
+                        self.logger.error("Failed to set hotkey")
                 
-                if current_startup != new_startup:
-                    self.config.set("start_on_boot", new_startup)
+                # Handle startup setting with error handling
+                try:
+                    current_startup = self.config.get("start_on_boot", False)
+                    new_startup = general_settings["start_on_boot"]
+                
+                    if current_startup != new_startup:
+                        self.config.set("start_on_boot", new_startup)
                     
-            except Exception as startup_error:
-                self.logger.error(f"Failed to update startup setting: {startup_error}")
-                QMessageBox.warning(
-                    self, 
-                    "Startup Setting Error",
-                    f"Failed to update Windows startup setting:\\n{str(startup_error)}\\n\\nOther settings have been saved successfully."
-                )
-                # Don't prevent other settings from being saved
-            
-            # Save all other settings
-            for key, value in general_settings.items():
-                if key != "hotkey":  # Already handled above
-                    self.config.set(key, value)
-            
-            for key, value in appearance_settings.items():
-                self.config.set(key, value)
-            
-            # Remove legacy config key if it exists
-            if "monitor_behavior" in self.config.config:
-                del self.config.config["monitor_behavior"]
-                self.config.save_config()
+                except Exception as startup_error:
+                    self.logger.error(f"Failed to update startup setting: {startup_error}")
+                    QMessageBox.warning(
+                        self, 
+                        "Startup Setting Error",
+                        f"Failed to update Windows startup setting:\\n{str(startup_error)}\\n\\nOther settings have been saved successfully."
+                    )
+                    # Don't prevent other settings from being saved
+                
+                # Save all other settings
+                self.config.update({
+                    key: value for key, value in general_settings.items()
+                    if key not in ("hotkey", "start_on_boot")  # Already handled above
+                })
+                self.config.update(appearance_settings)
+                
+                # Remove legacy config key if it exists
+                self.config.remove("monitor_behavior")
             
             self.settings_changed.emit()
             self.close()
@@ -4,39 +4,66 @@ Main translation interface window
 """
 
 import sys
+import html
 import logging
 from typing import Optional, Callable
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
     QLabel, QPushButton, QApplication, QFrame, QShortcut, QGraphicsDropShadowEffect
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QPoint
-from PyQt5.QtGui import QFont, QIcon, QKeySequence, QPixmap, QColor, QCursor, QPalette
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, pyqtSlot, QPoint
+from PyQt5.QtGui import QFont, QFontMetrics, QIcon, QKeySequence, QPixmap, QColor, QCursor, QPalette
 import ctypes
 import time
 from pathlib import Path
 
 from ..utils.config import COLORS, APP_NAME, SUPPORTED_LANGUAGES, APP_ICON_PATH
-from ..core.translator import translator_engine, save_translation_history
+from ..core.translator import translator_engine, save_translation_history, TranslationRequest
+from ..core.health_monitor import health_monitor
+from ..core.translation_memory import translation_memory
 
 user32 = ctypes.windll.user32
 
-class TranslationWorker(QThread):
-    """Background translation worker"""
+# Delay after the last keystroke before a live preview translation is sent
+LIVE_PREVIEW_DEBOUNCE_MS = 350
+
+class TranslationWorker(QObject):
+    """Runs a translation on the engine's event loop and reports back on the GUI thread"""
     translation_complete = pyqtSignal(str, str, bool)
     
-    def __init__(self, text: str, source_lang: str, target_lang: str):
+    def __init__(self, text: str, source_lang: str, target_lang: str, segmented: bool = False):
         super().__init__()
         self.text = text
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self.segmented = segmented
+        self.request: Optional[TranslationRequest] = None
     
-    def run(self):
-        """Run translation in background thread"""
-        translated_text, detected_lang, success = translator_engine.translate(
-            self.text, self.source_lang, self.target_lang
+    def start(self):
+        """Submit translation to the engine"""
+        self.request = translator_engine.submit_translation(
+            self.text, self.source_lang, self.target_lang, self.segmented
         )
-        self.translation_complete.emit(translated_text, detected_lang, success)
+        self.request.add_done_callback(self._on_request_done)
+    
+    def cancel(self):
+        """Cancel translation, its result will not be emitted"""
+        if self.request:
+            self.request.cancel()
+    
+    def isRunning(self) -> bool:
+        """Check if translation is still in progress"""
+        return self.request is not None and not self.request.done()
+    
+    def _on_request_done(self, request: TranslationRequest):
+        """Called from the event loop thread, signal is delivered to the GUI thread"""
+        if request.cancelled:
+            return
+        try:
+            translated_text, detected_lang, success = request.result()
+        except Exception:
+            translated_text, detected_lang, success = "", None, False
+        self.translation_complete.emit(translated_text, detected_lang or "", success)
 
 class TranslationWindow(QWidget):
     """Main translation window"""
@@ -49,6 +76,16 @@ class TranslationWindow(QWidget):
         self.translation_worker: Optional[TranslationWorker] = None
         self._last_hwnd = None
         self._drag_pos = None
+        self._applied_size: Optional[str] = None
+        self._show_requested_at: Optional[float] = None
+        
+        # Live preview state: debounce timer, in-flight request and last result
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._start_preview)
+        self._preview_worker: Optional[TranslationWorker] = None
+        self._preview_result: Optional[tuple] = None
+        self._memory_preview_shown = False
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         # Set window size based on config
@@ -65,6 +102,8 @@ class TranslationWindow(QWidget):
     def set_window_size(self):
         """Set window size based on configuration"""
         size_setting = self.config.get("window_size", "default")
+        if size_setting == self._applied_size:
+            return  # Geometry and stylesheets already match
         
         if size_setting == "small":
             self.setFixedSize(400, 60)
@@ -80,6 +119,7 @@ class TranslationWindow(QWidget):
         """Adjust UI elements based on window size"""
         if not hasattr(self, 'input_field') or not hasattr(self, 'title_label'):
             return  # UI not yet created
+        self._applied_size = size
         
         # Use direct references instead of searching
         title_bar = self.title_bar
@@ -400,10 +440,34 @@ class TranslationWindow(QWidget):
             y = (screen.height() - self.height()) // 2
             self.move(x, y)
     
-    def update_title(self):
-        """Update window title with connection and language info"""
+    def prepare_for_show(self, requested_at: Optional[float] = None):
+        """
+        Reset the reused window before showing it again
+        
+        Args:
+            requested_at: time.perf_counter() value of the hotkey press, used to log
+                hotkey-to-visible latency on the next paint
+        """
+        self._show_requested_at = requested_at
+        self.input_field.clear()
+        self._cancel_preview()
+        self.status_label.setText("")
+        self.status_label.setStyleSheet("")
+        self.set_window_size()
+        self.center_window()
+        self.update_title()
+    
+    def update_title(self, preview: Optional[str] = None):
+        """
+        Update window title with connection and language info
+        
+        Args:
+            preview: Live preview translation shown instead of the language pair
+        """
         if translator_engine.is_connected:
             status = "Connected"
+        elif not translator_engine.connection_checked:
+            status = "Connecting"
         else:
             status = "Not Connected"
         source_lang = self.config.get("source_language", "auto")
@@ -411,8 +475,12 @@ class TranslationWindow(QWidget):
         # If I need to write the long version(like English, Turkish, etc.) of the languages ​​in the future, I can use these 2 lines.
         # source_name = SUPPORTED_LANGUAGES.get(source_lang, source_lang.upper())
         # target_name = SUPPORTED_LANGUAGES.get(target_lang, target_lang.upper())
-        status_color = "#00ff00" if status == "Connected" else "#ff0000"
+        status_color = {"Connected": "#00ff00", "Connecting": "#FFC107"}.get(status, "#ff0000")
         title = f"Tranfastic - <span style='color:{status_color};'>{status}</span> <span style='color:#a7a7a7;'>| {source_lang} → {target_lang}</span>"
+        if preview:
+            metrics = QFontMetrics(self.title_label.font())
+            elided = metrics.elidedText(preview, Qt.ElideRight, max(self.width() - 140, 50))
+            title = f"Tranfastic - <span style='color:#a7a7a7;'>{html.escape(elided)}</span>"
         self.title_label.setText(title)
     
     def on_text_changed(self, text: str):
@@ -420,6 +488,87 @@ class TranslationWindow(QWidget):
         if not text.strip():
             self.status_label.setText("")
             self.status_label.setStyleSheet("")
+            self._cancel_preview()
+            return
+        
+        if self.config.get("live_preview", False):
+            # Debounce: restart timer on every keystroke
+            self._preview_timer.start(LIVE_PREVIEW_DEBOUNCE_MS)
+    
+    def _cancel_preview(self):
+        """Stop pending and in-flight preview translations"""
+        self._preview_timer.stop()
+        if self._preview_worker:
+            self._preview_worker.cancel()
+            self._preview_worker = None
+        if self._preview_result or self._memory_preview_shown:
+            self._preview_result = None
+            self._memory_preview_shown = False
+            self.update_title()
+    
+    def _preview_matches(self, text: str, source_lang: str, target_lang: str) -> bool:
+        """Check if the current preview result belongs to the given request"""
+        return self._preview_result is not None and self._preview_result[:3] == (text, source_lang, target_lang)
+    
+    def _show_memory_match(self, text: str, source_lang: str, target_lang: str):
+        """Show a fuzzy translation memory match in the title while the real request is in flight"""
+        if not self.config.get("translation_memory", True):
+            return
+        match = translation_memory.lookup(text, source_lang, target_lang)
+        if match:
+            translated_text, similarity, _ = match
+            self._memory_preview_shown = True
+            self.update_title(preview=f"≈{similarity:.0%} {translated_text}")
+    
+    def _clear_memory_match(self):
+        """Remove a translation memory match from the title once its request failed or was cancelled"""
+        if self._memory_preview_shown:
+            self._memory_preview_shown = False
+            self.update_title()
+    
+    def _start_preview(self):
+        """Translate current text in the background for live preview"""
+        text = self.input_field.text().strip()
+        if not text:
+            return
+        source_lang = self.config.get("source_language", "auto")
+        target_lang = self.config.get("target_language", "en")
+        
+        if self._preview_matches(text, source_lang, target_lang):
+            return
+        worker = self._preview_worker
+        if worker and worker.isRunning() and (worker.text, worker.source_lang, worker.target_lang) == (text, source_lang, target_lang):
+            return  # Same request already in flight
+        
+        # Supersede stale request, only the latest text's result is shown.
+        # Sentences are translated and cached one by one, so while typing only
+        # the sentence being edited goes to the backend again.
+        if worker:
+            worker.cancel()
+        worker = TranslationWorker(text, source_lang, target_lang, segmented=True)
+        worker.translation_complete.connect(
+            lambda translated, detected, success, w=worker: self._on_preview_complete(w, translated, detected, success)
+        )
+        self._preview_worker = worker
+        worker.start()
+        self._show_memory_match(text, source_lang, target_lang)
+    
+    def _on_preview_complete(self, worker: TranslationWorker, translated_text: str, detected_lang: str, success: bool):
+        """Handle live preview result"""
+        if worker is self.translation_worker:
+            # Adopted by translate_text while in flight: this slot was connected before the
+            # request started, so its result always arrives here, even if it finished first
+            self.on_translation_complete_signal(translated_text, detected_lang, success)
+            return
+        if worker is not self._preview_worker:
+            return  # Superseded by newer text
+        self._preview_worker = None
+        if not success or worker.text != self.input_field.text().strip():
+            self._clear_memory_match()
+            return
+        self._preview_result = (worker.text, worker.source_lang, worker.target_lang, translated_text, detected_lang)
+        self._memory_preview_shown = False
+        self.update_title(preview=translated_text)
     
     def translate_text(self):
         """Translate the entered text"""
@@ -435,10 +584,29 @@ class TranslationWindow(QWidget):
         source_lang = self.config.get("source_language", "auto")
         target_lang = self.config.get("target_language", "en")
         
-        # Start translation in background
+        # Live preview already has the result, paste immediately
+        self._preview_timer.stop()
+        if self._preview_matches(text, source_lang, target_lang):
+            _, _, _, translated_text, detected_lang = self._preview_result
+            self.on_translation_complete_signal(translated_text, detected_lang, True)
+            return
+        
+        # Preview request for the same text is in flight, wait for it instead of sending another
+        worker = self._preview_worker
+        if worker and worker.isRunning() and (worker.text, worker.source_lang, worker.target_lang) == (text, source_lang, target_lang):
+            self._preview_worker = None
+            if self.translation_worker:
+                self.translation_worker.cancel()
+            self.translation_worker = worker  # Result is delivered by _on_preview_complete
+            return
+        
+        # Start translation on the engine's event loop, superseding any running one
+        if self.translation_worker:
+            self.translation_worker.cancel()
         self.translation_worker = TranslationWorker(text, source_lang, target_lang)
         self.translation_worker.translation_complete.connect(self.on_translation_complete_signal)
         self.translation_worker.start()
+        self._show_memory_match(text, source_lang, target_lang)
     
     @pyqtSlot(str, str, bool)
     def on_translation_complete_signal(self, translated_text: str, detected_lang: str, success: bool):
@@ -461,6 +629,7 @@ class TranslationWindow(QWidget):
             # Clear input and close after delay
             QTimer.singleShot(500, self.paste_to_last_window_and_close)
         else:
+            self._clear_memory_match()
             self.status_label.setText("Translation failed!")
             self.status_label.setStyleSheet("color: #F44336;")
     
@@ -483,15 +652,24 @@ class TranslationWindow(QWidget):
         super().showEvent(event)
         self.input_field.setFocus()
         
-        # Check connection status when window opens
-        translator_engine._test_connection()
+        # Show cached connection status, nudge the monitor if we are offline
+        health_monitor.request_probe()
         self.update_title()
     
+    def paintEvent(self, event):
+        """Handle paint event"""
+        super().paintEvent(event)
+        if self._show_requested_at is not None:
+            latency_ms = (time.perf_counter() - self._show_requested_at) * 1000
+            self._show_requested_at = None
+            self.logger.info(f"Hotkey-to-visible latency: {latency_ms:.1f} ms")
+    
     def closeEvent(self, event):
         """Handle close event"""
         if self.translation_worker and self.translation_worker.isRunning():
-            self.translation_worker.terminate()
-            self.translation_worker.wait()
+            self.translation_worker.cancel()
+        self._cancel_preview()
+        self._clear_memory_match()
         super().closeEvent(event)
 
     # Dragable
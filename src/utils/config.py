@@ -3,10 +3,14 @@ Tranfastic Configuration Module
 Handles application settings and constants
 """
 
+import copy
 import json
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Application constants
 APP_NAME = "Tranfastic"
@@ -47,6 +51,9 @@ COLORS = {
     "border": "#444444"
 } 
 
+# Delay before coalesced configuration changes are written to disk
+SAVE_DELAY_SECONDS = 0.5
+
 class Config:
     """Application configuration manager"""
     
@@ -60,11 +67,31 @@ class Config:
             "start_on_boot": False,
             "save_history": False,
             "restore_clipboard": False,
+            "live_preview": False,  # Translate while typing
             "theme": "dark",
             "popup_opening_location": "cursor",  # "cursor", "primary", "cursor_below"
             "preferred_monitor": 0,  # 0 = primary, 1 = secondary, etc.
-            "window_size": "default"  # "small", "default", "large"
+            "window_size": "default",  # "small", "default", "large"
+            "translation_backends": ["google"],  # Several backends enable hedging and failover
+            "backend_options": {},  # Per-backend settings, e.g. {"local": {"url": "http://127.0.0.1:8765"}}
+            "rate_limit_per_second": 5,  # Per-backend token bucket refill rate
+            "rate_limit_burst": 10,  # Per-backend token bucket capacity
+            "rate_limit_max_wait": 0.25,  # Seconds a request waits for a rate-limit token before failing fast
+            "breaker_failure_threshold": 5,  # Consecutive failures before a backend's circuit opens
+            "cache_ttl_days": 30,  # Persistent translation cache expiry
+            "cache_max_entries": 50000,  # Persistent translation cache size cap
+            "cache_stale_days": 365,  # Expired translations kept as fallback while backends are down
+            "segment_min_chars": 200,  # Longer texts are translated sentence by sentence
+            "same_language_min_confidence": 0.95,  # Skip translating text detected as already in the target language
+            "translation_memory": True,  # Show fuzzy matches from history while a translation is in flight
+            "memory_min_similarity": 0.7  # Lowest similarity (0..1) shown as a translation memory match
         }
+        self._save_lock = threading.Lock()
+        # Guards self.config against the save timer copying it mid-update
+        self._config_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        self._dirty = False
         self.config = self.load_config()
         self._sync_startup_setting()
     
@@ -81,16 +108,66 @@ class Config:
     
     def create_default_config(self) -> Dict[str, Any]:
         """Create default configuration file"""
-        self.config_dir.mkdir(exist_ok=True)
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.default_config, f, indent=2, ensure_ascii=False)
+        self._write_atomic(self.default_config)
         return self.default_config.copy()
     
-    def save_config(self):
-        """Save current configuration to file"""
+    def _write_atomic(self, data: Dict[str, Any]):
+        """Write configuration to a temp file and rename it over config.json"""
         self.config_dir.mkdir(exist_ok=True)
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(prefix="config.", suffix=".tmp", dir=str(self.config_dir))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def save_config(self):
+        """Save current configuration to file immediately"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            with self._config_lock:
+                data = copy.deepcopy(self.config)
+            self._write_atomic(data)
+    
+    def flush(self):
+        """Write pending changes now (call before quitting)"""
+        if self._dirty:
+            self.save_config()
+    
+    def _schedule_save(self):
+        """Coalesce writes: save once after SAVE_DELAY_SECONDS of quiet, or when the batch ends"""
+        self._dirty = True
+        with self._config_lock:
+            if self._batch_depth > 0:
+                return
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._save_from_timer)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _save_from_timer(self):
+        """Write-behind timer callback"""
+        with self._config_lock:
+            if self._batch_depth > 0:
+                return  # A batch is being applied, it schedules the save when it ends
+        try:
+            self.flush()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Failed to save config: {e}")
 
     def get(self, key: str, default=None):
         """Get configuration value"""
@@ -98,13 +175,73 @@ class Config:
     
     def set(self, key: str, value: Any):
         """Set configuration value"""
-        self.config[key] = value
+        self.update({key: value})
+    
+    def update(self, values: Dict[str, Any]):
+        """
+        Set several configuration values with a single deferred write
         
-        # Handle startup setting special case
-        if key == "start_on_boot":
-            self._handle_startup_setting(value)
+        Args:
+            values: Mapping of keys to new values
+        """
+        with self._config_lock:
+            startup_changed = (
+                "start_on_boot" in values
+                and values["start_on_boot"] != self.config.get("start_on_boot", False)
+            )
+            self.config.update(values)
+        try:
+            # Handle startup setting special case (registry only touched on change)
+            if startup_changed:
+                self._handle_startup_setting(values["start_on_boot"])
+        finally:
+            self._schedule_save()
+    
+    def remove(self, key: str):
+        """Remove configuration key"""
+        with self._config_lock:
+            if key not in self.config:
+                return
+            del self.config[key]
+        self._schedule_save()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group several set/update/remove calls into one write
         
-        self.save_config()
+        All or nothing: if the block raises, the configuration is restored to
+        what it was on entry and the batch's changes are never saved.
+        
+        Usage:
+            with config.batch():
+                config.set("hotkey", "ctrl+alt+t")
+                config.update(other_settings)
+        """
+        with self._config_lock:
+            snapshot = copy.deepcopy(self.config)
+            was_dirty = self._dirty
+            self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._config_lock:
+                startup_changed = self.config.get("start_on_boot", False) != snapshot.get("start_on_boot", False)
+                self.config.clear()
+                self.config.update(snapshot)
+                self._dirty = was_dirty
+            if startup_changed:
+                try:
+                    self._handle_startup_setting(snapshot.get("start_on_boot", False))
+                except Exception:
+                    pass  # Logged; _sync_startup_setting repairs the registry on next start
+            raise
+        finally:
+            with self._config_lock:
+                self._batch_depth -= 1
+                save = self._batch_depth == 0 and self._dirty
+            if save:
+                self._schedule_save()
     
     def _sync_startup_setting(self):
         """Sync startup setting with Windows registry on app start"""
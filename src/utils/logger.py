@@ -1,39 +1,385 @@
 """
 Tranfastic Logging Module
 Handles application logging configuration
+
+Log calls only put records on a bounded queue; a writer thread formats and
+writes them in batches, so file and console I/O never run on the caller.
+
+Logs go to ~/.tranfastic/logs/YYYY-MM-DD.log, switching files at midnight and
+whenever a file reaches LOG_MAX_BYTES (the full one becomes YYYY-MM-DD.N.log).
+Finished files are gzipped and old ones deleted on a background thread.
 """
 
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+# Records waiting for the writer thread before the drop policy applies
+LOG_QUEUE_SIZE = 10000
+
+# Records written per batch (handlers are flushed once per batch)
+LOG_BATCH_SIZE = 256
+
+# When the queue is full, records below this level are dropped at once; records at
+# or above it wait up to LOG_BLOCK_TIMEOUT seconds for space before being dropped
+LOG_BLOCK_LEVEL = logging.WARNING
+LOG_BLOCK_TIMEOUT = 0.05
+
+# Size at which the current log file is rotated
+LOG_MAX_BYTES = 5 * 1024 * 1024
+
+# Days log files (compressed or not) are kept
+LOG_RETENTION_DAYS = 7
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler for a bounded queue that drops records instead of blocking callers"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        """Queue a record, counting it as dropped if the queue stays full"""
+        try:
+            if record.levelno >= LOG_BLOCK_LEVEL:
+                self.queue.put(record, timeout=LOG_BLOCK_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1  # Handler lock is held by handle()
+
+class _BatchFlush:
+    """Handler mixin: skip the flush after every record, the writer flushes once per batch"""
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+class BatchStreamHandler(_BatchFlush, logging.StreamHandler):
+    """Stream handler flushed once per batch"""
+
+class LogCompressor:
+    """Background thread that gzips rotated log files and enforces retention"""
+
+    def __init__(self, log_dir: Path, retention_days: int = LOG_RETENTION_DAYS):
+        """
+        Args:
+            log_dir: Log directory
+            retention_days: Days log files are kept
+        """
+        self.log_dir = log_dir
+        self.retention_days = retention_days
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, active_file: Path):
+        """Start the thread; it first compresses logs left over from earlier runs and applies retention"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, args=(active_file,), name="LogCompressor", daemon=True)
+            self._thread.start()
+
+    def submit(self, path: Path):
+        """Queue a finished log file for compression"""
+        self._queue.put(path)
+
+    def stop(self):
+        """Stop after already queued files (does not wait)"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread = None
+
+    def _run(self, active_file: Path):
+        for leftover in self.log_dir.glob("*.gz.tmp"):
+            leftover.unlink(missing_ok=True)
+        for stale in sorted(self.log_dir.glob("*.log")):
+            if stale != active_file:
+                self._compress(stale)
+        cleanup_old_logs(self.retention_days, self.log_dir)
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+            self._compress(path)
+            cleanup_old_logs(self.retention_days, self.log_dir)
+
+    @staticmethod
+    def _compress(path: Path):
+        """Replace path with path.gz (written to a temporary file first, keeps mtime for retention)"""
+        target = path.with_name(path.name + ".gz")
+        temp = path.with_name(path.name + ".gz.tmp")
+        try:
+            mtime = path.stat().st_mtime
+            with open(path, "rb") as source, gzip.open(temp, "wb") as compressed:
+                shutil.copyfileobj(source, compressed, 1024 * 1024)
+            os.utime(temp, (mtime, mtime))
+            os.replace(temp, target)
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            temp.unlink(missing_ok=True)
+            get_logger("Cleanup").error(f"Failed to compress log file {path}: {e}")
+
+class RotatingLogHandler(_BatchFlush, logging.FileHandler):
+    """Daily log file handler that also rotates by size, handing finished files to a compressor"""
+
+    def __init__(self, log_dir: Path, max_bytes: int = LOG_MAX_BYTES,
+                 compressor: Optional[LogCompressor] = None, encoding: str = "utf-8"):
+        """
+        Args:
+            log_dir: Log directory
+            max_bytes: Size at which the current file is rotated
+            compressor: Receives rotated files for compression
+            encoding: Log file encoding
+        """
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.compressor = compressor
+        self._day = datetime.now().date()
+        self._next_midnight = self._midnight_after(self._day)
+        super().__init__(self._day_file(self._day), encoding=encoding)
+        self._size = os.path.getsize(self.baseFilename)
+
+    @staticmethod
+    def _midnight_after(day) -> float:
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+
+    def _day_file(self, day) -> Path:
+        return self.log_dir / f"{day:%Y-%m-%d}.log"
 
-def setup_logging(log_level: str = "INFO") -> logging.Logger:
+    def emit(self, record: logging.LogRecord):
+        """Write a record, rotating first at midnight or when the file is full (no per-record flush)"""
+        try:
+            message = self.format(record) + self.terminator
+            size = self._byte_size(message)
+            if time.time() >= self._next_midnight:
+                self._rotate_day()
+            elif self._size and self._size + size > self.max_bytes:
+                self._rotate_size()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _byte_size(self, message: str) -> int:
+        """Bytes message takes in the file (encoded, with newlines translated as text mode does)"""
+        size = len(message.encode(self.encoding or "utf-8", errors=self.errors or "strict"))
+        if os.linesep != "\n":
+            size += message.count("\n") * (len(os.linesep) - 1)
+        return size
+
+    def _close_stream(self) -> Path:
+        """Close the current file and return its path"""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        return Path(self.baseFilename)
+
+    def _finished(self, path: Path):
+        if self.compressor is not None:
+            self.compressor.submit(path)
+
+    def _rotate_day(self):
+        """Switch to the file of the new day"""
+        finished = self._close_stream()
+        self._day = datetime.now().date()
+        self._next_midnight = self._midnight_after(self._day)
+        self.baseFilename = str(self._day_file(self._day))
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        if Path(self.baseFilename) != finished:  # Clock may have been set back
+            self._finished(finished)
+
+    def _rotate_size(self):
+        """Move the full file aside as YYYY-MM-DD.N.log and start a new one"""
+        current = self._close_stream()
+        index = 1
+        while True:
+            rotated = current.with_name(f"{current.stem}.{index}.log")
+            if not rotated.exists() and not rotated.with_name(rotated.name + ".gz").exists():
+                break
+            index += 1
+        os.replace(current, rotated)
+        self._size = 0
+        self._finished(rotated)
+
+class BatchingQueueListener:
+    """Writer thread that drains the log queue in batches"""
+
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler],
+                 queue_handler: Optional[DroppingQueueHandler] = None):
+        """
+        Args:
+            log_queue: Queue filled by the queue handler
+            handlers: Handlers records are written to
+            queue_handler: Handler whose dropped records are reported
+        """
+        self.queue = log_queue
+        self.handlers = handlers
+        self.queue_handler = queue_handler
+        self._reported_drops = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = object()
+
+    def start(self):
+        """Start the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            flushed = []
+            for item in batch:
+                if item is self._stop:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    self._handle(item)
+            self._report_drops()
+            for handler in self.handlers:
+                try:
+                    getattr(handler, "flush_batch", handler.flush)()
+                except Exception:
+                    pass  # Nowhere left to report a failing log stream
+            for event in flushed:
+                event.set()
+            if stop:
+                return
+
+    def _handle(self, record: logging.LogRecord):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _report_drops(self):
+        """Log how many records the drop policy discarded since the last report"""
+        if self.queue_handler is None:
+            return
+        dropped = self.queue_handler.dropped
+        if dropped > self._reported_drops:
+            record = logging.LogRecord(
+                "Tranfastic.Logging", logging.WARNING, __file__, 0,
+                f"Dropped {dropped - self._reported_drops} log records (log queue full)", None, None
+            )
+            self._reported_drops = dropped
+            self._handle(record)
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until records queued so far are written
+
+        Returns:
+            True if the writer caught up within timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return False
+        event = threading.Event()
+        try:
+            self.queue.put(event, timeout=timeout)
+        except queue.Full:
+            return False
+        return event.wait(timeout)
+
+    def stop(self, timeout: float = 2.0):
+        """Write remaining records and stop the writer thread"""
+        if self._thread is None:
+            return
+        try:
+            self.queue.put(self._stop, timeout=timeout)
+            self._thread.join(timeout)
+        except queue.Full:
+            pass
+        self._thread = None
+
+# Global log writer and compressor, started by setup_logging
+_listener: Optional[BatchingQueueListener] = None
+_compressor: Optional[LogCompressor] = None
+
+def flush_logging(timeout: float = 2.0) -> bool:
+    """Wait until queued log records are written (True if they were)"""
+    return _listener.flush(timeout) if _listener else True
+
+def shutdown_logging(timeout: float = 2.0):
+    """Write queued log records, stop the log writer thread and detach it from the root logger"""
+    global _listener, _compressor
+    if _listener:
+        if _listener.queue_handler is not None:
+            # Records must not pile up in a queue nobody drains any more
+            logging.getLogger().removeHandler(_listener.queue_handler)
+        _listener.stop(timeout)
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _compressor:
+        _compressor.stop()
+        _compressor = None
+
+atexit.register(shutdown_logging)
+
+def setup_logging(log_level: str = "INFO", console: bool = True,
+                  retention_days: int = LOG_RETENTION_DAYS) -> logging.Logger:
     """
     Setup application logging
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        console: Also log to stdout (off for the command line mode, whose stdout is its output)
+        retention_days: Days log files are kept (enforced in the background)
         
     Returns:
         Configured logger instance
     """
+    global _listener, _compressor
+    
     # Create logs directory
     log_dir = Path.home() / ".tranfastic" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create log filename with date
-    today = datetime.now().strftime("%Y-%m-%d")
-    log_file = log_dir / f"{today}.log"
-    
-    # Configure logging
+    # Configure logging: callers only enqueue, the writer thread does the I/O
+    shutdown_logging()
+    _compressor = LogCompressor(log_dir, retention_days)
+    file_handler = RotatingLogHandler(log_dir, compressor=_compressor)
+    log_file = Path(file_handler.baseFilename)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers: List[logging.Handler] = [file_handler]
+    if console:
+        handlers.append(BatchStreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = BatchingQueueListener(log_queue, handlers, queue_handler)
+    _listener.start()
+    _compressor.start(log_file)
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler],
+        force=True  # Replace the handlers of an earlier setup_logging call
     )
     
     # Get logger
@@ -100,21 +446,24 @@ def log_error(error: Exception, context: str = ""):
     import traceback
     logger.debug(f"Traceback: {traceback.format_exc()}")
 
-def cleanup_old_logs(days_to_keep: int = 7):
+def cleanup_old_logs(days_to_keep: int = LOG_RETENTION_DAYS, log_dir: Optional[Path] = None):
     """
-    Clean up old log files
+    Clean up old log files (plain and compressed)
+    
+    Called by the log compressor thread; blocking, keep it off the startup path.
     
     Args:
         days_to_keep: Number of days to keep log files
+        log_dir: Log directory, defaults to ~/.tranfastic/logs
     """
     try:
-        log_dir = Path.home() / ".tranfastic" / "logs"
+        log_dir = log_dir or Path.home() / ".tranfastic" / "logs"
         if not log_dir.exists():
             return
         
         cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
         
-        for log_file in log_dir.glob("*.log"):
+        for log_file in [*log_dir.glob("*.log"), *log_dir.glob("*.log.gz")]:
             if log_file.stat().st_mtime < cutoff_date:
                 log_file.unlink()
                 get_logger("Cleanup").info(f"Deleted old log file: {log_file}")
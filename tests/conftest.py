@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the Tranfastic test suite
+
+Tests never touch the real ~/.tranfastic: HOME points at a throwaway
+directory before any application module is imported.
+"""
+
+import os
+import tempfile
+
+_home = tempfile.TemporaryDirectory(prefix="tranfastic-tests-")  # Removed when the session ends
+os.environ["HOME"] = os.environ["USERPROFILE"] = _home.name
+
+import pytest
+
+from src.core.backends import LocalBackend, StandInServer
+from src.core.event_loop import event_loop
+from src.core.glossary import Glossary
+from src.core.translation_cache import PersistentTranslationCache
+from src.core.translator import TranslationEngine
+
+@pytest.fixture
+def server():
+    """Local stand-in translation server"""
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """Build engines with a private glossary and persistent cache, shut down after the test"""
+    engines = []
+
+    def make(backend=None, server=None, **cache_options):
+        engine = TranslationEngine(backend=backend or LocalBackend(server.url))
+        engine.glossary = Glossary(tmp_path / f"glossary{len(engines)}.json")
+        engine.disk_cache = PersistentTranslationCache(tmp_path / f"cache{len(engines)}.db", **cache_options)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.shutdown()
+    event_loop.stop()
@@ -0,0 +1,40 @@
+"""Tests for configuration batches"""
+
+import json
+
+import pytest
+
+from src.utils.config import Config
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Configuration in a private home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return Config()
+
+def saved(config: Config) -> dict:
+    return json.loads(config.config_file.read_text(encoding="utf-8"))
+
+def test_failed_batch_is_rolled_back_and_not_saved(config):
+    before = saved(config)
+    with pytest.raises(ValueError):
+        with config.batch():
+            config.set("hotkey", "ctrl+alt+t")
+            config.update({"theme": "light"})
+            config.config["backend_options"]["local"] = {"url": "http://127.0.0.1:8765"}
+            raise ValueError("invalid setting")
+
+    assert config.config == before
+    assert config._save_timer is None
+    config.flush()
+    assert saved(config) == before
+
+def test_nested_batch_is_saved_when_outer_batch_ends(config):
+    with config.batch():
+        with config.batch():
+            config.set("theme", "light")
+        assert config._save_timer is None
+        config.set("hotkey", "ctrl+alt+t")
+    config.flush()
+    assert saved(config)["theme"] == "light"
+    assert saved(config)["hotkey"] == "ctrl+alt+t"
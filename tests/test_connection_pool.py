@@ -0,0 +1,56 @@
+"""Tests for the asyncio keep-alive connection pool of the local backend"""
+
+import asyncio
+
+import pytest
+
+from src.core.backends import BackendError
+from src.core.backends.local import AsyncConnectionPool
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+
+async def start_server(handle_request):
+    """Serve one request per connection with handle_request(reader, writer)"""
+    server = await asyncio.start_server(handle_request, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+async def read_request(reader):
+    await reader.readuntil(b"\r\n\r\n")
+
+def test_stale_idle_connections_are_replaced():
+    async def answer_then_drop(reader, writer):
+        # Answers as keep-alive, then drops the connection like an idle timeout would
+        await read_request(reader)
+        writer.write(RESPONSE)
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        writer.close()
+
+    async def scenario():
+        server, port = await start_server(answer_then_drop)
+        pool = AsyncConnectionPool("127.0.0.1", port)
+        first = await asyncio.gather(*(pool.request("POST", "/", b"", {}, 5.0) for _ in range(2)))
+        await asyncio.sleep(0.2)  # Both idle connections are now closed by the server
+        result = await pool.request("POST", "/", b"", {}, 5.0)
+        server.close()
+        return first, result
+
+    first, result = asyncio.run(scenario())
+    assert first == [(200, b"ok"), (200, b"ok")]
+    assert result == (200, b"ok")
+
+def test_failure_on_fresh_connection_raises_backend_error():
+    async def drop(reader, writer):
+        await read_request(reader)
+        writer.close()
+
+    async def scenario():
+        server, port = await start_server(drop)
+        pool = AsyncConnectionPool("127.0.0.1", port)
+        try:
+            await pool.request("POST", "/", b"", {}, 5.0)
+        finally:
+            server.close()
+
+    with pytest.raises(BackendError):
+        asyncio.run(scenario())
@@ -0,0 +1,49 @@
+"""Tests for the hedged multi-backend dispatcher"""
+
+import pytest
+
+from src.core.backends import (
+    BackendError, BackendUnavailableError, CircuitBreaker, GuardedBackend, HedgedDispatcher, LocalBackend
+)
+from src.core.event_loop import event_loop
+
+def open_circuit_backend(url: str) -> GuardedBackend:
+    """Guarded backend whose circuit is already open"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    return GuardedBackend(LocalBackend(url), breaker=breaker)
+
+def test_all_circuits_open_raises_unavailable(server):
+    dispatcher = HedgedDispatcher([open_circuit_backend(server.url), open_circuit_backend(server.url)])
+    with pytest.raises(BackendUnavailableError):
+        event_loop.run(dispatcher.translate_async("hello", "en", "tr"))
+    with pytest.raises(BackendUnavailableError):
+        event_loop.run(dispatcher.translate_batch_async(["hello", "world"], "en", "tr"))
+    assert server.requests_served == 0
+
+def test_real_failure_is_not_reported_as_unavailable(server):
+    dead = GuardedBackend(LocalBackend("http://127.0.0.1:9", timeout=1.0))
+    dispatcher = HedgedDispatcher([open_circuit_backend(server.url), dead])
+    with pytest.raises(BackendError) as raised:
+        event_loop.run(dispatcher.translate_async("hello", "en", "tr"))
+    assert not isinstance(raised.value, BackendUnavailableError)
+
+def test_breaker_open_serves_stale_cache_with_two_backends(server, make_engine):
+    dispatcher = HedgedDispatcher([open_circuit_backend(server.url), open_circuit_backend(server.url)])
+    engine = make_engine(backend=dispatcher, ttl_days=0)
+    engine.disk_cache.put(engine._cache_key("hello", "en", "tr"), ("merhaba", "en"))
+
+    assert engine.translate("hello", "en", "tr") == ("merhaba", "en", True)
+    assert engine.translate_many(["hello"], "en", "tr") == [("merhaba", "en", True)]
+    assert server.requests_served == 0
+
+def test_compaction_keeps_expired_entries_for_stale_fallback(server, make_engine):
+    dispatcher = HedgedDispatcher([open_circuit_backend(server.url), open_circuit_backend(server.url)])
+    engine = make_engine(backend=dispatcher, ttl_days=0)
+    engine.disk_cache.put(engine._cache_key("hello", "en", "tr"), ("merhaba", "en"))
+
+    assert engine.disk_cache.compact() == 0
+    assert engine.translate("hello", "en", "tr") == ("merhaba", "en", True)
+
+    engine.disk_cache.configure(stale_days=0)
+    assert engine.disk_cache.compact() == 1
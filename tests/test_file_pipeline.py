@@ -0,0 +1,67 @@
+"""Tests for the resumable file translation pipeline"""
+
+import pytest
+
+from src.core import file_pipeline
+from src.core.backends import BackendError, LocalBackend
+from src.core.file_pipeline import FileTranslationError, FileTranslationJob
+
+class SwitchableBackend(LocalBackend):
+    """Stand-in backend that can be taken down, and that rejects texts containing REJECT while up"""
+
+    def __init__(self, url: str, fail_after: int = -1):
+        super().__init__(url)
+        self.fail_after = fail_after  # Calls answered before going down, -1 to stay up
+        self.calls = 0
+
+    def _check(self, texts):
+        self.calls += 1
+        if 0 <= self.fail_after < self.calls:
+            raise BackendError("connection refused")
+        if any("REJECT" in text for text in texts):
+            raise BackendError("text rejected")
+
+    async def translate_async(self, text, source_lang="auto", target_lang="en"):
+        self._check([text])
+        return await super().translate_async(text, source_lang, target_lang)
+
+    async def translate_batch_async(self, texts, source_lang="auto", target_lang="en"):
+        self._check(texts)
+        return await super().translate_batch_async(texts, source_lang, target_lang)
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(file_pipeline, "RETRY_DELAY", 0)
+
+def test_interrupted_job_resumes_without_untranslated_lines(server, make_engine, tmp_path):
+    input_path, output_path = tmp_path / "in.txt", tmp_path / "out.txt"
+    lines = [f"Line number {number} of the input file." for number in range(200)]
+    input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    backend = SwitchableBackend(server.url, fail_after=10)
+    backend.max_batch_size = 4  # Several calls per chunk, so the backend goes down mid-chunk
+    engine = make_engine(backend=backend)
+    with pytest.raises(FileTranslationError):
+        FileTranslationJob(input_path, output_path, "en", "tr", concurrency=1, chunk_bytes=1024, engine=engine).run()
+    written = output_path.read_text(encoding="utf-8").splitlines()
+    assert 0 < len(written) < len(lines)
+    assert all(line.startswith("[tr] ") for line in written)
+
+    backend.fail_after = -1
+    job = FileTranslationJob(input_path, output_path, "en", "tr", concurrency=1, chunk_bytes=1024, engine=engine)
+    stats = job.run()
+    assert stats["resumed_at"] > 0
+    assert stats["failed"] == 0
+    assert output_path.read_text(encoding="utf-8").splitlines() == [f"[tr] {line}" for line in lines]
+    assert not job.checkpoint_path.exists()
+
+def test_line_rejected_by_reachable_backend_is_written_untranslated(server, make_engine, tmp_path):
+    input_path, output_path = tmp_path / "in.txt", tmp_path / "out.txt"
+    input_path.write_text("First line.\nREJECT this line.\nLast line.\n", encoding="utf-8")
+    backend = SwitchableBackend(server.url)
+    backend.max_batch_size = 1
+    engine = make_engine(backend=backend)
+
+    stats = FileTranslationJob(input_path, output_path, "en", "tr", engine=engine).run()
+    assert stats["failed"] == 1
+    assert output_path.read_text(encoding="utf-8") == "[tr] First line.\nREJECT this line.\n[tr] Last line.\n"
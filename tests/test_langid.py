@@ -0,0 +1,55 @@
+"""Tests for the offline language identifier"""
+
+import pytest
+
+from src.core.langid import MAX_SCORED_CHARS, SCRIPT_ONLY_CONFIDENCE, LanguageIdentifier
+
+@pytest.fixture
+def identifier():
+    return LanguageIdentifier()
+
+@pytest.mark.parametrize("text", [
+    "我今天很高兴见到你",  # Chinese
+    "امروز هوا خیلی خوب است",  # Persian
+    "आज मौसम बहुत अच्छा है",  # Hindi script, shared with Marathi and Nepali
+])
+def test_shared_script_is_never_confident(identifier, text):
+    _, confidence = identifier.detect(text)
+    assert confidence <= SCRIPT_ONLY_CONFIDENCE
+
+@pytest.mark.parametrize("text, lang", [
+    ("Большое спасибо за помощь, увидимся завтра", "ru"),
+    ("Щиро дякую за допомогу, побачимося завтра", "uk"),
+    ("Днес времето е много хубаво и слънчево", "bg"),
+])
+def test_cyrillic_languages(identifier, text, lang):
+    detected, confidence = identifier.detect(text)
+    assert detected == lang
+    assert confidence > SCRIPT_ONLY_CONFIDENCE
+
+@pytest.mark.parametrize("text", [
+    "Xin chào, hôm nay bạn thế nào?",  # Vietnamese
+    "Sabahınız xeyir, bu gün necəsən?",  # Azerbaijani, close to Turkish
+])
+def test_language_without_profile_is_not_classified(identifier, text):
+    assert identifier.detect(text) == (None, 0.0)
+
+def test_kana_identifies_japanese(identifier):
+    assert identifier.detect("今日はとても暑いですね") == ("ja", 1.0)
+
+@pytest.mark.parametrize("text, lang", [
+    ("Open a Pull Request", "en"),
+    ("Please review the attached document", "en"),
+    ("Wie geht es dir heute?", "de"),
+    ("¿Dónde está el baño?", "es"),
+])
+def test_latin_languages(identifier, text, lang):
+    assert identifier.detect(text)[0] == lang
+
+def test_detect_cached_keys_on_scored_prefix(identifier):
+    prefix = "This is a long English sentence that keeps going. " * 10
+    assert len(prefix) > MAX_SCORED_CHARS
+    first = identifier.detect_cached(prefix + "One ending.")
+    second = identifier.detect_cached(prefix + "Another, different ending.")
+    assert first == second == identifier.detect(prefix)
+    assert identifier._detect_sample_cached.cache_info().currsize == 1
@@ -0,0 +1,42 @@
+"""Tests for the queued, rotating application logging"""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.utils.logger import (
+    DroppingQueueHandler, RotatingLogHandler, flush_logging, setup_logging, shutdown_logging
+)
+
+@pytest.fixture
+def log_dir():
+    yield Path.home() / ".tranfastic" / "logs"
+    shutdown_logging()
+
+def test_second_setup_replaces_queue_handler(log_dir):
+    setup_logging("INFO", console=False)
+    setup_logging("INFO", console=False)
+    queue_handlers = [handler for handler in logging.getLogger().handlers if isinstance(handler, DroppingQueueHandler)]
+    assert len(queue_handlers) == 1
+
+    logging.getLogger("tests").info("written after the second setup")
+    assert flush_logging()
+    assert any("written after the second setup" in path.read_text(encoding="utf-8") for path in log_dir.glob("*.log"))
+
+def test_shutdown_detaches_queue_handler(log_dir):
+    setup_logging("INFO", console=False)
+    shutdown_logging()
+    assert not any(isinstance(handler, DroppingQueueHandler) for handler in logging.getLogger().handlers)
+
+def test_size_rotation_counts_bytes(tmp_path):
+    handler = RotatingLogHandler(tmp_path, max_bytes=200)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        for number in range(20):
+            handler.emit(logging.makeLogRecord({"msg": f"{number:02d} çeviri önbelleği ısındı 翻訳"}))
+    finally:
+        handler.close()
+    files = list(tmp_path.glob("*.log"))
+    assert len(files) > 1
+    assert all(path.stat().st_size <= 200 for path in files)
@@ -0,0 +1,61 @@
+"""Tests for subtitle translation through the resumable file pipeline"""
+
+import pytest
+
+from src.core import file_pipeline
+from src.core.file_pipeline import FileTranslationError
+from src.core.subtitles import SubtitleTranslationJob, translate_subtitle_file
+
+from test_file_pipeline import SwitchableBackend
+
+def make_srt(count: int) -> str:
+    blocks = []
+    for number in range(1, count + 1):
+        seconds = number * 3
+        blocks.append(
+            f"{number}\r\n00:{seconds // 60:02}:{seconds % 60:02},000 --> 00:{seconds // 60:02}:{seconds % 60:02},900\r\n"
+            f"Cue number {number} is\r\nsplit over two lines.\r\n"
+        )
+    return "\ufeff" + "\r\n".join(blocks)
+
+def expected_srt(count: int) -> str:
+    blocks = []
+    for number in range(1, count + 1):
+        seconds = number * 3
+        # The stand-in server prefixes the joined cue text, which is re-wrapped over two lines
+        blocks.append(
+            f"{number}\r\n00:{seconds // 60:02}:{seconds % 60:02},000 --> 00:{seconds // 60:02}:{seconds % 60:02},900\r\n"
+            f"[tr] Cue number {number} is\r\nsplit over two lines.\r\n"
+        )
+    return "\ufeff" + "\r\n".join(blocks)
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(file_pipeline, "RETRY_DELAY", 0)
+
+def test_cues_stay_whole_across_chunks(server, make_engine, tmp_path):
+    input_path, output_path = tmp_path / "in.srt", tmp_path / "out.srt"
+    input_path.write_bytes(make_srt(60).encode("utf-8"))
+
+    job = SubtitleTranslationJob(input_path, output_path, "en", "tr", chunk_bytes=100, engine=make_engine(server=server))
+    stats = job.run()
+    assert stats["lines"] == 60
+    assert stats["failed"] == 0
+    assert output_path.read_bytes().decode("utf-8") == expected_srt(60)
+
+def test_interrupted_subtitle_job_resumes(server, make_engine, tmp_path):
+    input_path, output_path = tmp_path / "in.srt", tmp_path / "out.srt"
+    input_path.write_bytes(make_srt(100).encode("utf-8"))
+    backend = SwitchableBackend(server.url, fail_after=10)
+    backend.max_batch_size = 4
+    engine = make_engine(backend=backend)
+
+    with pytest.raises(FileTranslationError):
+        SubtitleTranslationJob(input_path, output_path, "en", "tr", concurrency=1, chunk_bytes=512, engine=engine).run()
+    written = output_path.read_bytes().decode("utf-8")
+    assert written and expected_srt(100).startswith(written)
+
+    backend.fail_after = -1
+    stats = translate_subtitle_file(input_path, output_path, "en", "tr", engine=engine)
+    assert stats["resumed_at"] > 0
+    assert output_path.read_bytes().decode("utf-8") == expected_srt(100)
@@ -0,0 +1,121 @@
+"""Tests for TranslationEngine"""
+
+import pytest
+
+from src.core.backends import GuardedBackend, LocalBackend, TokenBucket
+from src.core.translation_cache import make_cache_key
+
+def throttled_backend(url: str, burst: int = 1) -> GuardedBackend:
+    """Guarded backend whose token bucket allows burst calls and then (practically) none"""
+    return GuardedBackend(LocalBackend(url), limiter=TokenBucket(0.001, burst), max_wait=0)
+
+def test_rate_limit_rejection_keeps_connection_status(server, make_engine):
+    engine = make_engine(backend=throttled_backend(server.url))
+    changes = []
+    engine.add_connection_listener(changes.append)
+
+    assert engine.translate("hello", "en", "tr")[2]
+    assert engine.is_connected
+    assert engine.translate("world", "en", "tr") == ("", None, False)
+    assert engine.translate_many(["again", "more"], "en", "tr") == [("", None, False), ("", None, False)]
+    assert engine.is_connected
+    assert changes == [True]
+
+def test_unreachable_backend_sets_disconnected(make_engine):
+    engine = make_engine(backend=LocalBackend("http://127.0.0.1:9", timeout=1.0))
+    assert engine.translate("hello", "en", "tr") == ("", None, False)
+    assert engine.connection_checked and not engine.is_connected
+
+def unbatched_backend(url: str, rate: float = 5, burst: int = 10, max_wait: float = 0.25) -> GuardedBackend:
+    """Guarded backend taking one text per call, like Google, with the default rate limit"""
+    backend = GuardedBackend(LocalBackend(url), limiter=TokenBucket(rate, burst), max_wait=max_wait)
+    backend.max_batch_size = 1
+    return backend
+
+def test_long_paste_on_unbatched_backend_is_not_rate_limited(server, make_engine):
+    engine = make_engine(backend=unbatched_backend(server.url))
+    text = " ".join(f"This is sentence number {number} of a long pasted text." for number in range(20))
+
+    translated, _, success = engine.translate(text, "en", "tr")
+    assert success
+    assert translated.count("sentence number") == 20
+    assert server.requests_served <= 2
+
+def test_edited_sentence_is_sent_alone_on_unbatched_backend(server, make_engine):
+    engine = make_engine(backend=unbatched_backend(server.url))
+    sentences = [f"Sentence {word} is here." for word in ("one", "two", "three", "four", "five", "six")]
+
+    assert engine.submit_translation(" ".join(sentences), "en", "tr", segmented=True).result()[2]
+    assert server.requests_served == 1
+    assert all(engine.cache.get(make_cache_key(sentence, "en", "tr")) for sentence in sentences)
+
+    sentences[2] = "Sentence three was edited."
+    translated, _, success = engine.submit_translation(" ".join(sentences), "en", "tr", segmented=True).result()
+    assert success
+    assert server.requests_served == 2
+    assert "[tr] Sentence three was edited." in translated  # Translated on its own
+
+class ReflowingBackend(LocalBackend):
+    """Backend taking one text per call that joins the lines of its input"""
+
+    max_batch_size = 1
+
+    async def translate_async(self, text, source_lang="auto", target_lang="en"):
+        return await super().translate_async(text.replace("\n", " "), source_lang, target_lang)
+
+def test_reflowed_lines_fall_back_to_merged_text(server, make_engine):
+    engine = make_engine(backend=ReflowingBackend(server.url))
+    text = "First sentence here. Second one follows. Third is next. Fourth ends it."
+
+    translated, _, success = engine.submit_translation(text, "en", "tr", segmented=True).result()
+    assert (translated, success) == (f"[tr] {text}", True)
+    assert server.requests_served == 2
+
+@pytest.mark.parametrize("text, target_lang", [
+    ("我今天很高兴见到你", "ja"),  # Chinese, shares Han with Japanese
+    ("امروز هوا خیلی خوب است", "ar"),  # Persian, shares the Arabic script
+    ("Днес времето е много хубаво и слънчево", "ru"),  # Bulgarian, shares Cyrillic with Russian
+])
+def test_shared_script_text_is_translated(server, make_engine, text, target_lang):
+    engine = make_engine(server=server)
+    engine.same_language_min_confidence = 0.1  # Even a lax threshold must not trust the script alone
+
+    translated, _, success = engine.translate(text, "auto", target_lang)
+    assert success
+    assert translated != text
+    assert server.requests_served == 1
+    assert engine.round_trips_saved == 0
+
+@pytest.mark.parametrize("text, target_lang", [
+    ("Goddag, hvordan har du det i dag? Jeg har det godt.", "sv"),  # Danish
+    ("Hei, hvordan har du det i dag? Jeg har det bra.", "sv"),  # Norwegian
+    ("Hyvää päivää, mitä kuuluu tänään? Minulle kuuluu hyvää.", "sv"),  # Finnish
+    ("Selamat pagi, apa kabar hari ini? Saya baik-baik saja.", "tr"),  # Indonesian
+    ("Xin chào, hôm nay bạn thế nào?", "en"),  # Vietnamese, has no profile
+])
+def test_latin_text_in_other_language_is_translated(server, make_engine, text, target_lang):
+    engine = make_engine(server=server)
+    engine.same_language_min_confidence = 0.1
+
+    translated, _, success = engine.translate(text, "auto", target_lang)
+    assert success
+    assert translated != text
+    assert server.requests_served == 1
+    assert engine.round_trips_saved == 0
+
+def test_text_in_target_language_is_returned_unchanged(server, make_engine):
+    engine = make_engine(server=server)
+    text = "Could you please send me the latest version of the report?"
+    assert engine.translate(text, "auto", "en") == (text, "en", True)
+    assert server.requests_served == 0
+
+def test_cache_keeps_line_layout_apart(server, make_engine):
+    engine = make_engine(server=server)
+    layouts = ["Line one\nLine two", "Line one Line two", "Line   one\n\n\nLine two"]
+    for text in layouts:
+        assert engine.translate(text, "en", "tr") == (f"[tr] {text}", "en", True)
+    assert server.requests_served == 3
+
+    # Only spacing within a line and around the text is ignored
+    assert engine.translate("  Line one \r\nLine  two ", "en", "tr")[0] == "[tr] Line one\nLine two"
+    assert server.requests_served == 3